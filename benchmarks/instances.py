@@ -0,0 +1,118 @@
+# 🧪 Benchmark Problem Örnekleri
+
+"""
+ACO benchmark'ları için tekrarlanabilir TSP örnekleri.
+
+- campus: SDÜ kampüsü 10 durak (Haversine)
+- circle: Çember üzerinde n nokta; optimum tur bilinir (düzgün çokgen çevresi)
+- uniform: Kare içinde rastgele n nokta (optimum bilinmez)
+- TSPLIB: EUC_2D, CEIL_2D ve ATT koordinatlı `.tsp` dosyaları
+"""
+
+import numpy as np
+
+from core.haversine import calculate_distance_matrix
+from data.coordinates import CAMPUS_STOPS
+
+
+def _euclidean_matrix(points):
+    """Noktalar arası Öklid mesafe matrisi."""
+    diff = points[:, None, :] - points[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=2))
+
+
+def campus_instance():
+    """
+    Kampüs ring seferi örneği.
+    
+    Returns:
+        dict: name, distance_matrix, optimum (bilinmiyor: None)
+    """
+    matrix, _, _ = calculate_distance_matrix(CAMPUS_STOPS)
+    return {'name': 'campus', 'distance_matrix': matrix, 'optimum': None}
+
+
+def circle_instance(n, radius=1000.0, seed=0):
+    """
+    Çember üzerinde eşit aralıklı n nokta (rastgele sıralı).
+    
+    Optimum tur, noktaları çember sırasıyla dolaşır:
+        L* = n × 2R × sin(π / n)
+    
+    Returns:
+        dict: name, distance_matrix, optimum
+    """
+    rng = np.random.default_rng(seed)
+    angles = rng.permutation(n) * (2 * np.pi / n)
+    points = radius * np.column_stack((np.cos(angles), np.sin(angles)))
+    return {
+        'name': f'circle{n}',
+        'distance_matrix': _euclidean_matrix(points),
+        'optimum': float(n * 2 * radius * np.sin(np.pi / n)),
+    }
+
+
+def uniform_instance(n, size=10000.0, seed=0):
+    """
+    Kare içinde düzgün dağılımlı n rastgele nokta.
+    
+    Returns:
+        dict: name, distance_matrix, optimum (None)
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2)) * size
+    return {'name': f'uniform{n}', 'distance_matrix': _euclidean_matrix(points),
+            'optimum': None}
+
+
+def load_tsplib(path, optimum=None):
+    """
+    TSPLIB `.tsp` dosyasını oku (EUC_2D, CEIL_2D, ATT).
+    
+    Args:
+        path (str): Dosya yolu
+        optimum (float): Bilinen optimum tur uzunluğu (optional)
+    
+    Returns:
+        dict: name, distance_matrix, optimum
+    """
+    name = path
+    edge_type = 'EUC_2D'
+    points = []
+    in_coords = False
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line == 'EOF':
+                continue
+            if in_coords:
+                parts = line.split()
+                if len(parts) < 3:
+                    break
+                points.append((float(parts[1]), float(parts[2])))
+                continue
+            if line.startswith('NODE_COORD_SECTION'):
+                in_coords = True
+            elif ':' in line:
+                key, value = (part.strip() for part in line.split(':', 1))
+                if key == 'NAME':
+                    name = value
+                elif key == 'EDGE_WEIGHT_TYPE':
+                    edge_type = value
+    
+    points = np.array(points)
+    if edge_type == 'ATT':
+        diff = points[:, None, :] - points[None, :, :]
+        rij = np.sqrt((diff ** 2).sum(axis=2) / 10.0)
+        tij = np.floor(rij + 0.5)
+        matrix = np.where(tij < rij, tij + 1, tij)
+    elif edge_type == 'CEIL_2D':
+        matrix = np.ceil(_euclidean_matrix(points))
+    elif edge_type == 'EUC_2D':
+        # TSPLIB nint(x) = int(x + 0.5); np.rint yarımları çifte yuvarlar
+        matrix = np.floor(_euclidean_matrix(points) + 0.5)
+    else:
+        raise ValueError(f"Desteklenmeyen EDGE_WEIGHT_TYPE: {edge_type}")
+    
+    return {'name': name, 'distance_matrix': matrix, 'optimum': optimum}
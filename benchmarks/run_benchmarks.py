@@ -0,0 +1,210 @@
+# ⏱️ ACO Benchmark Çalıştırıcı
+
+"""
+AntColonyOptimizer için tekrarlanabilir benchmark paketi.
+
+Her çalıştırma için kaydedilenler:
+    - Kurulum ve çözüm süresi (saniye), iterasyon/saniye
+    - Tepe bellek kullanımı (tracemalloc, MB). tracemalloc çözümü birkaç kat
+      yavaşlattığı için süreler izlenmeyen bir çalıştırmadan, bellek aynı
+      tohumla ayrı bir ikinci çalıştırmadan ölçülür.
+    - En iyi tur uzunluğu ve (biliniyorsa) optimuma göre fark (%)
+
+Sonuçlar JSON olarak yazılır; sürümler arasında gerileme takibi için
+dosyalar karşılaştırılabilir.
+
+Kullanım:
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --sizes 50 200 --seeds 0 1 2
+    python -m benchmarks.run_benchmarks --tsplib data/berlin52.tsp:7542
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.instances import (campus_instance, circle_instance,
+                                  load_tsplib, uniform_instance)
+from core import kernels
+from core.ant_algorithm import AntColonyOptimizer
+
+
+DEFAULT_SIZES = (50, 200, 1000, 5000)
+DEFAULT_SEEDS = (0, 1, 2)
+
+
+def default_config(n):
+    """
+    Örnek boyutuna göre ACO ayarları (büyük örneklerde aday listeleri).
+    
+    Args:
+        n (int): Düğüm sayısı
+    
+    Returns:
+        dict: AntColonyOptimizer parametreleri
+    """
+    config = {
+        'n_ants': 30,
+        'n_iterations': 100,
+        'alpha': 1.0,
+        'beta': 2.0,
+        'evaporation': 0.3,
+        'construction': 'vectorized',
+        'symmetric_deposit': True,
+    }
+    if n > 100:
+        config['n_candidates'] = 20
+    if n >= 1000:
+        config.update(n_ants=20, n_iterations=20)
+    if n >= 5000:
+        config.update(n_ants=10, n_iterations=5)
+    return config
+
+
+def _peak_memory(matrix, seed, config):
+    """
+    Aynı çalıştırmayı tracemalloc altında tekrarla ve tepe belleği ölç.
+    
+    Returns:
+        int: Tepe bellek (byte)
+    """
+    tracemalloc.start()
+    try:
+        optimizer = AntColonyOptimizer(matrix, seed=seed, **config)
+        optimizer.solve(start_node=0)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_instance(instance, seed, overrides=None, measure_memory=True):
+    """
+    Tek bir örneği verilen tohumla çöz ve ölçümleri döndür.
+    
+    Args:
+        instance (dict): name, distance_matrix, optimum
+        seed (int): Rastgele sayı tohumu
+        overrides (dict): default_config üzerine yazılacak parametreler
+        measure_memory (bool): Tepe belleği ayrı bir tracemalloc
+            çalıştırmasıyla ölç (süre ölçümünü etkilemez)
+    
+    Returns:
+        dict: Ölçüm kaydı (measure_memory=False ise peak_memory_mb None)
+    """
+    matrix = instance['distance_matrix']
+    n = len(matrix)
+    config = default_config(n)
+    config.update(overrides or {})
+    
+    started = time.perf_counter()
+    optimizer = AntColonyOptimizer(matrix, seed=seed, **config)
+    setup_time = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    _, best_distance, _, _ = optimizer.solve(start_node=0)
+    solve_time = time.perf_counter() - started
+    
+    peak = _peak_memory(matrix, seed, config) if measure_memory else None
+    
+    optimum = instance['optimum']
+    gap = None
+    if optimum:
+        gap = 100.0 * (best_distance - optimum) / optimum
+    
+    return {
+        'instance': instance['name'],
+        'n': n,
+        'seed': seed,
+        'config': config,
+        'setup_time_s': setup_time,
+        'solve_time_s': solve_time,
+        'iterations': optimizer.iterations_run,
+        'iterations_per_s': optimizer.iterations_run / solve_time if solve_time > 0 else None,
+        'peak_memory_mb': None if peak is None else peak / 1024 ** 2,
+        'best_distance': float(best_distance),
+        'optimum': optimum,
+        'gap_percent': gap,
+    }
+
+
+def build_instances(names, sizes, tsplib_specs):
+    """
+    Komut satırı seçeneklerinden örnek listesini oluştur.
+    
+    Args:
+        names (list): 'campus', 'circle', 'uniform'
+        sizes (list): Sentetik örnek boyutları
+        tsplib_specs (list): 'dosya.tsp' veya 'dosya.tsp:optimum'
+    
+    Returns:
+        list: Örnek sözlükleri
+    """
+    instances = []
+    if 'campus' in names:
+        instances.append(campus_instance())
+    for n in sizes:
+        if 'circle' in names:
+            instances.append(circle_instance(n))
+        if 'uniform' in names:
+            instances.append(uniform_instance(n))
+    for spec in tsplib_specs:
+        path, _, optimum = spec.partition(':')
+        instances.append(load_tsplib(path, float(optimum) if optimum else None))
+    return instances
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ACO benchmark paketi")
+    parser.add_argument('--instances', nargs='+', default=['campus', 'circle', 'uniform'],
+                        choices=['campus', 'circle', 'uniform'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--seeds', nargs='+', type=int, default=list(DEFAULT_SEEDS))
+    parser.add_argument('--tsplib', nargs='*', default=[],
+                        help="TSPLIB dosyası, isteğe bağlı ':optimum' ile")
+    parser.add_argument('--backend', choices=['numpy', 'numba'], default='numpy')
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Tepe bellek için ikinci (tracemalloc) çalıştırmayı atla")
+    parser.add_argument('--output', default='bench_output.json')
+    args = parser.parse_args(argv)
+    
+    results = []
+    for instance in build_instances(args.instances, args.sizes, args.tsplib):
+        for seed in args.seeds:
+            record = run_instance(instance, seed, {'backend': args.backend},
+                                  measure_memory=not args.no_memory)
+            results.append(record)
+            gap = record['gap_percent']
+            memory = record['peak_memory_mb']
+            memory_text = f"{memory:8.1f}" if memory is not None else f"{'-':>8}"
+            print(f"{record['instance']:>14} seed={seed} "
+                  f"{record['solve_time_s']:8.2f}s "
+                  f"{record['iterations_per_s'] or 0:8.2f} it/s "
+                  f"{memory_text} MB "
+                  f"L={record['best_distance']:.1f}"
+                  + (f" gap={gap:.2f}%" if gap is not None else ""))
+    
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'numba_available': kernels.NUMBA_AVAILABLE,
+            'backend': args.backend,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Sonuçlar yazıldı: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,7 @@ ACO_RANGES = {
     "alpha": {"min": 0.5, "max": 5.0, "step": 0.1},
     "beta": {"min": 0.5, "max": 5.0, "step": 0.1},
     "evaporation": {"min": 0.1, "max": 0.9, "step": 0.05},
+    "stagnation_limit": {"min": 0, "max": 100, "step": 5},  # 0 = kapalı
 }
 
 # Proje Bilgileri
@@ -48,3 +49,17 @@ GOOGLE_MAPS_CONFIG = {
     "units": "metric",      # Metrik sistem (km)
     "timeout": 10,          # API timeout (saniye)
 }
+
+# Mesafe Matrisi Önbelleği (disk)
+DISTANCE_CACHE_CONFIG = {
+    "cache_dir": ".cache/distance_matrices",
+    "ttl": 7 * 24 * 3600,           # Kayıt ömrü (saniye) - 1 hafta
+    "max_entries": 32,              # En fazla kayıt sayısı (LRU)
+    "max_bytes": 512 * 1024 * 1024, # Toplam boyut sınırı (512 MB)
+}
+
+# Arka Planda Çözüm (Streamlit arayüzü)
+BACKGROUND_SOLVER_CONFIG = {
+    "min_interval": 0.1,    # Çözüm thread'inin ilerleme yayınlama aralığı (saniye)
+    "poll_interval": 0.2,   # Arayüzün ilerlemeyi yoklama aralığı (saniye)
+}
@@ -5,8 +5,125 @@ Travelling Salesman Problem (TSP) çözmek için ACO Algoritması.
 Ring seferi: Başlangıç noktasından başlayıp aynı noktaya dönüş.
 """
 
+import threading
+import time
+
 import numpy as np
-import streamlit as st
+
+from core import kernels
+from core.instrumentation import NULL_STATS, SolveStats, pheromone_summary
+from core.local_search import LOCAL_SEARCH_METHODS, improve_tour
+
+
+def _power(matrix, exponent):
+    """
+    Matrisin eleman bazlı üssünü al; tam sayı üsler için pow() kullanma.
+    
+    Args:
+        matrix (np.array): Taban matris
+        exponent (float): Üs
+    
+    Returns:
+        np.array: matrix ** exponent
+    """
+    if exponent == 1:
+        return matrix.copy()
+    if float(exponent).is_integer() and 0 < exponent <= 8:
+        # Kare alarak üs (square-and-multiply): sadece çarpma işlemleri
+        k = int(exponent)
+        result = None
+        base = matrix
+        while k:
+            if k & 1:
+                result = base.copy() if result is None else result * base
+            k >>= 1
+            if k:
+                base = base * base
+        return result
+    return matrix ** exponent
+
+
+def rotate_tour(path, start_node):
+    """
+    Kapalı ring rotasını verilen duraktan başlayacak şekilde döndür (O(n)).
+    
+    Args:
+        path (list): Ring rotası [s, ..., s]
+        start_node (int): Yeni başlangıç düğümü
+    
+    Returns:
+        list: [start_node, ..., start_node]
+    """
+    tour = [int(node) for node in path[:-1]]
+    k = tour.index(int(start_node))
+    tour = tour[k:] + tour[:k]
+    return tour + [tour[0]]
+
+
+def _cheapest_insertion(tour, nodes, distance_matrix):
+    """
+    Düğümleri kapalı tura en ucuz ekleme (cheapest insertion) ile yerleştir.
+    
+    Args:
+        tour (list): Başlangıç tekrar edilmeden tur
+        nodes (list): Eklenecek düğümler
+        distance_matrix (np.array): n×n mesafe matrisi
+    
+    Returns:
+        list: Genişletilmiş tur
+    """
+    tour = list(tour)
+    for node in nodes:
+        if not tour:
+            tour = [node]
+            continue
+        current = np.asarray(tour, dtype=np.intp)
+        following = np.roll(current, -1)
+        cost = (distance_matrix[current, node] + distance_matrix[node, following]
+                - distance_matrix[current, following])
+        tour.insert(int(np.argmin(cost)) + 1, node)
+    return tour
+
+
+def nearest_neighbour_length(distance_matrix, start=0):
+    """
+    En yakın komşu sezgiseli ile kurulan turun uzunluğu (MMAS / ACS
+    başlangıç feromon ölçeği, core.tuning hedef uzunluğu).
+    
+    Sadece sonlu kenarlar toplanır: yasaklı (np.inf) kenarlar içeren
+    matrislerde (örn. çok araçlı modelde depo ↔ depo kopyası) kalan düğümlere
+    sonsuz kenarla geçiş uzunluğa eklenmez.
+    
+    Args:
+        distance_matrix (np.array): n×n mesafe matrisi
+        start (int): Başlangıç düğümü
+    
+    Returns:
+        float: Tur uzunluğu
+    
+    Raises:
+        ValueError: Uzunluk sonlu ve pozitif değilse (feromon ölçeği kurulamaz)
+    """
+    n = len(distance_matrix)
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    current, length = start, 0.0
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, distance_matrix[current])
+        following = int(np.argmin(row))
+        if np.isfinite(row[following]):
+            length += float(row[following])
+        visited[following] = True
+        current = following
+    if np.isfinite(distance_matrix[current, start]):
+        length += float(distance_matrix[current, start])
+    if not np.isfinite(length) or length <= 0:
+        raise ValueError(f"En yakın komşu turu uzunluğu geçersiz: {length}")
+    return length
+
+
+STRATEGIES = ('as', 'mmas', 'acs')
+PHEROMONE_STORAGES = ('dense', 'sparse')
 
 
 class AntColonyOptimizer:
@@ -23,38 +140,205 @@ class AntColonyOptimizer:
         4. Buharlaşma: Eski feromonlar azalır
         5. Sonlandırma: Belirtilen iterasyon tamamlandığında
     
+    Stratejiler:
+        - 'as': Ant System, tüm karıncalar feromon bırakır
+        - 'mmas': Max-Min Ant System, sadece en iyi tur bırakır; feromon
+          [τ_min, τ_max] aralığında tutulur, durgunlukta yeniden başlatılır
+        - 'acs': Ant Colony System, q0 olasılıkla en iyi kenar seçilir
+          (sözde-rastgele orantılı kural), geçilen kenarlarda yerel
+          buharlaşma, sadece şimdiye kadarki en iyi tur güncellenir
+    
     Referans:
         Dorigo & Stützle (2004). Ant Colony Optimization
     """
     
     def __init__(self, distance_matrix, n_ants=30, n_iterations=100,
-                 alpha=1.0, beta=2.0, evaporation=0.3, pheromone_init=0.5):
+                 alpha=1.0, beta=2.0, evaporation=0.3, pheromone_init=0.5,
+                 construction='sequential', n_candidates=None,
+                 symmetric_deposit=False, backend='numpy',
+                 local_search=None, local_search_scope='best',
+                 stagnation_limit=None, target_distance=None, time_limit=None,
+                 branching_threshold=None, branching_lambda=0.05, seed=None,
+                 strategy='as', mmas_update='iteration', p_best=0.05,
+                 reinit_after=None, q0=0.9, local_evaporation=0.1,
+                 dtype='float64', pheromone_storage='dense'):
         """
         ACO Optimizer'ı başlat.
         
         Args:
-            distance_matrix (np.array): n×n mesafe matrisi
+            distance_matrix (np.array): n×n mesafe matrisi. np.memmap de kabul
+                edilir (örn. matrix_utils.open_distance_memmap veya
+                DistanceMatrixCache). Yoğun modda η^β ve τ^α × η^β zaten n×n
+                olduğundan eşleme dtype'a çevrilerek bellekte okunur (dosyanın
+                tipi dtype ile aynıysa kopyalanmaz). pheromone_storage='sparse'
+                ile eşleme olduğu gibi tutulur; satırlar gerektikçe diskten
+                okunur ve n×n boyutunda hiçbir dizi bellekte tutulmaz.
             n_ants (int): Karınca sayısı
             n_iterations (int): İterasyon sayısı
             alpha (float): Feromon ağırlığı (0.5-5.0)
             beta (float): Mesafe ağırlığı (0.5-5.0)
             evaporation (float): Feromon buharlaşma (0.1-0.9)
             pheromone_init (float): Başlangıç feromon
+            construction (str): Rota oluşturma modu
+                - 'sequential': Karıncalar tek tek yürür (varsayılan)
+                - 'vectorized': Tüm koloni NumPy ile eş zamanlı yürür
+            n_candidates (int): Aday listesi boyutu (k en yakın komşu, örn. 15-30).
+                None ise her adımda tüm ziyaret edilmemiş düğümler değerlendirilir.
+            symmetric_deposit (bool): Feromonu (i,j) ile birlikte (j,i) kenarına da
+                bırak (simetrik mesafe matrisleri için)
+            backend (str): Hesaplama motoru
+                - 'numpy': Saf NumPy/Python (varsayılan)
+                - 'numba': Derlenmiş çekirdekler (numba kurulu değilse sessizce
+                  'numpy' kullanılır). Aynı tohumla 'vectorized' mod ile aynı
+                  turları üretir.
+            local_search (str): Feromon güncellemesinden önce turlara uygulanacak
+                yerel arama: None, '2opt', 'oropt' veya '2opt+oropt'
+            local_search_scope (str): 'best' (iterasyonun en iyisi) veya 'all'
+            stagnation_limit (int): K iterasyon boyunca iyileşme olmazsa dur
+            target_distance (float): Bu uzunlukta veya daha kısa tur bulununca dur
+            time_limit (float): Saniye cinsinden süre bütçesi
+            branching_threshold (float): Ortalama λ-dallanma faktörü bu değerin
+                altına düşünce (feromon yakınsadı) dur
+            branching_lambda (float): Dallanma faktörü için λ (0-1)
+            seed (int): Rastgele sayı üreteci tohumu (tekrarlanabilir çalıştırma).
+                None ise her çalıştırma farklıdır.
+            strategy (str): Feromon stratejisi: 'as', 'mmas' veya 'acs'.
+                MMAS ve ACS'de başlangıç feromonu en yakın komşu turundan
+                hesaplanır (pheromone_init kullanılmaz). ACS rotaları her
+                zaman NumPy vektörel modda oluşturur.
+            mmas_update (str): MMAS'ta feromon bırakan tur: 'iteration'
+                (iterasyonun en iyisi) veya 'global' (şimdiye kadarki en iyi)
+            p_best (float): MMAS τ_min hesabı için en iyi turu tekrar kurma olasılığı
+            reinit_after (int): MMAS'ta bu kadar iterasyon iyileşme olmazsa
+                feromonu τ_max'a sıfırla (None: kapalı)
+            q0 (float): ACS'de en iyi kenarın doğrudan seçilme olasılığı
+            local_evaporation (float): ACS yerel feromon buharlaşması (ξ)
+            dtype (str): Mesafe, feromon ve seçim matrislerinin veri tipi:
+                'float64' (varsayılan) veya 'float32' (yarı bellek; tur
+                uzunlukları ve yerel arama maliyetleri yine float64 toplanır)
+            pheromone_storage (str): Feromon saklama modu
+                - 'dense': n×n matrisler (varsayılan)
+                - 'sparse': Feromon, η^β ve τ^α × η^β sadece aday listesi
+                  kenarlarında (n, k) tutulur; diğer tüm kenarlar tek bir
+                  varsayılan feromon değerini paylaşır ve aday olmayan
+                  kenarlara bırakılan feromon atılır. Bellek O(n·k) olur.
+                  n_candidates gerektirir; rotalar her zaman NumPy vektörel
+                  modda oluşturulur.
         """
-        self.distance_matrix = distance_matrix
+        if construction not in ('sequential', 'vectorized'):
+            raise ValueError(f"Geçersiz rota oluşturma modu: {construction}")
+        if backend not in ('numpy', 'numba'):
+            raise ValueError(f"Geçersiz hesaplama motoru: {backend}")
+        if local_search is not None and local_search not in LOCAL_SEARCH_METHODS:
+            raise ValueError(f"Geçersiz yerel arama yöntemi: {local_search}")
+        if local_search_scope not in ('best', 'all'):
+            raise ValueError(f"Geçersiz yerel arama kapsamı: {local_search_scope}")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Geçersiz feromon stratejisi: {strategy}")
+        if mmas_update not in ('iteration', 'global'):
+            raise ValueError(f"Geçersiz MMAS güncelleme turu: {mmas_update}")
+        if np.dtype(dtype).name not in ('float32', 'float64'):
+            raise ValueError(f"Geçersiz veri tipi: {dtype}")
+        if pheromone_storage not in PHEROMONE_STORAGES:
+            raise ValueError(f"Geçersiz feromon saklama modu: {pheromone_storage}")
+        if pheromone_storage == 'sparse' and not n_candidates:
+            raise ValueError("Seyrek feromon için aday listesi (n_candidates) gerekli")
+        self.dtype = np.dtype(dtype)
+        if isinstance(distance_matrix, np.memmap) and pheromone_storage == 'sparse':
+            self.distance_matrix = distance_matrix
+        else:
+            self.distance_matrix = np.asarray(distance_matrix, dtype=self.dtype)
         self.n_ants = n_ants
         self.n_iterations = n_iterations
         self.alpha = alpha
         self.beta = beta
         self.evaporation = evaporation
+        self.construction = construction
+        self.symmetric_deposit = symmetric_deposit
+        self.backend = backend
+        self.use_kernels = backend == 'numba' and kernels.NUMBA_AVAILABLE
+        self.rng = np.random.default_rng(seed)
         
         self.n_points = len(distance_matrix)
-        self.pheromone = np.ones((self.n_points, self.n_points)) * pheromone_init
+        
+        # Feromon stratejisi
+        self.strategy = strategy
+        self.mmas_update = mmas_update
+        self.p_best = p_best
+        self.reinit_after = reinit_after
+        self.q0 = q0
+        self.local_evaporation = local_evaporation
+        if strategy == 'acs':
+            self.use_kernels = False
+        if strategy == 'as':
+            self.tau_max = self.tau_min = None
+        else:
+            nn_length = nearest_neighbour_length(self.distance_matrix)
+            if strategy == 'mmas':
+                self._set_mmas_bounds(nn_length)
+                pheromone_init = self.tau_max
+            else:
+                # ACS: τ0 = 1 / (n × L_nn)
+                self.tau_min = self.tau_max = None
+                pheromone_init = 1.0 / (self.n_points * nn_length)
+        self.tau_init = pheromone_init
+        
+        # Aday listeleri: her düğüm için k en yakın komşu (mesafeye göre sıralı)
+        self.n_candidates = n_candidates
+        self.candidate_lists = None
+        if n_candidates:
+            self.candidate_lists = self._nearest_neighbours(n_candidates)
+        
+        # Seyrek modda feromon[i, s] = τ(i, candidate_lists[i, s]); aday
+        # olmayan kenarların ortak değeri pheromone_default'ta tutulur
+        self.pheromone_storage = pheromone_storage
+        if pheromone_storage == 'sparse':
+            self.use_kernels = False
+            shape = self.candidate_lists.shape
+            self.pheromone_default = pheromone_init
+        else:
+            shape = (self.n_points, self.n_points)
+            self.pheromone_default = None
+        self.pheromone = np.full(shape, pheromone_init, dtype=self.dtype)
+        
+        # Numba ilk kez burada içe aktarılır; kurulu ama bozuksa NumPy yolu
+        if self.use_kernels and kernels.load() is None:
+            self.use_kernels = False
+        
+        # η^β sabittir: solve() boyunca bir kez hesaplanır
+        self.eta_beta = self._heuristic_matrix()
+        # τ^α × η^β: sadece feromon güncellemesinden sonra yenilenir
+        self.choice_info = np.empty_like(self.pheromone)
+        self._refresh_choice_info()
+        
+        # Yerel arama: aday listeleri yoksa 10 en yakın komşu kullanılır
+        self.local_search = local_search
+        self.local_search_scope = local_search_scope
+        self.local_search_neighbours = None
+        if local_search is not None:
+            self.local_search_neighbours = self.candidate_lists
+            if self.local_search_neighbours is None:
+                self.local_search_neighbours = self._nearest_neighbours(10)
+        
+        # Sonlandırma kriterleri
+        self.stagnation_limit = stagnation_limit
+        self.target_distance = target_distance
+        self.time_limit = time_limit
+        self.branching_threshold = branching_threshold
+        self.branching_lambda = branching_lambda
         
         self.best_path = None
         self.best_distance = float('inf')
         self.best_distances = []
         self.avg_distances = []
+        
+        # Son solve() çağrısının özeti
+        self.stop_reason = None
+        self.iterations_run = 0
+        self.stats = None
+        
+        # cancel() ile başka bir thread'den durdurma isteği
+        self._cancel_event = threading.Event()
     
     def _calculate_probabilities(self, current_node, unvisited):
         """
@@ -63,6 +347,8 @@ class AntColonyOptimizer:
         Formül: P(i,j) = (τ^α × η^β) / Σ(τ^α × η^β)
         où: τ = feromon, η = 1/mesafe
         
+        τ^α × η^β değerleri önceden hesaplanmış `choice_info` matrisinden okunur.
+        
         Args:
             current_node (int): Şu anki düğüm
             unvisited (set): Ziyaret edilmemiş düğümler
@@ -70,24 +356,10 @@ class AntColonyOptimizer:
         Returns:
             tuple: (olasılıklar, seçilebilir_düğümler)
         """
-        probabilities = []
         possible_next = list(unvisited)
-        
-        for next_node in possible_next:
-            # Feromon etkisi
-            tau = self.pheromone[current_node][next_node] ** self.alpha
-            
-            # Mesafe etkisi (ters orantılı)
-            dist = self.distance_matrix[current_node][next_node]
-            if dist > 0:
-                eta = (100.0 / dist) ** self.beta
-            else:
-                eta = 1.0
-            
-            probabilities.append(tau * eta)
+        probs_array = self.choice_info[current_node, possible_next]
         
         # Normalize et
-        probs_array = np.array(probabilities)
         probs_sum = probs_array.sum()
         
         if probs_sum > 0:
@@ -108,23 +380,25 @@ class AntColonyOptimizer:
             tuple: (path, total_distance)
         """
         path = [start_node]
-        visited = {start_node}
+        visited = np.zeros(self.n_points, dtype=bool)
+        visited[start_node] = True
         current = start_node
         
         # Tüm düğümleri ziyaret et
-        while len(visited) < self.n_points:
-            unvisited = set(range(self.n_points)) - visited
-            
-            # Seçim olasılıklarını hesapla
-            probs, possible_next = self._calculate_probabilities(current, unvisited)
-            
-            if len(possible_next) == 0:
-                break
+        for _ in range(self.n_points - 1):
+            if self.candidate_lists is not None:
+                next_node = self._select_from_candidates(current, visited)
+            else:
+                unvisited = np.flatnonzero(~visited)
+                
+                # Seçim olasılıklarını hesapla
+                probs, possible_next = self._calculate_probabilities(current, unvisited)
+                
+                # Rulet tekerleği ile seç
+                next_node = self.rng.choice(possible_next, p=probs)
             
-            # Rulet tekerleği ile seç
-            next_node = np.random.choice(possible_next, p=probs)
             path.append(next_node)
-            visited.add(next_node)
+            visited[next_node] = True
             current = next_node
         
         # Ring seferi: Başlangıca dönüş
@@ -132,53 +406,854 @@ class AntColonyOptimizer:
         
         # Mesafeyi hesapla
         total_dist = sum([
-            self.distance_matrix[path[i]][path[i+1]]
+            float(self.distance_matrix[path[i]][path[i+1]])
             for i in range(len(path)-1)
         ])
         
         return path, total_dist
     
-    def solve(self, start_node=0, progress_callback=None):
+    def _select_from_candidates(self, current, visited):
+        """
+        Aday listesinden bir sonraki düğümü seç (adım maliyeti O(k)).
+        
+        Ziyaret edilmemiş adaylar arasında rulet tekerleği uygulanır. Aday
+        listesi tükenmişse, ziyaret edilmemiş düğümler arasından τ^α × η^β
+        değeri en yüksek olan seçilir.
+        
+        Args:
+            current (int): Şu anki düğüm
+            visited (np.array): Ziyaret maskesi (n,)
+        
+        Returns:
+            int: Seçilen düğüm
+        """
+        candidates = self.candidate_lists[current]
+        candidates = candidates[~visited[candidates]]
+        
+        if len(candidates) > 0:
+            probs, possible_next = self._calculate_probabilities(current, candidates)
+            return self.rng.choice(possible_next, p=probs)
+        
+        # Fallback: en iyi ziyaret edilmemiş düğüm
+        unvisited = np.flatnonzero(~visited)
+        return unvisited[np.argmax(self.choice_info[current, unvisited])]
+    
+    def _nearest_neighbours(self, k, chunk_size=1024):
+        """
+        Her düğüm için k en yakın komşuyu bul.
+        
+        Satırlar parça parça işlenir; n×n boyutunda ek bir kopya oluşturulmaz.
+        
+        Args:
+            k (int): Komşu sayısı
+            chunk_size (int): Tek seferde işlenecek satır sayısı
+        
+        Returns:
+            np.array: (n, k) komşu indeksleri (yakından uzağa)
+        """
+        n = self.n_points
+        k = max(1, min(int(k), n - 1))
+        neighbours = np.empty((n, k), dtype=np.intp)
+        
+        for start in range(0, n, chunk_size):
+            rows = np.arange(start, min(start + chunk_size, n))
+            block = np.array(self.distance_matrix[rows], dtype=float)
+            block[np.arange(len(rows)), rows] = np.inf  # Kendisi aday olamaz
+            
+            nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+            neighbours[rows] = np.take_along_axis(nearest, order, axis=1)
+        
+        return neighbours
+    
+    def _heuristic_matrix(self, dist=None):
+        """
+        Sezgisel bilgi matrisini (η^β) hesapla.
+        
+        Formül: η = 100 / mesafe  (köşegen / sıfır mesafe için η = 1)
+        
+        Args:
+            dist (np.array): Mesafeler (varsayılan: tüm matris, seyrek modda
+                sadece aday kenarları)
+        
+        Returns:
+            np.array: dist ile aynı boyutta η^β matrisi
+        """
+        if dist is None:
+            dist = self.distance_matrix
+            if self.pheromone_storage == 'sparse':
+                rows = np.arange(self.n_points)[:, None]
+                dist = np.asarray(dist[rows, self.candidate_lists])
+        eta = np.ones(dist.shape, dtype=self.dtype)
+        np.divide(100.0, dist, out=eta, where=dist > 0)
+        return _power(eta, self.beta)
+    
+    def _set_mmas_bounds(self, best_distance):
+        """
+        MMAS feromon sınırlarını en iyi tur uzunluğundan hesapla.
+        
+        τ_max = 1 / (ρ × L_best)
+        τ_min = τ_max × (1 - p_best^(1/n)) / ((n/2 - 1) × p_best^(1/n))
+        """
+        n = self.n_points
+        self.tau_max = 1.0 / (self.evaporation * best_distance)
+        p_dec = self.p_best ** (1.0 / n)
+        avg = max(n / 2.0 - 1.0, 1.0)
+        self.tau_min = min(self.tau_max * (1 - p_dec) / (avg * p_dec), self.tau_max)
+    
+    def _edge_index(self, src, dst):
+        """
+        Kenarları feromon dizilerindeki konumlarına çevir.
+        
+        Yoğun modda (src, dst) aynen döner. Seyrek modda dst, src'nin aday
+        listesindeki sırasına çevrilir; aday olmayan kenarlar atılır.
+        
+        Args:
+            src (np.array): Kenar başlangıçları
+            dst (np.array): Kenar bitişleri
+        
+        Returns:
+            tuple: ((satırlar, sütunlar), kept)
+                kept: Korunan kenarların seçicisi (kenar başına değerleri
+                süzmek için)
+        """
+        src = np.asarray(src, dtype=np.intp)
+        dst = np.asarray(dst, dtype=np.intp)
+        if self.pheromone_storage == 'dense':
+            return (src, dst), slice(None)
+        match = self.candidate_lists[src] == dst[:, None]
+        kept = match.any(axis=1)
+        return (src[kept], np.argmax(match[kept], axis=1)), kept
+    
+    def _candidate_choice(self, current, candidates):
+        """Karıncaların aday kenarlarındaki τ^α × η^β değerleri (m, k)."""
+        if self.pheromone_storage == 'sparse':
+            return self.choice_info[current]
+        return self.choice_info[current[:, None], candidates]
+    
+    def _choice_rows(self, current):
+        """
+        Karıncaların bulunduğu düğümlerden tüm düğümlere τ^α × η^β satırları (m, n).
+        
+        Seyrek modda satırlar varsayılan feromonla anlık hesaplanır. Sadece
+        aday listesi tükenmiş karıncalar için çağrıldığından aday sütunları
+        zaten ziyaret edilmiştir (maskelenir).
+        """
+        if self.pheromone_storage == 'dense':
+            return self.choice_info[current]
+        tau = self.pheromone_default ** self.alpha
+        return tau * self._heuristic_matrix(np.asarray(self.distance_matrix[current]))
+    
+    def _refresh_edges(self, src, dst):
+        """choice_info'yu sadece verilen kenarlar için yenile (ACS)."""
+        tau = self.pheromone[src, dst]
+        if self.alpha != 1:
+            tau = tau ** self.alpha
+        self.choice_info[src, dst] = tau * self.eta_beta[src, dst]
+    
+    def _refresh_choice_info(self):
+        """
+        Seçim bilgisi matrisini (τ^α × η^β) feromondan yeniden hesapla.
+        
+        Buharlaşma ve feromon bırakma adımlarından sonra, iterasyonda bir kez
+        çağrılır. α = 1 için üs alma tamamen atlanır.
+        """
+        if self.alpha == 1:
+            np.multiply(self.pheromone, self.eta_beta, out=self.choice_info)
+        else:
+            np.multiply(_power(self.pheromone, self.alpha), self.eta_beta,
+                        out=self.choice_info)
+    
+    def _build_paths_vectorized(self, start_node):
+        """
+        Tüm karıncaların rotalarını NumPy ile eş zamanlı (lockstep) oluştur.
+        
+        Her adımda tüm karıncalar için ziyaret maskesi uygulanır, kümülatif
+        toplam üzerinden tek bir düzgün (uniform) sayı çekilerek rulet
+        tekerleği seçimi yapılır.
+        
+        Args:
+            start_node (int): Başlangıç düğümü (ring seferi); None ise her
+                karınca rastgele bir düğümden başlar
+        
+        Returns:
+            tuple: (paths, distances)
+                - paths: (n_ants, n+1) düğüm indeksleri
+                - distances: (n_ants,) tur uzunlukları
+        """
+        n = self.n_points
+        starts = self._start_nodes(start_node)
+        
+        paths = np.empty((self.n_ants, n + 1), dtype=np.intp)
+        paths[:, 0] = starts
+        paths[:, -1] = starts
+        
+        visited = np.zeros((self.n_ants, n), dtype=bool)
+        visited[np.arange(self.n_ants), starts] = True
+        current = paths[:, 0].copy()
+        
+        for step in range(1, n):
+            draws = self.rng.random(self.n_ants)
+            next_nodes = self._choose_next(current, visited, draws)
+            
+            paths[:, step] = next_nodes
+            visited[np.arange(self.n_ants), next_nodes] = True
+            current = next_nodes
+        
+        if self.strategy == 'acs':
+            self._local_update(current, paths[:, -1])
+        
+        distances = self.distance_matrix[paths[:, :-1], paths[:, 1:]].sum(axis=1,
+                                                                          dtype=np.float64)
+        return paths, distances
+    
+    def _choose_next(self, current, blocked, draws):
+        """
+        Tüm karıncalar için bir adım seçimi.
+        
+        ACS'de sözde-rastgele orantılı kural uygulanır (q < q0 ise en iyi kenar,
+        aksi halde rulet tekerleği) ve geçilen kenarlar yerel olarak
+        güncellenir; diğer stratejilerde rulet tekerleği kullanılır.
+        
+        Args:
+            current (np.array): Karıncaların bulunduğu düğümler (m,)
+            blocked (np.array): Seçilemeyecek düğümlerin maskesi (m, n)
+            draws (np.array): [0, 1) aralığında düzgün sayılar (m,)
+        
+        Returns:
+            np.array: Seçilen düğümler (m,)
+        """
+        if self.strategy != 'acs':
+            return self._roulette(current, blocked, draws)
+        
+        exploit = self.rng.random(len(current)) < self.q0
+        explore = ~exploit
+        next_nodes = np.empty(len(current), dtype=np.intp)
+        next_nodes[exploit] = self._greedy_choice(current[exploit], blocked[exploit])
+        next_nodes[explore] = self._roulette(current[explore], blocked[explore],
+                                             draws[explore])
+        self._local_update(current, next_nodes)
+        return next_nodes
+    
+    def _greedy_choice(self, current, visited):
+        """
+        Ziyaret edilmemiş düğümler arasında τ^α × η^β değeri en yüksek olanı seç.
+        
+        Aday listesi varsa önce adaylara bakılır; adayları tükenen karıncalar
+        için tüm düğümler taranır.
+        
+        Args:
+            current (np.array): Karıncaların bulunduğu düğümler (m,)
+            visited (np.array): Ziyaret maskesi (m, n)
+        
+        Returns:
+            np.array: Seçilen düğümler (m,)
+        """
+        rows = np.arange(len(current))
+        if self.candidate_lists is None:
+            scores = np.where(visited, -np.inf, self.choice_info[current])
+            return np.argmax(scores, axis=1)
+        
+        candidates = self.candidate_lists[current]
+        scores = np.where(visited[rows[:, None], candidates], -np.inf,
+                          self._candidate_choice(current, candidates))
+        best = np.argmax(scores, axis=1)
+        next_nodes = candidates[rows, best]
+        
+        exhausted = np.flatnonzero(np.isneginf(scores[rows, best]))
+        if len(exhausted) > 0:
+            scores = np.where(visited[exhausted], -np.inf,
+                              self._choice_rows(current[exhausted]))
+            next_nodes[exhausted] = np.argmax(scores, axis=1)
+        return next_nodes
+    
+    def _local_update(self, src, dst):
+        """
+        ACS yerel feromon güncellemesi: τ(i,j) = (1 - ξ) × τ(i,j) + ξ × τ0
+        
+        Geçilen kenarlar diğer karıncalar için daha az çekici hale gelir
+        (keşif artar).
+        """
+        xi = self.local_evaporation
+        index, kept = self._edge_index(src, dst)
+        self.pheromone[index] = (1 - xi) * self.pheromone[index] + xi * self.tau_init
+        self._refresh_edges(*index)
+        if self.symmetric_deposit:
+            # Ters kenar ileri kenarın yeni değerini alır (seyrek modda aday
+            # olmayan ileri kenarlar için varsayılan değerin güncellenmiş hali)
+            values = np.empty(len(src), dtype=self.dtype)
+            if self.pheromone_default is not None:
+                values[:] = (1 - xi) * self.pheromone_default + xi * self.tau_init
+            values[kept] = self.pheromone[index]
+            reverse, back = self._edge_index(dst, src)
+            self.pheromone[reverse] = values[back]
+            self._refresh_edges(*reverse)
+    
+    def _build_paths_compiled(self, start_node):
+        """
+        Tüm karıncaların rotalarını derlenmiş (numba) çekirdekle oluştur.
+        
+        Rastgele sayılar vektörel mod ile aynı sırada çekilir; böylece aynı
+        tohumla iki yol aynı turları üretir.
+        
+        Args:
+            start_node (int): Başlangıç düğümü (ring seferi)
+        
+        Returns:
+            tuple: (paths, distances)
+        """
+        candidates = self.candidate_lists
+        if candidates is None:
+            candidates = np.empty((self.n_points, 0), dtype=np.intp)
+        
+        starts = self._start_nodes(start_node)
+        draws = self.rng.random((self.n_points - 1, self.n_ants))
+        compiled = kernels.load()
+        paths = compiled.build_tours(self.choice_info, candidates, starts, draws)
+        return paths, compiled.tour_lengths(self.distance_matrix, paths)
+    
+    def _roulette(self, current, visited, draws):
+        """Aday listesi varsa adaylar, yoksa tüm düğümler üzerinde rulet seçimi."""
+        if self.candidate_lists is not None:
+            return self._roulette_candidates(current, visited, draws)
+        return self._roulette_full(current, visited, draws)
+    
+    def _roulette_full(self, current, visited, draws):
+        """
+        Tüm ziyaret edilmemiş düğümler üzerinde toplu rulet tekerleği seçimi.
+        
+        Args:
+            current (np.array): Karıncaların bulunduğu düğümler (m,)
+            visited (np.array): Ziyaret maskesi (m, n)
+            draws (np.array): [0, 1) aralığında düzgün sayılar (m,)
+        
+        Returns:
+            np.array: Seçilen düğümler (m,)
+        """
+        weights = self.choice_info[current] * ~visited
+        cumulative = np.cumsum(weights, axis=1)
+        totals = cumulative[:, -1]
+        
+        # Ağırlıkların tamamı sıfırsa ziyaret edilmemişler arasında eşit seç
+        empty = totals <= 0
+        if empty.any():
+            cumulative[empty] = np.cumsum(~visited[empty], axis=1)
+            totals = cumulative[:, -1]
+        
+        # Rulet tekerleği: ilk cumulative > çekiliş değeri
+        draws = np.minimum(draws * totals, np.nextafter(totals, 0))
+        return np.argmax(cumulative > draws[:, None], axis=1)
+    
+    def _roulette_candidates(self, current, visited, draws):
+        """
+        Aday listeleri üzerinde toplu rulet tekerleği seçimi (adım maliyeti O(k)).
+        
+        Aday listesi tükenen karıncalar için ziyaret edilmemiş düğümler
+        arasından τ^α × η^β değeri en yüksek olan seçilir.
+        
+        Args:
+            current (np.array): Karıncaların bulunduğu düğümler (m,)
+            visited (np.array): Ziyaret maskesi (m, n)
+            draws (np.array): [0, 1) aralığında düzgün sayılar (m,)
+        
+        Returns:
+            np.array: Seçilen düğümler (m,)
+        """
+        rows = np.arange(len(current))
+        candidates = self.candidate_lists[current]
+        weights = (self._candidate_choice(current, candidates)
+                   * ~visited[rows[:, None], candidates])
+        cumulative = np.cumsum(weights, axis=1)
+        totals = cumulative[:, -1]
+        
+        draws = np.minimum(draws * totals, np.nextafter(totals, 0))
+        next_nodes = candidates[rows, np.argmax(cumulative > draws[:, None], axis=1)]
+        
+        # Fallback: aday listesi tükenmiş karıncalar
+        exhausted = np.flatnonzero(totals <= 0)
+        if len(exhausted) > 0:
+            scores = np.where(visited[exhausted], -np.inf,
+                              self._choice_rows(current[exhausted]))
+            next_nodes[exhausted] = np.argmax(scores, axis=1)
+        
+        return next_nodes
+    
+    def _update_pheromone(self, all_paths, all_distances):
+        """
+        Buharlaşma ve feromon bırakma adımlarını toplu (vektörel) uygula.
+        
+        Tüm turlar (n_ants, n+1) boyutunda bir diziye yığılır, kenar indeksleri
+        çıkarılır ve katkılar tek bir np.add.at çağrısıyla biriktirilir.
+        
+        Formül: τ(i,j) = (1 - ρ) × τ(i,j) + Σ 1 / L_k
+        
+        choice_info burada yenilenmez; çağıran _refresh_choice_info() çağırır.
+        MMAS ve ACS stratejileri kendi (tek turluk) güncellemelerine yönlendirilir.
+        
+        Args:
+            all_paths (list): Karıncaların rotaları (her biri n+1 düğüm)
+            all_distances (list): Rota uzunlukları
+        """
+        if self.strategy == 'mmas':
+            self._update_pheromone_mmas(all_paths, all_distances)
+            return
+        if self.strategy == 'acs':
+            self._update_pheromone_acs()
+            return
+        
+        paths = np.asarray(all_paths, dtype=np.intp)
+        
+        if self.use_kernels:
+            kernels.load().update_pheromone(self.pheromone, paths,
+                                            np.asarray(all_distances, dtype=float),
+                                            self.evaporation, self.symmetric_deposit)
+            return
+        
+        amounts = 1.0 / np.asarray(all_distances, dtype=float)
+        
+        src = paths[:, :-1].ravel()
+        dst = paths[:, 1:].ravel()
+        deposit = np.repeat(amounts, paths.shape[1] - 1)
+        
+        self._evaporate()
+        index, kept = self._edge_index(src, dst)
+        np.add.at(self.pheromone, index, deposit[kept])
+        if self.symmetric_deposit:
+            index, kept = self._edge_index(dst, src)
+            np.add.at(self.pheromone, index, deposit[kept])
+    
+    def _evaporate(self):
+        """Tüm kenarlarda buharlaşma (seyrek modda varsayılan değer dahil)."""
+        self.pheromone *= (1 - self.evaporation)
+        if self.pheromone_default is not None:
+            self.pheromone_default *= (1 - self.evaporation)
+    
+    def _deposit_tour(self, path, amount):
+        """Tek bir turun kenarlarına feromon bırak (O(n))."""
+        path = np.asarray(path, dtype=np.intp)
+        src, dst = path[:-1], path[1:]
+        index, _ = self._edge_index(src, dst)
+        self.pheromone[index] += amount
+        if self.symmetric_deposit:
+            index, _ = self._edge_index(dst, src)
+            self.pheromone[index] += amount
+    
+    def _update_pheromone_mmas(self, all_paths, all_distances):
+        """
+        MMAS: Buharlaşma, tek turun feromon bırakması ve [τ_min, τ_max] sınırı.
+        
+        τ_max şimdiye kadarki en iyi tur ile güncellenir.
+        """
+        self._set_mmas_bounds(self.best_distance)
+        
+        if self.mmas_update == 'global':
+            path, distance = self.best_path, self.best_distance
+        else:
+            k = int(np.argmin(all_distances))
+            path, distance = all_paths[k], all_distances[k]
+        
+        self._evaporate()
+        self._deposit_tour(path, 1.0 / distance)
+        np.clip(self.pheromone, self.tau_min, self.tau_max, out=self.pheromone)
+        if self.pheromone_default is not None:
+            self.pheromone_default = min(max(self.pheromone_default, self.tau_min),
+                                         self.tau_max)
+    
+    def _update_pheromone_acs(self):
+        """
+        ACS global güncelleme: sadece en iyi turun kenarlarında
+        τ(i,j) = (1 - ρ) × τ(i,j) + ρ / L_best (O(n)).
+        
+        choice_info sadece bu kenarlarda yenilenir.
+        """
+        path = np.asarray(self.best_path, dtype=np.intp)
+        src, dst = path[:-1], path[1:]
+        if self.symmetric_deposit:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+        rho = self.evaporation
+        index, _ = self._edge_index(src, dst)
+        self.pheromone[index] = (1 - rho) * self.pheromone[index] + rho / self.best_distance
+        self._refresh_edges(*index)
+    
+    def _restart_pheromone(self):
+        """MMAS durgunlukta feromonu τ_max'a sıfırla (keşfi yeniden başlat)."""
+        self.pheromone.fill(self.tau_max)
+        if self.pheromone_default is not None:
+            self.pheromone_default = self.tau_max
+        self._refresh_choice_info()
+    
+    def _apply_local_search(self, all_paths, all_distances):
+        """
+        Turları yerel arama ile iyileştir (listeler yerinde güncellenir).
+        
+        Args:
+            all_paths (list): Karıncaların rotaları
+            all_distances (list): Rota uzunlukları
+        
+        Returns:
+            int: İyileştirilen tur sayısı
+        """
+        if self.local_search_scope == 'best':
+            targets = [int(np.argmin(all_distances))]
+        else:
+            targets = range(len(all_paths))
+        
+        improved = 0
+        for k in targets:
+            path, distance = improve_tour(all_paths[k], self.distance_matrix,
+                                          self.local_search_neighbours,
+                                          self.local_search)
+            if distance < all_distances[k]:
+                all_paths[k] = path
+                all_distances[k] = distance
+                improved += 1
+        return improved
+    
+    def _start_nodes(self, start_node):
+        """
+        Karıncaların başlangıç düğümleri.
+        
+        Kapalı ringin uzunluğu başlangıca bağlı değildir; start_node None ise
+        her karınca rastgele bir düğümden başlar (çeşitlilik). Sabit başlangıçta
+        rastgele sayı çekilmez (aynı tohum aynı turları üretir).
+        
+        Args:
+            start_node (int): Başlangıç düğümü veya None
+        
+        Returns:
+            np.array: (n_ants,) düğüm indeksleri
+        """
+        if start_node is None:
+            return self.rng.integers(0, self.n_points, size=self.n_ants)
+        return np.full(self.n_ants, start_node, dtype=np.intp)
+    
+    def _construct_solutions(self, start_node):
+        """
+        Seçili moda göre tüm koloninin rotalarını oluştur.
+        
+        Args:
+            start_node (int): Başlangıç düğümü (None: karınca başına rastgele)
+        
+        Returns:
+            tuple: (all_paths, all_distances)
+        """
+        if self.use_kernels:
+            paths, distances = self._build_paths_compiled(start_node)
+            return paths.tolist(), distances.tolist()
+        
+        if (self.construction == 'vectorized' or self.strategy == 'acs'
+                or self.pheromone_storage == 'sparse'):
+            paths, distances = self._build_paths_vectorized(start_node)
+            return paths.tolist(), distances.tolist()
+        
+        all_paths = []
+        all_distances = []
+        for start in self._start_nodes(start_node):
+            path, distance = self._build_path(int(start))
+            all_paths.append(path)
+            all_distances.append(distance)
+        return all_paths, all_distances
+    
+    def branching_factor(self):
+        """
+        Feromon matrisinin ortalama λ-dallanma faktörünü hesapla.
+        
+        Her düğüm için τ(i,j) ≥ τ_min + λ(τ_max - τ_min) koşulunu sağlayan
+        kenar sayılır ve düğümler üzerinden ortalaması alınır. Değer 1'e
+        yaklaştıkça koloni tek bir tura yakınsamıştır.
+        
+        Seyrek modda aday olmayan kenarlar varsayılan feromon değeriyle sayılır.
+        
+        Returns:
+            float: Ortalama dallanma faktörü
+        """
+        tau_min = self.pheromone.min(axis=1, keepdims=True)
+        tau_max = self.pheromone.max(axis=1, keepdims=True)
+        default = self.pheromone_default
+        if default is not None:
+            tau_min = np.minimum(tau_min, default)
+            tau_max = np.maximum(tau_max, default)
+        cutoff = tau_min + self.branching_lambda * (tau_max - tau_min)
+        counts = (self.pheromone >= cutoff).sum(axis=1)
+        if default is not None:
+            others = self.n_points - self.pheromone.shape[1]
+            counts = counts + others * (default >= cutoff[:, 0])
+        return float(counts.mean())
+    
+    def _termination_reason(self, iterations_done, since_improvement, started):
+        """
+        Erken durdurma kriterlerini kontrol et.
+        
+        Args:
+            iterations_done (int): Bu solve() çağrısında tamamlanan iterasyon
+            since_improvement (int): Son iyileşmeden bu yana geçen iterasyon
+            started (float): solve() başlangıç zamanı (perf_counter)
+        
+        Returns:
+            str: Sonlandırma nedeni veya None
+                - 'target': Hedef tur uzunluğuna ulaşıldı
+                - 'stagnation': K iterasyon boyunca iyileşme yok
+                - 'time_limit': Süre bütçesi doldu
+                - 'converged': Feromon matrisi yakınsadı
+                - 'max_iterations': Tüm iterasyonlar tamamlandı
+                - 'cancelled': cancel() ile iptal edildi
+        """
+        if self._cancel_event.is_set():
+            return 'cancelled'
+        if self.target_distance is not None and self.best_distance <= self.target_distance:
+            return 'target'
+        if self.stagnation_limit is not None and since_improvement >= self.stagnation_limit:
+            return 'stagnation'
+        if self.time_limit is not None and time.perf_counter() - started >= self.time_limit:
+            return 'time_limit'
+        if (self.branching_threshold is not None
+                and self.branching_factor() <= self.branching_threshold):
+            return 'converged'
+        if iterations_done >= self.n_iterations:
+            return 'max_iterations'
+        return None
+    
+    def tour_from(self, start_node):
+        """
+        En iyi ringi verilen duraktan başlayacak şekilde döndür (O(n), yeniden çözmeden).
+        
+        Kapalı ringin uzunluğu başlangıç durağına bağlı değildir; start_node=None
+        ile bir kez bulunan döngü her başlangıç durağı için kullanılabilir.
+        
+        Args:
+            start_node (int): İstenen başlangıç durağı
+        
+        Returns:
+            list: [start_node, ..., start_node]
+        """
+        if self.best_path is None:
+            raise ValueError("Henüz çözüm yok; önce solve() çağırın")
+        return rotate_tour(self.best_path, start_node)
+    
+    def cancel(self):
+        """
+        Çalışan solve() çağrısını iptal et (thread-safe).
+        
+        solve() mevcut iterasyonu bitirir, stop_reason = 'cancelled' ile o ana
+        kadarki en iyi turu döndürür.
+        """
+        self._cancel_event.set()
+    
+    def set_pheromone(self, pheromone):
+        """
+        Feromon dizisini kopyalamadan değiştir ve seçim bilgisini yenile.
+        
+        Dizi yerinde güncellenir; örn. ada modeli paylaşımlı bellekteki
+        görünümü verir.
+        
+        Args:
+            pheromone (np.array): Mevcut feromonla aynı boyut ve dtype'ta dizi
+        """
+        if pheromone.shape != self.pheromone.shape or pheromone.dtype != self.dtype:
+            raise ValueError(f"Feromon dizisi uyuşmuyor: {pheromone.shape} {pheromone.dtype}, "
+                             f"beklenen {self.pheromone.shape} {self.dtype}")
+        self.pheromone = pheromone
+        self._refresh_choice_info()
+    
+    def export_state(self, names=None):
+        """
+        Optimizer durumunu dışa aktar (warm start için).
+        
+        Args:
+            names (list): Durak adları; verilirse durak listesi değiştiğinde
+                feromon satır/sütunları bu adlara göre eşlenebilir
+        
+        Returns:
+            dict: pheromone, pheromone_default, best_path, best_distance,
+                rng_state, names (rng_state: numpy Generator bit_generator
+                durumu; pheromone_default sadece seyrek modda dolu)
+        """
+        return {
+            'pheromone': self.pheromone.copy(),
+            'pheromone_default': self.pheromone_default,
+            'best_path': (None if self.best_path is None
+                          else [int(node) for node in self.best_path]),
+            'best_distance': float(self.best_distance),
+            'rng_state': self.rng.bit_generator.state,
+            'names': None if names is None else list(names),
+        }
+    
+    def warm_start(self, state, names=None, restore_rng=False):
+        """
+        Önceki bir çözümün feromon matrisi ve en iyi turu ile başla.
+        
+        Durak adları verilirse (hem `names` hem `state['names']`), feromon
+        matrisi yeni durak listesine eşlenir:
+            - Kalan duraklar arasındaki feromon korunur
+            - Yeni duraklara ait kenarlar eski feromonun ortalamasıyla başlar
+            - En iyi turdan silinen duraklar çıkarılır, yeni duraklar en ucuz
+              ekleme ile yerleştirilir ve uzunluk yeni matrisle hesaplanır
+        
+        Seyrek feromon sadece aynı durak listesiyle (eşleme olmadan) yüklenir.
+        
+        Args:
+            state (dict): export_state() çıktısı
+            names (list): Bu optimizer'ın durak adları (matris sırasıyla)
+            restore_rng (bool): Rastgele sayı üretecinin durumunu da yükle
+        """
+        old_pheromone = np.asarray(state['pheromone'], dtype=self.dtype)
+        old_names = state.get('names')
+        old_path = state.get('best_path')
+        
+        if names is not None and old_names is not None and list(names) != list(old_names):
+            if self.pheromone_storage == 'sparse':
+                raise ValueError("Seyrek feromon farklı durak listesine eşlenemez")
+            old_index = {name: i for i, name in enumerate(old_names)}
+            mapping = np.array([old_index.get(name, -1) for name in names], dtype=np.intp)
+            kept = np.flatnonzero(mapping >= 0)
+            
+            pheromone = np.full((self.n_points, self.n_points), old_pheromone.mean(),
+                                dtype=self.dtype)
+            pheromone[np.ix_(kept, kept)] = old_pheromone[np.ix_(mapping[kept], mapping[kept])]
+            
+            tour = None
+            if old_path is not None:
+                new_index = {int(old): new for new, old in enumerate(mapping) if old >= 0}
+                tour = [new_index[node] for node in old_path[:-1] if node in new_index]
+                added = [int(i) for i in np.flatnonzero(mapping < 0)]
+                tour = _cheapest_insertion(tour, added, self.distance_matrix)
+        else:
+            if old_pheromone.shape != self.pheromone.shape:
+                raise ValueError("Feromon boyutu uyuşmuyor; durak adlarını verin")
+            pheromone = old_pheromone.copy()
+            tour = None if old_path is None else [int(node) for node in old_path[:-1]]
+        
+        if self.pheromone_storage == 'sparse':
+            default = state.get('pheromone_default')
+            if default is None:
+                raise ValueError("Seyrek feromon durumu varsayılan değer içermiyor")
+            self.pheromone_default = float(default)
+        self.set_pheromone(pheromone)
+        
+        if tour:
+            self.best_path = tour + [tour[0]]
+            self.best_distance = float(
+                self.distance_matrix[self.best_path[:-1], self.best_path[1:]].sum(dtype=np.float64)
+            )
+        
+        if restore_rng and state.get('rng_state') is not None:
+            self.rng.bit_generator.state = state['rng_state']
+    
+    def solve(self, start_node=0, progress_callback=None, hooks=None,
+              collect_stats=False):
         """
         ACO ile en kısa rotayı bul.
         
         Args:
-            start_node (int): Ring seferinin başlayacağı düğüm
+            start_node (int): Ring seferinin başlayacağı düğüm. None ise
+                başlangıçtan bağımsız mod: her karınca rastgele bir düğümden
+                başlar, en iyi döngü 0. düğümden başlayacak şekilde saklanır ve
+                tour_from() ile herhangi bir durağa O(n)'de döndürülür.
             progress_callback (func): Progress güncelleme fonksiyonu
+            hooks (list): SolveHook nesneleri (core.instrumentation)
+            collect_stats (bool): Faz sürelerini ve iterasyon kayıtlarını topla.
+                Hook verilmişse ölçüm otomatik açılır.
         
         Returns:
             tuple: (best_path, best_distance, best_distances, avg_distances)
+                Sonlandırma nedeni `stop_reason`, çalışan iterasyon sayısı
+                `iterations_run`, ölçümler (açıksa) `stats` özelliklerinde tutulur.
         """
-        for iteration in range(self.n_iterations):
-            all_paths = []
-            all_distances = []
-            
-            # Tüm karıncalar rota oluştur
-            for _ in range(self.n_ants):
-                path, distance = self._build_path(start_node)
-                all_paths.append(path)
-                all_distances.append(distance)
+        started = time.perf_counter()
+        since_improvement = 0
+        hooks = list(hooks or [])
+        instrumented = collect_stats or bool(hooks)
+        stats = SolveStats() if instrumented else NULL_STATS
+        self.stats = stats if instrumented else None
+        
+        # Warm start turu farklı bir duraktan başlıyorsa döndür
+        cycle_start = 0 if start_node is None else start_node
+        if self.best_path is not None and self.best_path[0] != cycle_start:
+            self.best_path = rotate_tour(self.best_path, cycle_start)
+        self.stop_reason = None
+        self.iterations_run = 0
+        
+        for hook in hooks:
+            hook.on_solve_start(self)
+        
+        # Önceki çağrılardan kalan iptal isteği bu çözümü durdurmamalı
+        self._cancel_event.clear()
+        try:
+            for iteration in range(self.n_iterations):
+                # Tüm karıncalar rota oluştur
+                with stats.phase('construction'):
+                    all_paths, all_distances = self._construct_solutions(start_node)
+                
+                # Yerel arama (2-opt / Or-opt)
+                ls_improved = 0
+                if self.local_search is not None:
+                    with stats.phase('local_search'):
+                        ls_improved = self._apply_local_search(all_paths, all_distances)
                 
                 # En iyi yolu güncelle
-                if distance < self.best_distance:
-                    self.best_distance = distance
-                    self.best_path = path.copy()
-            
-            # İstatistikler
-            self.best_distances.append(min(all_distances))
-            self.avg_distances.append(np.mean(all_distances))
-            
-            # Feromon buharlaşması
-            self.pheromone *= (1 - self.evaporation)
-            
-            # Feromon güncelleme
-            for path, distance in zip(all_paths, all_distances):
-                pheromone_increase = 1.0 / distance
-                for i in range(len(path) - 1):
-                    self.pheromone[path[i]][path[i+1]] += pheromone_increase
-            
-            # Progress
-            if progress_callback:
-                progress_callback(iteration + 1, self.n_iterations, self.best_distance)
+                iteration_best = int(np.argmin(all_distances))
+                improved = all_distances[iteration_best] < self.best_distance
+                if improved:
+                    self.best_distance = all_distances[iteration_best]
+                    self.best_path = list(all_paths[iteration_best])
+                    if self.best_path[0] != cycle_start:
+                        self.best_path = rotate_tour(self.best_path, cycle_start)
+                    since_improvement = 0
+                else:
+                    since_improvement += 1
+                
+                # İstatistikler
+                self.best_distances.append(min(all_distances))
+                self.avg_distances.append(np.mean(all_distances))
+                
+                # Feromon buharlaşması + güncelleme
+                with stats.phase('pheromone_update'):
+                    self._update_pheromone(all_paths, all_distances)
+                with stats.phase('choice_info'):
+                    # ACS choice_info'yu sadece değişen kenarlarda günceller
+                    if self.strategy != 'acs':
+                        self._refresh_choice_info()
+                
+                # MMAS: durgunlukta feromonu yeniden başlat
+                if (self.strategy == 'mmas' and self.reinit_after
+                        and since_improvement > 0 and since_improvement % self.reinit_after == 0):
+                    self._restart_pheromone()
+                
+                # Progress ve hook'lar
+                with stats.phase('hooks'):
+                    if progress_callback:
+                        progress_callback(iteration + 1, self.n_iterations, self.best_distance)
+                    if instrumented:
+                        record = {
+                            'iteration': iteration + 1,
+                            'best_distance': float(self.best_distance),
+                            'iteration_best': float(self.best_distances[-1]),
+                            'iteration_mean': float(self.avg_distances[-1]),
+                            'tours_built': len(all_paths),
+                            'improved': bool(improved),
+                            'local_search_improvements': ls_improved,
+                            'elapsed': time.perf_counter() - started,
+                        }
+                        record.update(pheromone_summary(self.pheromone,
+                                                        self.pheromone_default))
+                        stats.record_iteration(record)
+                        for hook in hooks:
+                            hook.on_iteration(self, record)
+                
+                # Erken durdurma
+                self.iterations_run = iteration + 1
+                with stats.phase('termination'):
+                    self.stop_reason = self._termination_reason(
+                        self.iterations_run, since_improvement, started
+                    )
+                if self.stop_reason is not None:
+                    break
+        finally:
+            self._cancel_event.clear()
+        
+        if instrumented:
+            stats.finish()
+            for hook in hooks:
+                hook.on_solve_end(self, stats)
         
         return self.best_path, self.best_distance, self.best_distances, self.avg_distances
@@ -0,0 +1,185 @@
+# 🧵 Arka Planda Çözüm
+
+"""
+AntColonyOptimizer.solve() çağrısını ayrı bir thread'de çalıştır.
+
+- İlerleme anlık görüntüleri (iterasyon, en iyi mesafe, en iyi tur) bir
+  kuyruğa en fazla `min_interval` saniyede bir yazılır; hızlı iterasyonlarda
+  arayüz güncellemesi çözümü yavaşlatmaz. Kuyrukta sadece en güncel görüntü
+  tutulur: kimse yoklamasa da (örn. kapatılmış Streamlit sekmesi) birikmez.
+- Arayüz kuyruğu istediği hızda yoklar (poll / latest).
+- cancel(): Çözüm mevcut iterasyonun sonunda durur (stop_reason='cancelled').
+
+Kullanım:
+    >>> solver = BackgroundSolver(optimizer, start_node=0).start()
+    >>> while solver.running:
+    ...     snapshot = solver.latest()
+    ...     time.sleep(0.2)
+    >>> best_path, best_distance, best_distances, avg_distances = solver.result()
+"""
+
+import queue
+import threading
+import time
+
+
+class BackgroundSolver:
+    """
+    Bir optimizer'ı arka plan thread'inde çözen ve ilerlemeyi yayınlayan sarmalayıcı.
+    """
+    
+    def __init__(self, optimizer, start_node=0, min_interval=0.1, hooks=None):
+        """
+        Args:
+            optimizer (AntColonyOptimizer): Çözülecek optimizer
+            start_node (int): Ring seferinin başlayacağı düğüm (None: başlangıçtan
+                bağımsız döngü, bkz. AntColonyOptimizer.solve)
+            min_interval (float): İki anlık görüntü arasındaki en kısa süre (saniye)
+            hooks (list): solve()'a iletilecek SolveHook nesneleri (optional)
+        """
+        self.optimizer = optimizer
+        self.start_node = start_node
+        self.min_interval = min_interval
+        self.hooks = hooks
+        self.snapshots = queue.Queue(maxsize=1)
+        
+        self._thread = None
+        self._cancelled = threading.Event()
+        self._result = None
+        self._error = None
+        self._started = None
+        self._last_publish = 0.0
+        self._last_snapshot = None
+    
+    # ----------------------------------------------------------------
+    # Çalıştırma
+    # ----------------------------------------------------------------
+    def start(self):
+        """
+        Çözümü arka planda başlat.
+        
+        Returns:
+            BackgroundSolver: Zincirleme kullanım için kendisi
+        """
+        if self._thread is not None:
+            raise ValueError("Çözüm zaten başlatıldı")
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='aco-solver', daemon=True)
+        self._thread.start()
+        return self
+    
+    def _snapshot(self, iteration, total, done=False):
+        best_path = self.optimizer.best_path
+        return {
+            'iteration': iteration,
+            'n_iterations': total,
+            'best_distance': float(self.optimizer.best_distance),
+            'best_path': None if best_path is None else list(best_path),
+            'elapsed': time.perf_counter() - self._started,
+            'done': done,
+            'stop_reason': self.optimizer.stop_reason if done else None,
+        }
+    
+    def _publish(self, snapshot):
+        """Anlık görüntüyü yayınla; okunmamış eski görüntü atılır."""
+        try:
+            self.snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        # Tek yazan bu thread olduğundan kuyruk burada boştur
+        self.snapshots.put_nowait(snapshot)
+    
+    def _progress(self, iteration, total, best_distance):
+        """solve() progress_callback'i: sadece min_interval dolunca yayınla."""
+        # solve() başında temizlenen iptal isteğini her iterasyonda yenile
+        if self._cancelled.is_set():
+            self.optimizer.cancel()
+        now = time.perf_counter()
+        if now - self._last_publish >= self.min_interval:
+            self._last_publish = now
+            self._publish(self._snapshot(iteration, total))
+    
+    def _run(self):
+        try:
+            self._result = self.optimizer.solve(start_node=self.start_node,
+                                                progress_callback=self._progress,
+                                                hooks=self.hooks)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._publish(self._snapshot(self.optimizer.iterations_run,
+                                         self.optimizer.n_iterations, done=True))
+    
+    def cancel(self):
+        """
+        Çözümü iptal et; mevcut iterasyon bitince durur.
+        
+        Thread solve()'a henüz girmediyse istek kaybolmaz: ilk iterasyondan
+        sonra uygulanır.
+        """
+        self._cancelled.set()
+        self.optimizer.cancel()
+    
+    # ----------------------------------------------------------------
+    # Durum
+    # ----------------------------------------------------------------
+    @property
+    def running(self):
+        """bool: Thread hâlâ çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    @property
+    def done(self):
+        """bool: Çözüm bitti mi (başarılı, iptal veya hata)"""
+        return self._thread is not None and not self._thread.is_alive()
+    
+    def poll(self):
+        """
+        Kuyruktaki anlık görüntüyü al (bloklamaz).
+        
+        Returns:
+            list: Son yoklamadan bu yana yayınlanan en güncel görüntü (en
+                fazla bir eleman; aradaki görüntüler atılmıştır)
+        """
+        snapshots = []
+        while True:
+            try:
+                snapshots.append(self.snapshots.get_nowait())
+            except queue.Empty:
+                break
+        if snapshots:
+            self._last_snapshot = snapshots[-1]
+        return snapshots
+    
+    def latest(self):
+        """
+        En güncel anlık görüntü (kuyruk boşsa bir öncekini tekrar döndürür).
+        
+        Returns:
+            dict: iteration, n_iterations, best_distance, best_path, elapsed,
+                done, stop_reason; henüz yoksa None
+        """
+        self.poll()
+        return self._last_snapshot
+    
+    def result(self, timeout=None):
+        """
+        Çözüm bitene kadar bekle ve sonucu döndür.
+        
+        Args:
+            timeout (float): En fazla bekleme süresi (saniye)
+        
+        Returns:
+            tuple: (best_path, best_distance, best_distances, avg_distances)
+        
+        Raises:
+            TimeoutError: Süre dolduğunda çözüm hâlâ çalışıyorsa
+        """
+        if self._thread is None:
+            raise ValueError("Çözüm başlatılmadı")
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError("Çözüm henüz bitmedi")
+        if self._error is not None:
+            raise self._error
+        return self._result
@@ -0,0 +1,250 @@
+# 📦 Toplu Çözüm (Batch)
+
+"""
+Çok sayıda ring problemini (farklı kampüsler, saat varyantları, başlangıç
+durakları, ACO parametreleri) süreç havuzunda çöz ve sonuçları bittikçe akıt.
+
+- Aynı durak kümesi için mesafe matrisi bir kez hesaplanır (tekilleştirme)
+- Her tekil matris diske .npy olarak bir kez yazılır; işçi süreçler dosyayı
+  bellek eşlemeli (memmap) açar ve süreç içinde önbelleğe alır. Görev başına
+  matris kopyalanmaz / pickle edilmez.
+- Görevler tahmini maliyete göre büyükten küçüğe kuyruğa verilir (uzun
+  işler sona kalmaz, havuz boş beklemez)
+
+Problem tanımı (spec):
+    {
+        'id': 'kampus-sabah',               # optional (varsayılan: sıra no)
+        'locations': {Durak Adı: [Lat, Lon], ...},
+        'start_node': 0,                    # indeks, durak adı veya None (başlangıçtan bağımsız)
+        'params': {'n_ants': 30, ...},      # AntColonyOptimizer parametreleri
+        'seed': 42,                         # optional
+    }
+    'locations' yerine hazır 'distance_matrix' (+ optional 'names') verilebilir;
+    aynı dizi nesnesini paylaşan tanımlar tek matris sayılır.
+
+Kullanım:
+    >>> for result in solve_batch(specs, max_workers=8):
+    ...     print(result['id'], result['distance'])
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.matrix_cache import COORD_DECIMALS
+from core.matrix_utils import get_distance_matrix, memmap_dtype, open_distance_memmap
+
+
+# Süreç başına açılmış mesafe matrisleri (dosya yolu -> memmap)
+_MATRICES = {}
+
+
+def _solve_task(task):
+    """
+    Süreç havuzunda tek bir optimizasyon çalıştır.
+    
+    Args:
+        task (dict): distance_path, start_node, seed, params
+    
+    Returns:
+        dict: path, distance, iterations_run, stop_reason, elapsed
+    """
+    started = time.perf_counter()
+    distance_matrix = _MATRICES.get(task['distance_path'])
+    if distance_matrix is None:
+        distance_matrix = open_distance_memmap(task['distance_path'])
+        _MATRICES[task['distance_path']] = distance_matrix
+    
+    optimizer = AntColonyOptimizer(distance_matrix, seed=task['seed'], **task['params'])
+    path, distance, _, _ = optimizer.solve(start_node=task['start_node'])
+    return {
+        'path': [int(node) for node in path],
+        'distance': float(distance),
+        'iterations_run': optimizer.iterations_run,
+        'stop_reason': optimizer.stop_reason,
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def _matrix_key(spec):
+    """Tekilleştirme anahtarı: koordinatlar veya matris nesnesinin kimliği."""
+    if spec.get('distance_matrix') is not None:
+        return ('matrix', id(spec['distance_matrix']))
+    coords = np.round(np.asarray(list(spec['locations'].values()), dtype=float),
+                      COORD_DECIMALS)
+    return ('locations', tuple(spec['locations']), coords.tobytes())
+
+
+def _estimated_cost(n, params):
+    """Görev maliyeti tahmini: iterasyon × karınca × n² (sıralama için)."""
+    return params.get('n_iterations', 100) * params.get('n_ants', 30) * n * n
+
+
+def _prepare_matrix(spec, number, temp_dir, memmap_dir, api_key, cache, status_callback,
+                    dtype=None):
+    """
+    Tek bir tekil problemin mesafe matrisini işçilerin açacağı .npy dosyasına hazırla.
+    
+    Dosya görevlerin dtype'ıyla yazılır (varsayılan float64); işçiler matrisi
+    tip dönüşümü (süreç başına kopya) olmadan kullanır.
+    
+    Returns:
+        tuple: (dosya yolu, durak adları veya None, durak sayısı, dosyanın dtype'ı)
+    """
+    target_dir = memmap_dir or temp_dir
+    distance_path = os.path.join(target_dir, f"matris_{number}.npy")
+    
+    if spec.get('distance_matrix') is not None:
+        matrix = spec['distance_matrix']
+        names = spec.get('names')
+        names = None if names is None else list(names)
+    else:
+        matrix, names, _ = get_distance_matrix(
+            spec['locations'], api_key, cache=cache, status_callback=status_callback,
+            memmap_path=distance_path if memmap_dir else None
+        )
+    
+    # Tanımda verilen veya memmap_dir'e yazılan .npy eşlemesi yeniden yazılmaz.
+    # Önbellek dosyaları kopyalanır: toplu çalışma sırasında LRU ile silinebilir.
+    filename = getattr(matrix, 'filename', None)
+    own_file = memmap_dir is not None or matrix is spec.get('distance_matrix')
+    if own_file and isinstance(matrix, np.memmap) and str(filename).endswith('.npy'):
+        return str(filename), names, len(matrix), matrix.dtype
+    
+    matrix = np.asarray(matrix, dtype=dtype or float)
+    np.save(distance_path, matrix)
+    return distance_path, names, len(matrix), matrix.dtype
+
+
+def _error_result(index, spec, n_stops, message):
+    """Çözülemeyen bir tanım için hata sonucu."""
+    return {
+        'index': index,
+        'id': spec.get('id', index),
+        'n_stops': n_stops,
+        'start_node': spec.get('start_node', 0),
+        'seed': spec.get('seed'),
+        'path': None,
+        'route': None,
+        'distance': None,
+        'error': message,
+    }
+
+
+def solve_batch(specs, api_key=None, cache=None, max_workers=None, memmap_dir=None,
+                status_callback=None):
+    """
+    Problem listesini paralel çöz; sonuçları tamamlandıkça döndür (generator).
+    
+    Mesafe matrisleri ana süreçte (API / önbellek) hesaplanır, çözümler havuzda
+    çalışır. Generator kapatıldığında geçici matris dosyaları silinir.
+    
+    Args:
+        specs (list): Problem tanımları (modül açıklamasına bakın)
+        api_key (str): Google Maps API Key (optional)
+        cache (DistanceMatrixCache): Kalıcı mesafe önbelleği (optional)
+        max_workers (int): Süreç sayısı (varsayılan: CPU sayısı)
+        memmap_dir (str): Verilirse matrisler bu klasöre float32 olarak
+            hesaplanır ve çalıştırmadan sonra silinmez (optional)
+        status_callback (func): status_callback(level, message) (optional)
+    
+    Yields:
+        dict: index, id, n_stops, start_node, seed, path, route, distance,
+            iterations_run, stop_reason, elapsed. Görev hata verirse veya tanım
+            geçersizse (veri yok, bozuk koordinat / matris, bilinmeyen başlangıç
+            durağı) path None olur, hata mesajı `error` anahtarında döner ve
+            diğer görevler sürer.
+    """
+    specs = list(specs)
+    
+    with tempfile.TemporaryDirectory(prefix='aco_batch_') as temp_dir:
+        # Tekil matrisler: (anahtar, dtype) -> (dosya yolu, durak adları, n, dtype)
+        problems = {}
+        tasks = []
+        invalid = []
+        for index, spec in enumerate(specs):
+            if spec.get('locations') is None and spec.get('distance_matrix') is None:
+                invalid.append(_error_result(
+                    index, spec, None, "'locations' veya 'distance_matrix' gerekli"
+                ))
+                continue
+            
+            # Bozuk tanım (koordinat biçimi, matris şekli, dosyayla uyuşmayan
+            # dtype vb.) sadece kendi sonucunu etkiler
+            params = dict(spec.get('params') or {})
+            try:
+                dtype = params.get('dtype')
+                key = (_matrix_key(spec), None if dtype is None else np.dtype(dtype).name)
+                if key not in problems:
+                    problems[key] = _prepare_matrix(spec, len(problems), temp_dir,
+                                                    memmap_dir, api_key, cache,
+                                                    status_callback, dtype)
+                distance_path, names, n, file_dtype = problems[key]
+                params['dtype'] = memmap_dtype(file_dtype, dtype)
+            except Exception as e:
+                invalid.append(_error_result(index, spec, None, str(e)))
+                continue
+            
+            start_node = spec.get('start_node', 0)
+            if isinstance(start_node, str):
+                if names is None or start_node not in names:
+                    invalid.append(_error_result(
+                        index, spec, n, f"Başlangıç durağı bulunamadı: {start_node}"
+                    ))
+                    continue
+                start_node = names.index(start_node)
+            
+            tasks.append({
+                'index': index,
+                'id': spec.get('id', index),
+                'names': names,
+                'n_stops': n,
+                'cost': _estimated_cost(n, params),
+                'distance_path': distance_path,
+                'start_node': None if start_node is None else int(start_node),
+                'seed': spec.get('seed'),
+                'params': params,
+            })
+        
+        # Geçersiz tanımlar havuza gönderilmeden hata sonucu olarak döner
+        yield from invalid
+        
+        # Büyük görevler önce (en uzun işlem süresi önce sıralaması)
+        tasks.sort(key=lambda task: task['cost'], reverse=True)
+        
+        pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+        try:
+            futures = {
+                pool.submit(_solve_task, {key: task[key] for key in
+                                          ('distance_path', 'start_node', 'seed', 'params')}): task
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                task = futures[future]
+                result = {
+                    'index': task['index'],
+                    'id': task['id'],
+                    'n_stops': task['n_stops'],
+                    'start_node': task['start_node'],
+                    'seed': task['seed'],
+                }
+                try:
+                    result.update(future.result())
+                except Exception as e:
+                    result.update({'path': None, 'route': None, 'distance': None,
+                                   'error': str(e)})
+                    yield result
+                    continue
+                
+                names = task['names']
+                result['route'] = (None if names is None
+                                   else [names[node] for node in result['path']])
+                yield result
+        finally:
+            # Generator erken kapatılırsa bekleyen görevler iptal edilir
+            pool.shutdown(cancel_futures=True)
+
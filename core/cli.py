@@ -0,0 +1,272 @@
+# 🖥️ Komut Satırı (Headless) Çalıştırıcı
+
+"""
+Streamlit olmadan toplu rota optimizasyonu.
+
+CSV / JSON durak dosyalarını okur, her dosya için mesafe matrisini hesaplar
+(önbellek + Google Maps / Haversine), optimizasyonları süreç havuzunda paralel
+çalıştırır ve rotaları CSV + KML olarak yazar.
+
+Girdi biçimleri:
+    - CSV: name,lat,lon (veya isim,enlem,boylam) başlıklı satırlar
+    - JSON: {"Durak Adı": [Lat, Lon], ...} veya [{"name", "lat", "lon"}, ...]
+
+Kullanım:
+    python -m core.cli duraklar.csv --output-dir cikti
+    python -m core.cli a.json b.csv --runs 8 --workers 4 --seed 42
+    python -m core.cli bolge.csv --memmap-dir matrisler --n-candidates 20 \
+        --pheromone-storage sparse
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+from config import ACO_PARAMS, DISTANCE_CACHE_CONFIG
+from core.ant_algorithm import PHEROMONE_STORAGES, STRATEGIES
+from core.batch import solve_batch
+from core.local_search import LOCAL_SEARCH_METHODS
+from core.matrix_cache import DistanceMatrixCache
+from core.matrix_utils import get_distance_matrix
+from visual.plotting import generate_kml
+
+
+_NAME_COLUMNS = ('name', 'isim', 'durak')
+_LAT_COLUMNS = ('lat', 'latitude', 'enlem')
+_LON_COLUMNS = ('lon', 'lng', 'longitude', 'boylam')
+
+
+def _pick_column(fieldnames, candidates):
+    lowered = {field.strip().lower(): field for field in fieldnames}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    raise ValueError(f"Sütun bulunamadı: {'/'.join(candidates)}")
+
+
+def load_stops(path):
+    """
+    Durakları CSV veya JSON dosyasından oku.
+    
+    Args:
+        path (str): Dosya yolu (.csv veya .json)
+    
+    Returns:
+        dict: {Durak Adı: [Lat, Lon], ...} (dosyadaki sırayla)
+    
+    Raises:
+        ValueError: Biçim tanınmazsa veya aynı durak adı tekrar ederse
+    """
+    stops = {}
+    
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            items = [(name, coord[0], coord[1]) for name, coord in data.items()]
+        elif isinstance(data, list):
+            items = [(item['name'], item['lat'], item['lon']) for item in data]
+        else:
+            raise ValueError(f"Geçersiz JSON durak dosyası: {path}")
+    else:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames:
+                raise ValueError(f"Boş CSV dosyası: {path}")
+            name_col = _pick_column(reader.fieldnames, _NAME_COLUMNS)
+            lat_col = _pick_column(reader.fieldnames, _LAT_COLUMNS)
+            lon_col = _pick_column(reader.fieldnames, _LON_COLUMNS)
+            items = [(row[name_col], row[lat_col], row[lon_col]) for row in reader]
+    
+    for name, lat, lon in items:
+        name = str(name).strip()
+        if name in stops:
+            raise ValueError(f"Aynı durak adı birden fazla kez verildi: {name}")
+        stops[name] = [float(lat), float(lon)]
+    
+    if len(stops) < 2:
+        raise ValueError(f"En az 2 durak gerekli: {path}")
+    return stops
+
+
+def write_route_csv(path, names, path_indices, coords, distance_matrix):
+    """
+    Rotayı Streamlit arayüzündeki tablo ile aynı sütunlarla CSV'ye yaz.
+    
+    Args:
+        path (str): Çıktı dosyası
+        names (list): Durak adları
+        path_indices (list): Ziyaret sırası
+        coords (np.array): Koordinatlar (n×2)
+        distance_matrix (np.array): Mesafe matrisi
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Sıra", "Durak", "Enlem", "Boylam", "Sonraki Duraktan Mesafe"])
+        for idx, node_idx in enumerate(path_indices):
+            lat, lon = coords[node_idx]
+            mesafe = 0
+            if idx < len(path_indices) - 1:
+                mesafe = distance_matrix[node_idx][path_indices[idx + 1]]
+            writer.writerow([idx, names[node_idx], f"{lat:.6f}", f"{lon:.6f}",
+                             f"{mesafe/1000:.2f} km" if mesafe > 0 else "-"])
+
+
+def output_stem(input_path):
+    """
+    Girdi dosyasının çıktı adı kökü: uzantı dahil dosya adı ('d.csv' → 'd_csv').
+    
+    Aynı adlı farklı biçimdeki girdiler (d.csv, d.json) birbirinin çıktısının
+    üzerine yazmaz.
+    """
+    return os.path.basename(input_path).replace('.', '_')
+
+
+def _status(level, message):
+    print(f"[{level}] {message}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m core.cli',
+        description="Streamlit olmadan ACO ring seferi optimizasyonu"
+    )
+    parser.add_argument('inputs', nargs='+', help="CSV / JSON durak dosyaları")
+    parser.add_argument('--output-dir', default='cikti')
+    parser.add_argument('--start', default=None,
+                        help="Başlangıç durağının adı (varsayılan: ilk durak)")
+    parser.add_argument('--runs', type=int, default=1,
+                        help="Dosya başına bağımsız çalıştırma (en iyisi yazılır)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Temel tohum; k. çalıştırma seed + k kullanır")
+    parser.add_argument('--api-key', default=os.environ.get('GOOGLE_MAPS_API_KEY'))
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Disk önbelleğini kullanma")
+    parser.add_argument('--memmap-dir', default=None,
+                        help="Matrisleri bu klasöre float32 .npy olarak yaz ve süreçler "
+                             "arasında bellek eşlemeli paylaş (önbellek kullanılmaz)")
+    parser.add_argument('--n-ants', type=int, default=ACO_PARAMS['n_ants'])
+    parser.add_argument('--n-iterations', type=int, default=ACO_PARAMS['n_iterations'])
+    parser.add_argument('--alpha', type=float, default=ACO_PARAMS['alpha'])
+    parser.add_argument('--beta', type=float, default=ACO_PARAMS['beta'])
+    parser.add_argument('--evaporation', type=float, default=ACO_PARAMS['evaporation'])
+    parser.add_argument('--stagnation-limit', type=int, default=None)
+    parser.add_argument('--construction', choices=['sequential', 'vectorized'],
+                        default='vectorized')
+    parser.add_argument('--local-search', choices=LOCAL_SEARCH_METHODS, default=None)
+    parser.add_argument('--strategy', choices=STRATEGIES, default='as',
+                        help="Feromon stratejisi: Ant System, Max-Min AS, Ant Colony System")
+    parser.add_argument('--n-candidates', type=int, default=None,
+                        help="Aday listesi boyutu (k en yakın komşu)")
+    parser.add_argument('--dtype', choices=['float64', 'float32'], default=None,
+                        help="Matris veri tipi (float32: yarı bellek; varsayılan: float64, "
+                             "--memmap-dir ile dosyanın tipi)")
+    parser.add_argument('--pheromone-storage', choices=PHEROMONE_STORAGES, default='dense',
+                        help="'sparse': feromon sadece aday kenarlarında (--n-candidates gerekli)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    stems = [output_stem(input_path) for input_path in args.inputs]
+    if len(set(stems)) < len(stems):
+        parser.error("Aynı adlı girdi dosyaları aynı çıktı dosyalarına yazılır: "
+                     + ", ".join(args.inputs))
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache = None if args.no_cache else DistanceMatrixCache(**DISTANCE_CACHE_CONFIG)
+    
+    params = {
+        'n_ants': args.n_ants,
+        'n_iterations': args.n_iterations,
+        'alpha': args.alpha,
+        'beta': args.beta,
+        'evaporation': args.evaporation,
+        'pheromone_init': ACO_PARAMS['pheromone_init'],
+        'stagnation_limit': args.stagnation_limit,
+        'construction': args.construction,
+        'local_search': args.local_search,
+        'strategy': args.strategy,
+        'n_candidates': args.n_candidates,
+        'pheromone_storage': args.pheromone_storage,
+    }
+    if args.dtype is not None:
+        params['dtype'] = args.dtype
+    
+    # Mesafe matrisleri ana süreçte (API / önbellek), çözümler core.batch havuzunda
+    problems = []
+    specs = []
+    for input_path, stem in zip(args.inputs, stems):
+        stops = load_stops(input_path)
+        if args.start is not None and args.start not in stops:
+            parser.error(f"Başlangıç durağı bulunamadı: {args.start} ({input_path})")
+        memmap_path = None
+        if args.memmap_dir:
+            os.makedirs(args.memmap_dir, exist_ok=True)
+            memmap_path = os.path.join(args.memmap_dir, f"{stem}_matris.npy")
+        matrix, names, coords = get_distance_matrix(stops, args.api_key, cache=cache,
+                                                    status_callback=_status,
+                                                    memmap_path=memmap_path)
+        start_node = 0 if args.start is None else names.index(args.start)
+        problems.append((input_path, names, coords, matrix))
+        # Önbellek dosyası çalıştırma sırasında silinebilir: batch kendi kopyasını yazsın.
+        # Aynı dizi nesnesi tüm çalıştırmalarda tek matris olarak paylaşılır.
+        shared = matrix if memmap_path else np.asarray(matrix)
+        for run in range(args.runs):
+            specs.append({
+                'id': len(problems) - 1,
+                'distance_matrix': shared,
+                'names': names,
+                'start_node': start_node,
+                'seed': None if args.seed is None else args.seed + run,
+                'params': params,
+            })
+    
+    results = sorted(solve_batch(specs, max_workers=args.workers),
+                     key=lambda result: result['index'])
+    for result in results:
+        if result.get('error'):
+            _status('warning', f"{problems[result['id']][0]} (seed={result['seed']}): "
+                               f"{result['error']}")
+    
+    summary = []
+    for index, (input_path, names, coords, matrix) in enumerate(problems):
+        runs = [result for result in results
+                if result['id'] == index and not result.get('error')]
+        if not runs:
+            continue
+        best = min(runs, key=lambda result: result['distance'])
+        
+        stem = stems[index]
+        csv_path = os.path.join(args.output_dir, f"{stem}_rota.csv")
+        kml_path = os.path.join(args.output_dir, f"{stem}_rota.kml")
+        write_route_csv(csv_path, names, best['path'], coords, matrix)
+        with open(kml_path, 'w', encoding='utf-8') as f:
+            f.write(generate_kml(names, best['path'], coords))
+        
+        summary.append({
+            'input': input_path,
+            'n_stops': len(names),
+            'best_distance': best['distance'],
+            'route': [names[node] for node in best['path']],
+            'runs': [{key: result[key] for key in ('seed', 'distance', 'iterations_run',
+                                                   'stop_reason')} for result in runs],
+            'csv': csv_path,
+            'kml': kml_path,
+        })
+        print(f"{input_path}: {best['distance']/1000:.2f} km ({len(names)} durak) "
+              f"→ {csv_path}, {kml_path}")
+    
+    with open(os.path.join(args.output_dir, 'ozet.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+# 🌐 Google Maps Distance Matrix - Toplu (Batched) İstekler
+
+"""
+Mesafe matrisini Google Maps Distance Matrix API'nin izin verdiği en büyük
+başlangıç × varış bloklarına (tile) bölerek iste.
+
+- Tek istek: en fazla 25 başlangıç, 25 varış ve 100 eleman
+- Tek bir istemci (client / HTTP oturumu) tüm istekler için yeniden kullanılır
+- Saniye başına istek (QPS) sınırı uygulanır
+- Başarısız bloklar üstel bekleme (exponential backoff) ile tekrar denenir
+
+İstemci olarak `distance_matrix(origins, destinations, mode, units)` metoduna
+sahip herhangi bir nesne verilebilir; bu sayede sahte (fake) bir istemci ile
+çevrimdışı test edilebilir.
+"""
+
+import time
+
+import numpy as np
+
+
+MAX_ELEMENTS_PER_REQUEST = 100
+MAX_ORIGINS_PER_REQUEST = 25
+MAX_DESTINATIONS_PER_REQUEST = 25
+
+# API anahtarı başına tek istemci (bağlantı havuzu yeniden kullanılır)
+_CLIENTS = {}
+
+
+def get_client(api_key, timeout=None):
+    """
+    API anahtarı için önbellekteki googlemaps istemcisini döndür.
+    
+    Args:
+        api_key (str): Google Maps API Key
+        timeout (int): İstek zaman aşımı (saniye)
+    
+    Returns:
+        googlemaps.Client: Paylaşılan istemci
+    """
+    key = (api_key, timeout)
+    if key not in _CLIENTS:
+        import googlemaps
+        _CLIENTS[key] = googlemaps.Client(key=api_key, timeout=timeout)
+    return _CLIENTS[key]
+
+
+class BatchedDistanceMatrix:
+    """
+    Distance Matrix API isteklerini bloklara bölen katman.
+    
+    Kullanım:
+        >>> batcher = BatchedDistanceMatrix(get_client(api_key))
+        >>> matrix = batcher.fetch(coords, coords)
+        >>> # Alınamayan elemanlar NaN olarak döner
+    """
+    
+    def __init__(self, client, mode='driving', units='metric',
+                 max_elements=MAX_ELEMENTS_PER_REQUEST,
+                 max_origins=MAX_ORIGINS_PER_REQUEST,
+                 max_destinations=MAX_DESTINATIONS_PER_REQUEST,
+                 qps=10, max_retries=3, backoff=0.5, sleep=time.sleep):
+        """
+        Args:
+            client: `distance_matrix(...)` metoduna sahip istemci
+            mode (str): Ulaşım modu ('driving', 'walking', ...)
+            units (str): Birim sistemi ('metric')
+            max_elements (int): İstek başına en fazla eleman (başlangıç × varış)
+            max_origins (int): İstek başına en fazla başlangıç
+            max_destinations (int): İstek başına en fazla varış
+            qps (float): Saniye başına en fazla istek
+            max_retries (int): Başarısız blok için tekrar deneme sayısı
+            backoff (float): İlk bekleme süresi (saniye), her denemede 2 katına çıkar
+            sleep (func): Bekleme fonksiyonu (testlerde değiştirilebilir)
+        """
+        self.client = client
+        self.mode = mode
+        self.units = units
+        self.max_elements = max_elements
+        self.max_origins = max_origins
+        self.max_destinations = max_destinations
+        self.min_interval = 1.0 / qps if qps else 0.0
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.sleep = sleep
+        
+        self.n_requests = 0
+        self.n_failed_tiles = 0
+        # fetch() ile alınamayan (NaN) eleman sayısı, başarısız bloklar dahil
+        self.n_missing = 0
+        self._last_request = None
+    
+    def tiles(self, n_origins, n_destinations):
+        """
+        Matrisi istek sınırlarına uyan en büyük bloklara böl.
+        
+        Sütun genişliği her satır bloğunun gerçek satır sayısından hesaplanır;
+        kısa son satır bloğu daha geniş (daha az) isteklerle alınır.
+        
+        Args:
+            n_origins (int): Başlangıç sayısı
+            n_destinations (int): Varış sayısı
+        
+        Returns:
+            list: [(satır_slice, sütun_slice), ...]
+        """
+        rows = max(1, min(self.max_origins, n_origins, self.max_elements))
+        tiles = []
+        for i in range(0, n_origins, rows):
+            block_rows = min(rows, n_origins - i)
+            cols = max(1, min(self.max_destinations, n_destinations,
+                              self.max_elements // block_rows))
+            tiles.extend(
+                (slice(i, i + block_rows), slice(j, min(j + cols, n_destinations)))
+                for j in range(0, n_destinations, cols)
+            )
+        return tiles
+    
+    def _throttle(self):
+        """QPS sınırını aşmamak için gerekirse bekle."""
+        if self._last_request is not None and self.min_interval > 0:
+            wait = self.min_interval - (time.monotonic() - self._last_request)
+            if wait > 0:
+                self.sleep(wait)
+        self._last_request = time.monotonic()
+    
+    def request(self, origins, destinations):
+        """
+        Tek bir bloğu iste; hata durumunda backoff ile tekrar dene.
+        
+        Returns:
+            np.array: (len(origins), len(destinations)) mesafeler (metre)
+        
+        Raises:
+            Exception: Tüm denemeler başarısız olursa son hata
+        """
+        for attempt in range(self.max_retries + 1):
+            self._throttle()
+            try:
+                self.n_requests += 1
+                result = self.client.distance_matrix(
+                    origins=[(lat, lon) for lat, lon in origins],
+                    destinations=[(lat, lon) for lat, lon in destinations],
+                    mode=self.mode,
+                    units=self.units
+                )
+                if result['status'] != 'OK':
+                    raise RuntimeError(f"Distance Matrix durumu: {result['status']}")
+                
+                block = np.full((len(origins), len(destinations)), np.nan)
+                for i, row in enumerate(result['rows']):
+                    for j, element in enumerate(row['elements']):
+                        if element.get('status') == 'OK':
+                            block[i, j] = element['distance']['value']
+                return block
+            except Exception:
+                if attempt == self.max_retries:
+                    raise
+                self.sleep(self.backoff * (2 ** attempt))
+    
+    def fetch(self, origins, destinations, progress_callback=None):
+        """
+        Başlangıç × varış mesafe matrisini bloklar halinde iste.
+        
+        Args:
+            origins (np.array): (m, 2) [Enlem, Boylam]
+            destinations (np.array): (k, 2) [Enlem, Boylam]
+            progress_callback (func): İlerleme (0-1) bildirimi
+        
+        Returns:
+            np.array: (m, k) mesafe matrisi; alınamayan elemanlar NaN
+        """
+        origins = np.asarray(origins, dtype=float).reshape(-1, 2)
+        destinations = np.asarray(destinations, dtype=float).reshape(-1, 2)
+        matrix = np.full((len(origins), len(destinations)), np.nan)
+        
+        tiles = self.tiles(len(origins), len(destinations))
+        for done, (rows, cols) in enumerate(tiles, start=1):
+            try:
+                matrix[rows, cols] = self.request(origins[rows], destinations[cols])
+            except Exception:
+                self.n_failed_tiles += 1
+            if progress_callback:
+                progress_callback(done / len(tiles))
+        
+        self.n_missing += int(np.isnan(matrix).sum())
+        return matrix
@@ -0,0 +1,224 @@
+# 🧩 Artımlı (Incremental) Mesafe Matrisi
+
+"""
+Durak ekleme / çıkarma / taşıma işlemlerinde mesafe matrisini baştan
+hesaplamak yerine sadece etkilenen satır ve sütunu güncelle.
+
+- Durak ekleme: 1 satır + 1 sütun → O(n) mesafe hesabı / API elemanı
+- Durak çıkarma: Hiç mesafe hesabı yok (satır ve sütun silinir)
+- Durak taşıma: 1 satır + 1 sütun yeniden hesaplanır
+
+Mesafeler `block_fn(origins, destinations)` ile hesaplanır; varsayılan
+Haversine'dir, Google Maps için `core.matrix_utils.distance_block_fn` verilebilir.
+"""
+
+import numpy as np
+
+from core.haversine import haversine_matrix
+
+
+class DistanceMatrix:
+    """
+    Durak adları, koordinatlar ve mesafe matrisini senkron tutan yapı.
+    
+    Kullanım:
+        >>> dm = DistanceMatrix(CAMPUS_STOPS)
+        >>> dm.add_stop("11. Geçici Durak", [37.8305, 30.5250])
+        >>> dm.remove_stop("8. Teknokent")
+        >>> matrix, names, coords = dm.to_tuple()
+    """
+    
+    def __init__(self, locations=None, block_fn=haversine_matrix, capacity=16):
+        """
+        Args:
+            locations (dict): {Durak Adı: [Lat, Lon], ...}
+            block_fn (func): block_fn(origins, destinations) -> (m, k) mesafeler
+            capacity (int): Başlangıç kapasitesi (gerektikçe 2 katına çıkar)
+        """
+        self.block_fn = block_fn
+        self._names = []
+        self._index = {}
+        self._n = 0
+        self._coords = np.empty((capacity, 2))
+        self._matrix = np.zeros((capacity, capacity))
+        
+        if locations:
+            self.add_stops(locations)
+    
+    @classmethod
+    def from_matrix(cls, matrix, names, coords, block_fn=haversine_matrix):
+        """
+        Hazır bir (matrix, names, coords) sonucundan oluştur (örn. get_distance_matrix).
+        
+        Köşegen, add_stop ile eklenen duraklarda olduğu gibi sıfırlanır.
+        
+        Returns:
+            DistanceMatrix: Hesaplama yapılmadan doldurulmuş yapı
+        """
+        dm = cls(block_fn=block_fn, capacity=max(len(names), 1))
+        n = len(names)
+        dm._names = list(names)
+        dm._index = {name: i for i, name in enumerate(names)}
+        dm._n = n
+        dm._coords[:n] = np.asarray(coords, dtype=float).reshape(-1, 2)
+        dm._matrix[:n, :n] = matrix
+        np.fill_diagonal(dm._matrix[:n, :n], 0.0)
+        return dm
+    
+    # ----------------------------------------------------------------
+    # Okuma
+    # ----------------------------------------------------------------
+    def __len__(self):
+        return self._n
+    
+    def __contains__(self, name):
+        return name in self._index
+    
+    @property
+    def names(self):
+        """list: Durak adları (matris sırasıyla)"""
+        return list(self._names)
+    
+    @property
+    def coords(self):
+        """np.array: (n, 2) koordinatlar (salt okunur görünüm)"""
+        view = self._coords[:self._n]
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def matrix(self):
+        """np.array: n×n mesafe matrisi (salt okunur görünüm)"""
+        view = self._matrix[:self._n, :self._n]
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def locations(self):
+        """dict: {Durak Adı: [Lat, Lon], ...}"""
+        return {name: list(coord) for name, coord in zip(self._names, self.coords.tolist())}
+    
+    def index_of(self, name):
+        """
+        Durağın matristeki indeksi.
+        
+        Raises:
+            KeyError: Durak yoksa
+        """
+        return self._index[name]
+    
+    def to_tuple(self):
+        """
+        get_distance_matrix ile aynı biçimde kopya döndür.
+        
+        Returns:
+            tuple: (distance_matrix, stop_names, coordinates_array)
+        """
+        return np.array(self.matrix), self.names, np.array(self.coords)
+    
+    # ----------------------------------------------------------------
+    # Güncelleme
+    # ----------------------------------------------------------------
+    def _reserve(self, size):
+        """Kapasite yetmiyorsa dizileri 2 katına büyüt."""
+        capacity = len(self._coords)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        
+        coords = np.empty((capacity, 2))
+        coords[:self._n] = self._coords[:self._n]
+        matrix = np.zeros((capacity, capacity))
+        matrix[:self._n, :self._n] = self._matrix[:self._n, :self._n]
+        self._coords, self._matrix = coords, matrix
+    
+    def add_stops(self, locations):
+        """
+        Birden fazla durak ekle; sadece yeni satır ve sütunlar hesaplanır.
+        
+        Args:
+            locations (dict): {Durak Adı: [Lat, Lon], ...}
+        
+        Raises:
+            ValueError: Aynı adda durak zaten varsa
+        """
+        new_names = list(locations.keys())
+        for name in new_names:
+            if name in self._index:
+                raise ValueError(f"Durak zaten mevcut: {name}")
+        if len(set(new_names)) != len(new_names):
+            raise ValueError("Aynı durak adı birden fazla kez verildi")
+        if not new_names:
+            return
+        
+        old_n = self._n
+        new_n = old_n + len(new_names)
+        self._reserve(new_n)
+        
+        self._coords[old_n:new_n] = np.asarray(list(locations.values()), dtype=float)
+        all_coords = self._coords[:new_n]
+        new_coords = self._coords[old_n:new_n]
+        
+        # Yeni satırlar (yeni → hepsi) ve yeni sütunlar (eski → yeni)
+        self._matrix[old_n:new_n, :new_n] = self.block_fn(new_coords, all_coords)
+        if old_n > 0:
+            self._matrix[:old_n, old_n:new_n] = self.block_fn(all_coords[:old_n], new_coords)
+        for i in range(old_n, new_n):
+            self._matrix[i, i] = 0.0
+        
+        for offset, name in enumerate(new_names):
+            self._index[name] = old_n + offset
+        self._names.extend(new_names)
+        self._n = new_n
+    
+    def add_stop(self, name, coord):
+        """
+        Tek durak ekle (O(n) mesafe hesabı).
+        
+        Args:
+            name (str): Durak adı
+            coord (list): [Enlem, Boylam]
+        """
+        self.add_stops({name: coord})
+    
+    def remove_stop(self, name):
+        """
+        Durağı sil; sonraki durakların indeksleri bir kayar.
+        
+        Args:
+            name (str): Durak adı
+        
+        Returns:
+            int: Silinen durağın eski indeksi
+        """
+        idx = self._index[name]
+        n = self._n
+        
+        # Satır ve sütunu yerinde kaydır (mesafe hesabı yok)
+        self._matrix[idx:n - 1, :n] = self._matrix[idx + 1:n, :n]
+        self._matrix[:n - 1, idx:n - 1] = self._matrix[:n - 1, idx + 1:n]
+        self._coords[idx:n - 1] = self._coords[idx + 1:n]
+        
+        del self._names[idx]
+        self._index = {stop: i for i, stop in enumerate(self._names)}
+        self._n = n - 1
+        return idx
+    
+    def move_stop(self, name, coord):
+        """
+        Durağın koordinatını değiştir; sadece satır ve sütunu yeniden hesapla.
+        
+        Args:
+            name (str): Durak adı
+            coord (list): Yeni [Enlem, Boylam]
+        """
+        idx = self._index[name]
+        n = self._n
+        self._coords[idx] = np.asarray(coord, dtype=float)
+        
+        all_coords = self._coords[:n]
+        point = self._coords[idx:idx + 1]
+        self._matrix[idx, :n] = self.block_fn(point, all_coords)[0]
+        self._matrix[:n, idx] = self.block_fn(all_coords, point)[:, 0]
+        self._matrix[idx, idx] = 0.0
@@ -52,12 +52,46 @@ def haversine_distance(coord1, coord2):
     return straight_distance * HAVERSINE_MULTIPLIER
 
 
-def calculate_distance_matrix(locations):
+def haversine_matrix(coords_a, coords_b):
+    """
+    İki koordinat kümesi arasındaki tüm mesafeleri tek seferde hesapla.
+    
+    Radyana çevirme bir kez yapılır; farklar ve Haversine formülü NumPy
+    broadcasting ile tüm çiftlere aynı anda uygulanır.
+    
+    Args:
+        coords_a (np.array): (m, 2) [Enlem, Boylam] koordinatları
+        coords_b (np.array): (k, 2) [Enlem, Boylam] koordinatları
+    
+    Returns:
+        np.array: (m, k) mesafe matrisi (metre, HAVERSINE_MULTIPLIER uygulanmış)
+    """
+    
+    R = 6371000
+    
+    rad_a = np.radians(np.asarray(coords_a, dtype=float).reshape(-1, 2))
+    rad_b = np.radians(np.asarray(coords_b, dtype=float).reshape(-1, 2))
+    lat_a, lon_a = rad_a[:, 0:1], rad_a[:, 1:2]
+    lat_b, lon_b = rad_b[:, 0], rad_b[:, 1]
+    
+    dlat = lat_b - lat_a
+    dlon = lon_b - lon_a
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat_a) * np.cos(lat_b) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    
+    return R * c * HAVERSINE_MULTIPLIER
+
+
+def calculate_distance_matrix(locations, chunk_size=None):
     """
     Tüm duraklar arasındaki mesafe matrisini hesapla (Haversine).
     
     Args:
         locations (dict): {Durak Adı: [Lat, Lon], ...}
+        chunk_size (int): Satır bloğu boyutu. Verilirse matris blok blok
+            hesaplanır ve ara diziler chunk_size×n ile sınırlı kalır
+            (çok büyük n için bellek tepe noktasını düşürür).
     
     Returns:
         tuple: (distance_matrix, stop_names, coordinates_array)
@@ -79,14 +113,17 @@ def calculate_distance_matrix(locations):
     coords = np.array(list(locations.values()))
     n = len(names)
     
-    # Mesafe matrisini başlat (simetrik)
-    matrix = np.zeros((n, n))
-    
-    # Matrisi doldur
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = haversine_distance(coords[i], coords[j])
-            matrix[i, j] = dist
-            matrix[j, i] = dist  # Simetrik
+    if not chunk_size or chunk_size >= n:
+        # Tek seferde (broadcast)
+        matrix = haversine_matrix(coords, coords)
+    else:
+        # Blok blok: her seferde chunk_size satır
+        matrix = np.empty((n, n))
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            matrix[start:stop] = haversine_matrix(coords[start:stop], coords)
+    
+    # Köşegen (aynı durak) her zaman 0
+    np.fill_diagonal(matrix, 0.0)
     
     return matrix, names, coords
@@ -0,0 +1,168 @@
+# 📈 ACO Ölçüm (Instrumentation) ve Hook Arayüzü
+
+"""
+AntColonyOptimizer.solve() için isteğe bağlı ölçüm katmanı.
+
+- Faz süreleri: construction, local_search, pheromone_update, choice_info,
+  hooks, termination
+- İterasyon kayıtları: üretilen tur, iyileşme, yerel arama iyileşmeleri,
+  feromon min / max / entropi
+- Hook'lar: SolveHook alt sınıfları solve başında, her iterasyon sonunda
+  ve solve sonunda çağrılır
+
+Ölçüm kapalıyken (hook yok, collect_stats=False) solve() sadece paylaşılan
+boş bir context manager kullanır; zaman ölçümü ve feromon istatistikleri
+hiç hesaplanmaz.
+"""
+
+import contextlib
+import time
+
+import numpy as np
+
+
+PHASES = ('construction', 'local_search', 'pheromone_update', 'choice_info',
+          'hooks', 'termination')
+
+
+def pheromone_summary(pheromone, default=None):
+    """
+    Feromon matrisinin özet istatistikleri.
+    
+    Entropi her satırın normalize edilmiş feromon dağılımı için hesaplanır,
+    log(n) ile [0, 1] aralığına ölçeklenir ve satırlar üzerinden ortalanır.
+    1'e yakın: feromon düzgün dağılmış (keşif), 0'a yakın: yakınsama.
+    
+    Args:
+        pheromone (np.array): n×n feromon matrisi veya seyrek modda (n, k)
+            aday kenarı feromonları
+        default (float): Seyrek modda aday olmayan n-k kenarın ortak değeri
+    
+    Returns:
+        dict: pheromone_min, pheromone_max, pheromone_entropy
+    """
+    n = len(pheromone)
+    others = 0 if default is None else n - pheromone.shape[1]
+    totals = pheromone.sum(axis=1, keepdims=True, dtype=np.float64) + others * (default or 0.0)
+    p = pheromone / totals
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(p > 0, p * np.log(p), 0.0).sum(axis=1)
+        if others:
+            q = default / totals[:, 0]
+            terms += others * np.where(q > 0, q * np.log(q), 0.0)
+    entropy = -terms.mean() / np.log(n) if n > 1 else 0.0
+    
+    low, high = float(pheromone.min()), float(pheromone.max())
+    if others:
+        low, high = min(low, default), max(high, default)
+    return {
+        'pheromone_min': low,
+        'pheromone_max': high,
+        'pheromone_entropy': float(entropy),
+    }
+
+
+class SolveHook:
+    """
+    solve() olaylarını dinleyen hook taban sınıfı.
+    
+    Gereken metotları ezmek yeterlidir; varsayılanlar hiçbir şey yapmaz.
+    
+    Kullanım:
+        >>> class Printer(SolveHook):
+        ...     def on_iteration(self, optimizer, record):
+        ...         print(record['iteration'], record['best_distance'])
+        >>> optimizer.solve(hooks=[Printer()])
+    """
+    
+    def on_solve_start(self, optimizer):
+        """solve() başlamadan önce çağrılır."""
+    
+    def on_iteration(self, optimizer, record):
+        """
+        Her iterasyon sonunda çağrılır.
+        
+        Args:
+            optimizer (AntColonyOptimizer): Çalışan optimizer
+            record (dict): İterasyon kaydı (SolveStats.iterations elemanı)
+        """
+    
+    def on_solve_end(self, optimizer, stats):
+        """
+        solve() bitince çağrılır.
+        
+        Args:
+            optimizer (AntColonyOptimizer): Çalışan optimizer
+            stats (SolveStats): Toplam ölçümler
+        """
+
+
+class SolveStats:
+    """
+    Bir solve() çağrısının yapılandırılmış ölçümleri.
+    
+    Attributes:
+        phase_times (dict): {faz adı: toplam saniye}
+        iterations (list): İterasyon kayıtları (dict)
+        total_time (float): solve() toplam süresi (saniye)
+        tours_built (int): Toplam üretilen tur sayısı
+        improvements (int): En iyi turun iyileştiği iterasyon sayısı
+    """
+    
+    def __init__(self):
+        self.phase_times = {phase: 0.0 for phase in PHASES}
+        self.iterations = []
+        self.total_time = 0.0
+        self.tours_built = 0
+        self.improvements = 0
+        self._started = time.perf_counter()
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Bloğun süresini `phase_times[name]` üzerine ekle."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = (self.phase_times.get(name, 0.0)
+                                      + time.perf_counter() - started)
+    
+    def record_iteration(self, record):
+        """İterasyon kaydını ekle ve toplam sayaçları güncelle."""
+        self.iterations.append(record)
+        self.tours_built += record['tours_built']
+        self.improvements += int(record['improved'])
+    
+    def finish(self):
+        """Toplam süreyi kaydet."""
+        self.total_time = time.perf_counter() - self._started
+    
+    def summary(self):
+        """
+        Faz sürelerinin toplam içindeki payları.
+        
+        Returns:
+            dict: total_time, tours_built, improvements, iterations,
+                phase_times, phase_share (0-1)
+        """
+        total = self.total_time or sum(self.phase_times.values()) or 1.0
+        return {
+            'total_time': self.total_time,
+            'tours_built': self.tours_built,
+            'improvements': self.improvements,
+            'iterations': len(self.iterations),
+            'phase_times': dict(self.phase_times),
+            'phase_share': {name: t / total for name, t in self.phase_times.items()},
+        }
+
+
+class _NullStats:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey kaydetmeyen yer tutucu."""
+    
+    _null = contextlib.nullcontext()
+    
+    def phase(self, name):
+        return self._null
+
+
+NULL_STATS = _NullStats()
@@ -0,0 +1,173 @@
+# ⚡ Derlenmiş ACO Çekirdekleri (Numba)
+
+"""
+Rota oluşturma, tur uzunluğu ve feromon güncellemesi için nopython çekirdekleri.
+Numba içe aktarması ağırdır (~0.25 s); bu yüzden modül yüklenirken değil,
+backend='numba' ilk kullanıldığında `load()` ile içe aktarılır ve çekirdekler
+o anda derlenir. Numba kurulu değilse veya içe aktarılamıyorsa (örn. NumPy
+sürüm uyuşmazlığı) AntColonyOptimizer NumPy yoluna döner.
+
+Çekirdekler, aynı rastgele sayılarla NumPy vektörel yolu ile birebir aynı
+seçimleri yapacak şekilde yazılmıştır (rulet tekerleği + aday listesi fallback).
+"""
+
+import importlib.util
+from types import SimpleNamespace
+
+import numpy as np
+
+
+# Paketi içe aktarmadan kurulu olup olmadığına bak (içe aktarma load() içinde
+# başarısız olursa False yapılır)
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+_KERNEL_NAMES = ('build_tours', 'tour_lengths', 'update_pheromone')
+_COMPILED = None
+
+
+def load():
+    """
+    Numba'yı içe aktar ve çekirdekleri derle (ilk çağrıda bir kez).
+    
+    Returns:
+        SimpleNamespace: build_tours, tour_lengths, update_pheromone;
+            numba kurulu değilse veya içe aktarılamıyorsa None
+    """
+    global _COMPILED, NUMBA_AVAILABLE
+    if _COMPILED is None and NUMBA_AVAILABLE:
+        try:
+            from numba import njit
+        except Exception:
+            # Kurulu ama bozuk numba (ABI uyuşmazlığı vb.): sessizce NumPy yolu
+            NUMBA_AVAILABLE = False
+            return None
+        _COMPILED = SimpleNamespace(**{
+            name: njit(cache=True)(globals()[name]) for name in _KERNEL_NAMES
+        })
+    return _COMPILED
+
+
+def build_tours(choice_info, candidate_lists, start_nodes, draws):
+    """
+    Tüm karıncaların turlarını oluştur.
+    
+    Args:
+        choice_info (np.array): n×n τ^α × η^β matrisi
+        candidate_lists (np.array): (n, k) aday listeleri; k = 0 ise tüm düğümler
+        start_nodes (np.array): (n_ants,) karınca başına başlangıç düğümü
+        draws (np.array): (n-1, n_ants) [0, 1) düzgün sayılar
+    
+    Returns:
+        np.array: (n_ants, n+1) turlar
+    """
+    n = choice_info.shape[0]
+    n_ants = draws.shape[1]
+    k = candidate_lists.shape[1]
+    paths = np.empty((n_ants, n + 1), dtype=np.intp)
+    cumulative = np.empty(max(n, k))
+    
+    for ant in range(n_ants):
+        start_node = start_nodes[ant]
+        visited = np.zeros(n, dtype=np.bool_)
+        visited[start_node] = True
+        paths[ant, 0] = start_node
+        paths[ant, n] = start_node
+        current = start_node
+        
+        for step in range(1, n):
+            u = draws[step - 1, ant]
+            chosen = -1
+            
+            if k > 0:
+                # Aday listesi üzerinde rulet tekerleği
+                total = 0.0
+                for c in range(k):
+                    node = candidate_lists[current, c]
+                    if not visited[node]:
+                        total += choice_info[current, node]
+                    cumulative[c] = total
+                if total > 0:
+                    draw = min(u * total, np.nextafter(total, 0.0))
+                    for c in range(k):
+                        if cumulative[c] > draw:
+                            chosen = candidate_lists[current, c]
+                            break
+                else:
+                    # Fallback: en iyi ziyaret edilmemiş düğüm
+                    best = -np.inf
+                    for node in range(n):
+                        if not visited[node] and choice_info[current, node] > best:
+                            best = choice_info[current, node]
+                            chosen = node
+            else:
+                total = 0.0
+                for node in range(n):
+                    if not visited[node]:
+                        total += choice_info[current, node]
+                    cumulative[node] = total
+                if total <= 0:
+                    # Ağırlıkların tamamı sıfır: eşit olasılık
+                    total = 0.0
+                    for node in range(n):
+                        if not visited[node]:
+                            total += 1.0
+                        cumulative[node] = total
+                draw = min(u * total, np.nextafter(total, 0.0))
+                for node in range(n):
+                    if cumulative[node] > draw:
+                        chosen = node
+                        break
+            
+            paths[ant, step] = chosen
+            visited[chosen] = True
+            current = chosen
+    
+    return paths
+
+
+def tour_lengths(distance_matrix, paths):
+    """
+    Turların toplam uzunluklarını hesapla.
+    
+    Args:
+        distance_matrix (np.array): n×n mesafe matrisi
+        paths (np.array): (m, n+1) turlar
+    
+    Returns:
+        np.array: (m,) tur uzunlukları
+    """
+    lengths = np.zeros(paths.shape[0])
+    for ant in range(paths.shape[0]):
+        total = 0.0
+        for i in range(paths.shape[1] - 1):
+            total += distance_matrix[paths[ant, i], paths[ant, i + 1]]
+        lengths[ant] = total
+    return lengths
+
+
+def update_pheromone(pheromone, paths, lengths, evaporation, symmetric):
+    """
+    Buharlaşma ve feromon bırakma adımlarını yerinde (in-place) uygula.
+    
+    Args:
+        pheromone (np.array): n×n feromon matrisi (güncellenir)
+        paths (np.array): (m, n+1) turlar
+        lengths (np.array): (m,) tur uzunlukları
+        evaporation (float): Buharlaşma oranı ρ
+        symmetric (bool): (j,i) kenarına da feromon bırak
+    """
+    n = pheromone.shape[0]
+    keep = 1.0 - evaporation
+    for i in range(n):
+        for j in range(n):
+            pheromone[i, j] *= keep
+    
+    for ant in range(paths.shape[0]):
+        amount = 1.0 / lengths[ant]
+        for i in range(paths.shape[1] - 1):
+            pheromone[paths[ant, i], paths[ant, i + 1]] += amount
+    if symmetric:
+        for ant in range(paths.shape[0]):
+            amount = 1.0 / lengths[ant]
+            for i in range(paths.shape[1] - 1):
+                pheromone[paths[ant, i + 1], paths[ant, i]] += amount
@@ -0,0 +1,234 @@
+# 🔧 Yerel Arama (2-opt / Or-opt)
+
+"""
+Karıncaların bulduğu turları yerel arama ile iyileştir.
+
+- 2-opt: İki kenarı kaldırıp aradaki segmenti ters çevirerek yeniden bağla
+- Or-opt: 1-3 duraklık bir segmenti turun başka bir yerine taşı
+
+Her iki yöntem de komşu listeleri (en yakın k durak) ve "don't-look bit"
+mantığı ile çalışır; sadece iyileşme ihtimali olan hamleler denenir.
+Başlangıç durağı (ring merkezi) her zaman turun başında kalır.
+
+Mesafe matrisi asimetrik olabilir (Google Maps); 2-opt'ta ters çevrilen
+segmentin maliyeti önek toplamları ile tam olarak hesaplanır.
+
+Maliyetler her zaman float64 toplanır (float32 mesafe matrislerinde de).
+Minimum iyileşme tur uzunluğuna göre ölçeklenir (yuvarlama hataları aynı
+hamlelerin sonsuza dek tekrarlanmasına yol açmaz) ve uygulanan hamle sayısı
+düğüm başına MAX_MOVES_PER_NODE ile sınırlanır.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+LOCAL_SEARCH_METHODS = ('2opt', 'oropt', '2opt+oropt')
+
+# Tek bir two_opt / or_opt çağrısında uygulanabilecek en fazla hamle (× n)
+MAX_MOVES_PER_NODE = 20
+
+
+def tour_length(tour, distance_matrix):
+    """
+    Kapalı turun (ring) toplam uzunluğunu hesapla.
+    
+    Args:
+        tour (list): Başlangıç tekrar edilmeden düğümler [s, a, b, ...]
+        distance_matrix (np.array): n×n mesafe matrisi
+    
+    Returns:
+        float: Tur uzunluğu
+    """
+    nodes = np.asarray(tour, dtype=np.intp)
+    return float(distance_matrix[nodes, np.roll(nodes, -1)].sum(dtype=np.float64))
+
+
+def _prefix_costs(tour, distance_matrix):
+    """
+    İleri ve geri yön kenar maliyetlerinin önek toplamları.
+    
+    Returns:
+        tuple: (forward, backward) - forward[p] = Σ_{q<p} d(t_q, t_q+1)
+    """
+    nodes = np.asarray(tour, dtype=np.intp)
+    following = np.roll(nodes, -1)
+    forward = distance_matrix[nodes, following].astype(np.float64)
+    backward = distance_matrix[following, nodes].astype(np.float64)
+    forward = np.concatenate(([0.0], np.cumsum(forward)))
+    backward = np.concatenate(([0.0], np.cumsum(backward)))
+    return forward, backward
+
+
+def _move_limits(tour, distance_matrix, eps, max_moves):
+    """
+    Minimum iyileşme eşiği ve hamle sınırı.
+    
+    Returns:
+        tuple: (threshold, max_moves) - threshold = eps × tur uzunluğu
+    """
+    threshold = eps * tour_length(tour, distance_matrix)
+    if max_moves is None:
+        max_moves = MAX_MOVES_PER_NODE * len(tour)
+    return threshold, max_moves
+
+
+def two_opt(tour, distance_matrix, neighbours, eps=1e-9, max_moves=None):
+    """
+    Komşu listeleri ve don't-look bit'leri ile 2-opt yerel arama.
+    
+    Args:
+        tour (list): Kapalı tur, başlangıç tekrar edilmeden
+        distance_matrix (np.array): n×n mesafe matrisi
+        neighbours (np.array): (n, k) komşu listeleri (yakından uzağa)
+        eps (float): Tur uzunluğuna oranla minimum iyileşme
+        max_moves (int): En fazla hamle (varsayılan: MAX_MOVES_PER_NODE × n)
+    
+    Returns:
+        list: İyileştirilmiş tur
+    """
+    d = distance_matrix
+    tour = list(tour)
+    n = len(tour)
+    if n < 4:
+        return tour
+    
+    threshold, max_moves = _move_limits(tour, d, eps, max_moves)
+    pos = np.empty(n, dtype=np.intp)
+    pos[tour] = np.arange(n)
+    forward, backward = _prefix_costs(tour, d)
+    
+    active = deque(tour)
+    queued = np.ones(n, dtype=bool)
+    moves = 0
+    
+    while active and moves < max_moves:
+        a = active.popleft()
+        queued[a] = False
+        improved = False
+        
+        for c in neighbours[a]:
+            # Kenar e = (t[e], t[e+1]); hem ardıl hem öncül yönü dene
+            for e1, e2 in ((pos[a], pos[c]), ((pos[a] - 1) % n, (pos[c] - 1) % n)):
+                i, j = (e1, e2) if e1 < e2 else (e2, e1)
+                if j - i < 2:
+                    continue
+                
+                x, y = tour[i], tour[i + 1]
+                u, v = tour[j], tour[(j + 1) % n]
+                delta = (float(d[x, u]) + float(d[y, v]) - float(d[x, y]) - float(d[u, v])
+                         + (backward[j] - backward[i + 1])
+                         - (forward[j] - forward[i + 1]))
+                
+                if delta < -threshold:
+                    tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1]
+                    pos[tour[i + 1:j + 1]] = np.arange(i + 1, j + 1)
+                    forward, backward = _prefix_costs(tour, d)
+                    for node in (x, y, u, v):
+                        if not queued[node]:
+                            queued[node] = True
+                            active.append(node)
+                    moves += 1
+                    improved = True
+                    break
+            if improved:
+                break
+    
+    return tour
+
+
+def or_opt(tour, distance_matrix, neighbours, max_segment=3, eps=1e-9, max_moves=None):
+    """
+    Komşu listeleri ve don't-look bit'leri ile Or-opt yerel arama.
+    
+    Segment yönü korunur, bu nedenle asimetrik matrislerde de kesin çalışır.
+    
+    Args:
+        tour (list): Kapalı tur, başlangıç tekrar edilmeden
+        distance_matrix (np.array): n×n mesafe matrisi
+        neighbours (np.array): (n, k) komşu listeleri
+        max_segment (int): Taşınacak en uzun segment
+        eps (float): Tur uzunluğuna oranla minimum iyileşme
+        max_moves (int): En fazla hamle (varsayılan: MAX_MOVES_PER_NODE × n)
+    
+    Returns:
+        list: İyileştirilmiş tur
+    """
+    d = distance_matrix
+    tour = list(tour)
+    n = len(tour)
+    if n < 4:
+        return tour
+    
+    threshold, max_moves = _move_limits(tour, d, eps, max_moves)
+    pos = np.empty(n, dtype=np.intp)
+    pos[tour] = np.arange(n)
+    
+    active = deque(tour[1:])
+    queued = np.ones(n, dtype=bool)
+    queued[tour[0]] = False
+    moves = 0
+    
+    while active and moves < max_moves:
+        a = active.popleft()
+        queued[a] = False
+        moved = False
+        
+        for length in range(1, max_segment + 1):
+            s = pos[a]
+            if s == 0 or s + length > n:
+                break
+            segment = tour[s:s + length]
+            first, last = segment[0], segment[-1]
+            prev, nxt = tour[s - 1], tour[(s + length) % n]
+            removal_gain = float(d[prev, first]) + float(d[last, nxt]) - float(d[prev, nxt])
+            
+            # Segmenti bir komşunun arkasına ya da önüne yerleştir
+            targets = [(c, tour[(pos[c] + 1) % n]) for c in neighbours[first]]
+            targets += [(tour[pos[c] - 1], c) for c in neighbours[last]]
+            
+            for x, y in targets:
+                if x in segment or y in segment or x == prev:
+                    continue
+                delta = (float(d[x, first]) + float(d[last, y]) - float(d[x, y])
+                         - removal_gain)
+                if delta < -threshold:
+                    rest = tour[:s] + tour[s + length:]
+                    at = rest.index(x) + 1
+                    tour = rest[:at] + segment + rest[at:]
+                    pos[tour] = np.arange(n)
+                    for node in (prev, nxt, x, y, first, last):
+                        if not queued[node] and node != tour[0]:
+                            queued[node] = True
+                            active.append(node)
+                    moves += 1
+                    moved = True
+                    break
+            if moved:
+                break
+    
+    return tour
+
+
+def improve_tour(path, distance_matrix, neighbours, method='2opt+oropt'):
+    """
+    Karıncanın ring rotasını seçilen yerel arama ile iyileştir.
+    
+    Args:
+        path (list): Ring rotası [s, ..., s] (başlangıç sonda tekrar eder)
+        distance_matrix (np.array): n×n mesafe matrisi
+        neighbours (np.array): (n, k) komşu listeleri
+        method (str): '2opt', 'oropt' veya '2opt+oropt'
+    
+    Returns:
+        tuple: (path, total_distance)
+    """
+    tour = [int(node) for node in path[:-1]]
+    
+    if method in ('2opt', '2opt+oropt'):
+        tour = two_opt(tour, distance_matrix, neighbours)
+    if method in ('oropt', '2opt+oropt'):
+        tour = or_opt(tour, distance_matrix, neighbours)
+    
+    return tour + [tour[0]], tour_length(tour, distance_matrix)
@@ -0,0 +1,291 @@
+# 💾 Kalıcı Mesafe Matrisi Önbelleği
+
+"""
+Mesafe matrislerini diskte `.npy` dosyaları olarak sakla ve bellek eşlemeli
+(memory-mapped) olarak geri yükle.
+
+- Anahtar: Koordinatlar + ulaşım modu + birim + kaynak (google_maps / haversine)
+- TTL: Süresi dolan kayıtlar kullanılmaz ve silinir
+- LRU: Kayıt sayısı / toplam boyut sınırı aşılınca en eski erişilen silinir
+- Artımlı: Önbellekte durakların bir kısmı varsa sadece yeni duraklara ait
+  satır ve sütunlar hesaplanır (bir durak eklemek O(n) eleman ister)
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+
+# Koordinat eşleştirmesi için ondalık hassasiyet (~1 cm)
+COORD_DECIMALS = 7
+
+
+def _coord_keys(coords):
+    """Koordinatları yuvarlanmış (lat, lon) demetlerine çevir."""
+    rounded = np.round(np.asarray(coords, dtype=float).reshape(-1, 2), COORD_DECIMALS)
+    return [tuple(row) for row in rounded.tolist()]
+
+
+class DistanceMatrixCache:
+    """
+    Disk üzerinde, boyutu sınırlı LRU mesafe matrisi önbelleği.
+    
+    Kullanım:
+        >>> cache = DistanceMatrixCache(".cache/distance_matrices")
+        >>> matrix = cache.get_or_compute(coords, haversine_matrix,
+        ...                               mode="driving", units="metric")
+    """
+    
+    def __init__(self, cache_dir, ttl=7 * 24 * 3600, max_entries=32, max_bytes=None):
+        """
+        Args:
+            cache_dir (str): Önbellek klasörü
+            ttl (float): Kayıt ömrü (saniye); None ise süresiz
+            max_entries (int): En fazla kayıt sayısı
+            max_bytes (int): Matris dosyalarının toplam boyut sınırı (byte)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, 'index.json')
+    
+    @staticmethod
+    def make_key(coords, mode, units, source):
+        """
+        Durak kümesi ve API ayarlarından önbellek anahtarı üret.
+        
+        Args:
+            coords (np.array): (n, 2) koordinatlar (sıra önemlidir)
+            mode (str): Ulaşım modu
+            units (str): Birim sistemi
+            source (str): Mesafe kaynağı
+        
+        Returns:
+            str: SHA-1 anahtarı
+        """
+        digest = hashlib.sha1()
+        digest.update(json.dumps([mode, units, source]).encode('utf-8'))
+        digest.update(np.round(np.asarray(coords, dtype=float), COORD_DECIMALS).tobytes())
+        return digest.hexdigest()
+    
+    # ----------------------------------------------------------------
+    # İndeks
+    # ----------------------------------------------------------------
+    def _load_index(self):
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self, index):
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path)
+    
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.npy', base + '.coords.npy'
+    
+    def _remove(self, index, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        index.pop(key, None)
+    
+    def _expired(self, entry, now):
+        return self.ttl is not None and now - entry['created'] > self.ttl
+    
+    def _evict(self, index, keep=None):
+        """
+        Süresi dolanları sil, sonra sınırlar aşılıyorsa LRU sırasıyla sil.
+        
+        Args:
+            index (dict): Önbellek indeksi (yerinde güncellenir)
+            keep (str): Hiçbir zaman silinmeyecek anahtar (yeni yazılan kayıt)
+        """
+        now = time.time()
+        for key in [k for k, e in index.items() if self._expired(e, now) and k != keep]:
+            self._remove(index, key)
+        
+        by_access = sorted((k for k in index if k != keep),
+                           key=lambda k: index[k]['accessed'])
+        total = sum(e['bytes'] for e in index.values())
+        while by_access and (
+            (self.max_entries is not None and len(index) > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        ):
+            key = by_access.pop(0)
+            total -= index[key]['bytes']
+            self._remove(index, key)
+    
+    # ----------------------------------------------------------------
+    # Okuma / Yazma
+    # ----------------------------------------------------------------
+    def get(self, coords, mode, units, source):
+        """
+        Tam eşleşen matrisi döndür.
+        
+        Returns:
+            np.memmap: Salt okunur matris veya None
+        """
+        index = self._load_index()
+        key = self.make_key(coords, mode, units, source)
+        entry = index.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry, time.time()):
+            self._remove(index, key)
+            self._save_index(index)
+            return None
+        
+        try:
+            matrix = np.load(self._paths(key)[0], mmap_mode='r')
+        except (OSError, ValueError):
+            self._remove(index, key)
+            self._save_index(index)
+            return None
+        
+        entry['accessed'] = time.time()
+        self._save_index(index)
+        return matrix
+    
+    def put(self, coords, matrix, mode, units, source):
+        """
+        Matrisi önbelleğe yaz ve gerekirse eski kayıtları sil.
+        
+        Returns:
+            np.memmap: Diskteki matrisin salt okunur görünümü. Matris tek
+                başına `max_bytes` sınırını aşıyorsa önbelleğe yazılmaz ve
+                bellekteki dizi döner.
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        if self.max_bytes is not None and matrix.nbytes > self.max_bytes:
+            return matrix
+        
+        index = self._load_index()
+        key = self.make_key(coords, mode, units, source)
+        matrix_path, coords_path = self._paths(key)
+        
+        np.save(matrix_path, matrix)
+        np.save(coords_path, np.asarray(coords, dtype=float))
+        
+        now = time.time()
+        index[key] = {
+            'mode': mode,
+            'units': units,
+            'source': source,
+            'n': len(coords),
+            'created': now,
+            'accessed': now,
+            'bytes': os.path.getsize(matrix_path),
+        }
+        self._evict(index, keep=key)
+        self._save_index(index)
+        return np.load(matrix_path, mmap_mode='r')
+    
+    def _best_overlap(self, coords, mode, units, source):
+        """
+        Aynı ayarlarla kaydedilmiş ve en çok ortak durağa sahip kaydı bul.
+        
+        Returns:
+            tuple: (matrix, new_idx, old_idx) veya None
+                - new_idx: Yeni listede önbellekte bulunan durakların indeksleri
+                - old_idx: Aynı durakların önbellekteki matristeki indeksleri
+        """
+        index = self._load_index()
+        now = time.time()
+        wanted = {c: i for i, c in enumerate(_coord_keys(coords))}
+        
+        best = None
+        for key, entry in index.items():
+            if (entry['mode'], entry['units'], entry['source']) != (mode, units, source):
+                continue
+            if self._expired(entry, now):
+                continue
+            try:
+                cached = _coord_keys(np.load(self._paths(key)[1]))
+            except (OSError, ValueError):
+                continue
+            pairs = [(wanted[c], j) for j, c in enumerate(cached) if c in wanted]
+            if pairs and (best is None or len(pairs) > len(best[1])):
+                best = (key, pairs)
+        
+        if best is None:
+            return None
+        
+        key, pairs = best
+        try:
+            matrix = np.load(self._paths(key)[0], mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        index[key]['accessed'] = now
+        self._save_index(index)
+        
+        new_idx, old_idx = (np.array(idx, dtype=np.intp) for idx in zip(*pairs))
+        return matrix, new_idx, old_idx
+    
+    def compute(self, coords, block_fn, mode, units, source='haversine'):
+        """
+        Matrisi hesapla; aynı ayarlarla kaydedilmiş ortak duraklar önbellekten
+        alınır, sadece eksik satır/sütunlar block_fn ile istenir. Sonuç
+        önbelleğe yazılmaz (bkz. put()).
+        
+        Args:
+            coords (np.array): (n, 2) koordinatlar
+            block_fn (func): block_fn(origins, destinations) -> (m, k) mesafeler
+            mode (str): Ulaşım modu
+            units (str): Birim sistemi
+            source (str): Mesafe kaynağı ('google_maps', 'haversine')
+        
+        Returns:
+            np.array: n×n mesafe matrisi (bellekte)
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        n = len(coords)
+        overlap = self._best_overlap(coords, mode, units, source)
+        
+        if overlap is None:
+            return np.asarray(block_fn(coords, coords), dtype=float)
+        
+        cached, new_idx, old_idx = overlap
+        matrix = np.empty((n, n))
+        matrix[np.ix_(new_idx, new_idx)] = cached[np.ix_(old_idx, old_idx)]
+        
+        # Sadece yeni duraklara ait satır ve sütunlar
+        missing = np.setdiff1d(np.arange(n), new_idx)
+        if len(missing) > 0:
+            matrix[missing, :] = block_fn(coords[missing], coords)
+            matrix[np.ix_(new_idx, missing)] = block_fn(coords[new_idx], coords[missing])
+        return matrix
+    
+    def get_or_compute(self, coords, block_fn, mode, units, source='haversine'):
+        """
+        Matrisi önbellekten al; yoksa sadece eksik satır/sütunları hesapla.
+        
+        Args:
+            coords (np.array): (n, 2) koordinatlar
+            block_fn (func): block_fn(origins, destinations) -> (m, k) mesafeler
+            mode (str): Ulaşım modu
+            units (str): Birim sistemi
+            source (str): Mesafe kaynağı ('google_maps', 'haversine')
+        
+        Returns:
+            np.memmap: n×n mesafe matrisi (salt okunur)
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        
+        matrix = self.get(coords, mode, units, source)
+        if matrix is not None:
+            return matrix
+        
+        matrix = self.compute(coords, block_fn, mode, units, source)
+        return self.put(coords, matrix, mode, units, source)
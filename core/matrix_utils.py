@@ -2,28 +2,148 @@
 
 """
 Google Maps API ve Haversine fallback ile mesafe matrisi oluştur.
+
+Streamlit'e bağımlı değildir; arayüz bildirimleri status_callback ve
+progress_callback ile dışarıdan verilir (main.py Streamlit fonksiyonlarını,
+core.cli konsol çıktısını bağlar).
+
+Çok büyük örnekler için matris diskte float32 `.npy` dosyasına yazılıp bellek
+eşlemeli (memmap) açılabilir; aynı dosyayı açan süreçler kopyasız paylaşır.
 """
 
 import numpy as np
-import googlemaps
-import streamlit as st
+from config import GOOGLE_MAPS_CONFIG, HAVERSINE_MULTIPLIER
+from core.distance_api import BatchedDistanceMatrix, get_client
 from core.haversine import calculate_distance_matrix as haversine_matrix
+from core.haversine import haversine_matrix as haversine_block
+
+
+def distance_block_fn(batcher=None, progress_callback=None):
+    """
+    Başlangıç × varış blokları için mesafe fonksiyonu oluştur.
+    
+    DistanceMatrix (artımlı güncelleme) ve önbellek, mesafeleri bu fonksiyon
+    üzerinden sadece gereken satır/sütunlar için ister.
+    
+    Args:
+        batcher (BatchedDistanceMatrix): Google Maps toplu istemcisi; None ise Haversine
+        progress_callback (func): İlerleme (0-1) bildirimi
+    
+    Returns:
+        func: block_fn(origins, destinations) -> (m, k) mesafe matrisi
+    """
+    if batcher is None:
+        return haversine_block
+    
+    def fetch_block(origins, destinations):
+        block = batcher.fetch(origins, destinations, progress_callback=progress_callback)
+        # Fallback: alınamayan elemanlar
+        missing = np.isnan(block)
+        if missing.any():
+            block[missing] = haversine_block(origins, destinations)[missing]
+        return block
+    
+    return fetch_block
+
+
+def open_distance_memmap(path):
+    """
+    Disk üzerindeki mesafe matrisini kopyalamadan, salt okunur aç.
+    
+    Satırlar erişildikçe diskten okunur; aynı dosyayı açan süreçler işletim
+    sisteminin sayfa önbelleğini paylaşır.
+    
+    Args:
+        path (str): write_distance_memmap() ile yazılmış .npy dosyası
+    
+    Returns:
+        np.memmap: n×n mesafe matrisi
+    """
+    return np.load(path, mmap_mode='r')
+
+
+def memmap_dtype(file_dtype, dtype=None):
+    """
+    Paylaşılan mesafe dosyasını kopyasız kullanacak optimizer'ın veri tipi.
+    
+    İşçi süreçler dosyayı farklı bir tipe çevirirse her biri n×n boyutunda
+    tam bir kopya tutar; bu yüzden tip dosyadan alınır, uyuşmazlık hatadır.
+    
+    Args:
+        file_dtype (np.dtype): Dosyadaki matrisin tipi
+        dtype (str): İstenen tip (None: dosyanın tipi)
+    
+    Returns:
+        str: Optimizer'a verilecek dtype
+    
+    Raises:
+        ValueError: İstenen tip dosyanınkiyle uyuşmuyorsa
+    """
+    file_dtype = np.dtype(file_dtype)
+    if dtype is not None and np.dtype(dtype) != file_dtype:
+        raise ValueError(f"Mesafe dosyası {file_dtype.name} fakat dtype={np.dtype(dtype).name} "
+                         "istendi; her süreç tam bir kopya tutardı (dtype'ı dosyayla "
+                         "aynı verin veya boş bırakın)")
+    return file_dtype.name
 
 
-def get_distance_matrix(locations, api_key=None):
+def write_distance_memmap(path, coords, block_fn, chunk_size=1024):
+    """
+    Mesafe matrisini satır blokları halinde .npy dosyasına yaz (float32, satır öncelikli).
+    
+    Matrisin tamamı hiçbir zaman bellekte tutulmaz; her seferde sadece
+    chunk_size × n boyutunda bir blok hesaplanır.
+    
+    Args:
+        path (str): Hedef .npy dosyası
+        coords (np.array): (n, 2) koordinatlar
+        block_fn (func): block_fn(origins, destinations) -> (m, k) mesafeler
+        chunk_size (int): Blok başına satır sayısı
+    
+    Returns:
+        np.memmap: Salt okunur n×n float32 matris
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+    n = len(coords)
+    matrix = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(n, n))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        block = np.asarray(block_fn(coords[start:stop], coords), dtype=np.float32)
+        block[np.arange(stop - start), np.arange(start, stop)] = 0.0  # Köşegen
+        matrix[start:stop] = block
+    matrix.flush()
+    del matrix
+    return open_distance_memmap(path)
+
+
+def get_distance_matrix(locations, api_key=None, client=None, cache=None,
+                        status_callback=None, progress_callback=None,
+                        memmap_path=None):
     """
     Google Maps Distance Matrix API veya Haversine ile mesafe matrisi oluştur.
     
     Args:
         locations (dict): {Durak Adı: [Lat, Lon], ...}
         api_key (str): Google Maps API Key (optional)
+        client: Hazır Distance Matrix istemcisi (optional, örn. test için sahte
+            istemci). Verilirse api_key yerine kullanılır.
+        cache (DistanceMatrixCache): Kalıcı disk önbelleği (optional)
+        status_callback (func): status_callback(level, message) durum bildirimi;
+            level: 'success', 'warning' veya 'info' (optional)
+        progress_callback (func): API isteklerinin ilerlemesi (0-1) (optional)
+        memmap_path (str): Verilirse matris bu .npy dosyasına blok blok yazılır
+            ve np.memmap olarak döner (float32); önbellek kullanılmaz (optional)
     
     Returns:
         tuple: (distance_matrix, stop_names, coordinates_array)
     
     Açıklama:
         1. API Key varsa: Google Maps Distance Matrix API (gerçek sürüş mesafesi)
+           Matris 25×4 / 10×10 gibi en büyük bloklar halinde istenir
+           (n² yerine ~n²/100 istek); alınamayan elemanlar Haversine ile doldurulur.
         2. API Key yoksa: Haversine formülü (kuş uçuşu × 1.35)
+        3. Önbellek verilmişse: Aynı durak kümesi için API'ye hiç gidilmez;
+           sadece yeni eklenen durakların satır/sütunları hesaplanır.
     """
     
     names = list(locations.keys())
@@ -31,57 +151,68 @@ def get_distance_matrix(locations, api_key=None):
     n = len(names)
     matrix = np.zeros((n, n))
     api_connected = False
+    use_api = bool(api_key) or client is not None
+    mode = GOOGLE_MAPS_CONFIG['mode']
+    units = GOOGLE_MAPS_CONFIG['units']
+    haversine_source = f"haversine_{HAVERSINE_MULTIPLIER}"
+    notify = status_callback or (lambda level, message: None)
+    
+    # Bellek eşlemeli matris: dosyanın kendisi kalıcı kayıttır
+    if memmap_path is not None:
+        cache = None
+
+    # Önbellek: tam eşleşme varsa hesaplama / API isteği yok
+    if cache is not None:
+        source = 'google_maps' if use_api else haversine_source
+        cached = cache.get(coords, mode, units, source)
+        if cached is not None:
+            return cached, names, coords
 
     # Google Maps API Denemesi
-    if api_key:
+    if use_api:
         try:
-            gmaps = googlemaps.Client(key=api_key)
+            if client is None:
+                client = get_client(api_key, GOOGLE_MAPS_CONFIG['timeout'])
+            batcher = BatchedDistanceMatrix(client, mode=mode, units=units)
             
             # API test et
-            _ = gmaps.distance_matrix(
-                origins=[(coords[0][0], coords[0][1])],
-                destinations=[(coords[1][0], coords[1][1])],
-                mode='driving',
-                units='metric'
-            )
+            _ = batcher.request(coords[:1], coords[:1])
             api_connected = True
-            st.sidebar.success("✅ Google Maps API Bağlantısı Aktif")
+            notify('success', "✅ Google Maps API Bağlantısı Aktif")
+            
+            # Mesafe matrisini API ile blok blok doldur
+            fetch_block = distance_block_fn(batcher, progress_callback)
+            
+            if memmap_path is not None:
+                matrix = write_distance_memmap(memmap_path, coords, fetch_block)
+            elif cache is not None:
+                matrix = cache.compute(coords, fetch_block, mode, units,
+                                       source='google_maps')
+            else:
+                matrix = fetch_block(coords, coords)
+                np.fill_diagonal(matrix, 0)
+            
+            # Haversine ile doldurulan elemanlar varsa matris saf Google Maps
+            # verisi değildir: 'google_maps' kaynağıyla önbelleğe yazılmaz
+            if batcher.n_missing > 0:
+                notify('warning', f"⚠️ {batcher.n_missing} mesafe Google Maps'ten "
+                                  "alınamadı, Haversine ile dolduruldu")
+            elif cache is not None:
+                matrix = cache.put(coords, matrix, mode, units, source='google_maps')
             
-            # Mesafe matrisini API ile doldur
-            progress = st.progress(0)
-            for i in range(n):
-                for j in range(n):
-                    if i == j:
-                        matrix[i][j] = 0
-                    elif matrix[j][i] > 0:
-                        matrix[i][j] = matrix[j][i]
-                    else:
-                        try:
-                            result = gmaps.distance_matrix(
-                                origins=[(coords[i][0], coords[i][1])],
-                                destinations=[(coords[j][0], coords[j][1])],
-                                mode='driving',
-                                units='metric'
-                            )
-                            if result['status'] == 'OK':
-                                dist_meters = result['rows'][0]['elements'][0]['distance']['value']
-                                matrix[i][j] = dist_meters
-                            else:
-                                # Fallback
-                                from core.haversine import haversine_distance
-                                matrix[i][j] = haversine_distance(coords[i], coords[j])
-                        except:
-                            from core.haversine import haversine_distance
-                            matrix[i][j] = haversine_distance(coords[i], coords[j])
-                progress.progress((i + 1) / n)
-                
         except Exception as e:
-            st.sidebar.warning(f"⚠️ API Hata: {str(e)}")
-            st.sidebar.info("📍 Haversine formülü kullanılıyor...")
+            notify('warning', f"⚠️ API Hata: {str(e)}")
+            notify('info', "📍 Haversine formülü kullanılıyor...")
             api_key = None
 
     # Haversine Fallback
     if not api_connected:
-        matrix, names, coords = haversine_matrix(locations)
+        if memmap_path is not None:
+            matrix = write_distance_memmap(memmap_path, coords, haversine_block)
+        elif cache is not None:
+            matrix = cache.get_or_compute(coords, haversine_block, mode, units,
+                                          source=haversine_source)
+        else:
+            matrix, names, coords = haversine_matrix(locations)
 
     return matrix, names, coords
@@ -0,0 +1,349 @@
+# 🚌 Çok Araçlı Ring Seferi (CVRP)
+
+"""
+Durakları K araç (ring) arasında paylaştıran ACO.
+
+Dev tur (giant tour) gösterimi kullanılır: depo K-1 kez kopyalanır ve
+karıncalar n + K - 1 düğümlük tek bir tur kurar. Her depo kopyası yeni bir
+aracın rotasını başlatır:
+    
+    [D, a, b, D'1, c, d, D'2, e, D]  →  [D, a, b, D], [D, c, d, D], [D, e, D]
+
+Böylece AntColonyOptimizer'ın feromon modeli, rota oluşturma modları
+(sıralı / vektörel / numba) ve aday listeleri aynen kullanılır.
+
+- Değerlendirme: Tüm karıncaların araç başı rota uzunlukları ve yükleri
+  np.bincount ile tek seferde (vektörel) hesaplanır.
+- Kapasite: Rota oluşturulurken kalan kapasiteyi aşan duraklar maskelenir,
+  araç dolunca karınca yeni araca geçer; bu durumda oluşturma her zaman
+  vektörel yapılır.
+- Kısıt ihlalleri (kapasite, en uzun ring sınırı) ceza olarak maliyete
+  eklenir (cost × (1 + ceza × göreli ihlal)); ihlalli turlar daha az feromon
+  bırakır.
+- Yerel arama: Her aracın ringi kendi içinde iyileştirilir (yükler değişmez).
+"""
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.local_search import improve_tour
+
+
+class MultiVehicleOptimizer(AntColonyOptimizer):
+    """
+    K araçlı, isteğe bağlı kapasite ve ring uzunluğu kısıtlı ring seferi ACO'su.
+    
+    Kullanım:
+        >>> optimizer = MultiVehicleOptimizer(dist_matrix, n_vehicles=3, depot=0,
+        ...                                   max_ring_length=4000, n_iterations=200)
+        >>> routes, cost, best_distances, avg_distances = optimizer.solve()
+        >>> optimizer.route_lengths, optimizer.feasible
+    """
+    
+    def __init__(self, distance_matrix, n_vehicles=2, depot=0, demands=None,
+                 capacity=None, max_ring_length=None, objective='total',
+                 penalty=10.0, **aco_params):
+        """
+        Args:
+            distance_matrix (np.array): n×n mesafe matrisi
+            n_vehicles (int): Araç (ring) sayısı
+            depot (int): Tüm ringlerin başladığı / bittiği durak
+            demands (list): Durak başına talep (yolcu); None ise her durak 1
+            capacity (float): Araç kapasitesi (optional)
+            max_ring_length (float): Bir ringin en fazla uzunluğu (optional)
+            objective (str): 'total' (toplam mesafe) veya 'longest' (en uzun ring,
+                yolcu bekleme süresini dengelemek için)
+            penalty (float): Göreli kısıt ihlali başına maliyet çarpanı
+            **aco_params: AntColonyOptimizer parametreleri
+        """
+        base = np.asarray(distance_matrix, dtype=float)
+        n = len(base)
+        
+        if n_vehicles < 1:
+            raise ValueError(f"Araç sayısı en az 1 olmalı: {n_vehicles}")
+        if not 0 <= depot < n:
+            raise ValueError(f"Geçersiz depo indeksi: {depot}")
+        if objective not in ('total', 'longest'):
+            raise ValueError(f"Geçersiz amaç fonksiyonu: {objective}")
+        
+        if demands is None:
+            demands = np.ones(n)
+        demands = np.asarray(demands, dtype=float)
+        if demands.shape != (n,):
+            raise ValueError("Talep sayısı durak sayısı ile uyuşmuyor")
+        
+        self.base_matrix = base
+        self.n_stops = n
+        self.n_vehicles = n_vehicles
+        self.depot = depot
+        self.capacity = capacity
+        self.max_ring_length = max_ring_length
+        self.objective = objective
+        self.penalty = penalty
+        
+        # Genişletilmiş düğümler: 0..n-1 duraklar, n..n+K-2 depo kopyaları
+        self.node_map = np.concatenate((np.arange(n), np.full(n_vehicles - 1, depot)))
+        self.is_copy = np.arange(len(self.node_map)) >= n
+        self.node_demands = np.where(self.node_map == depot, 0.0, demands[self.node_map])
+        self.node_demands[n:] = 0.0
+        
+        super().__init__(self._expand(base, depot, n_vehicles), **aco_params)
+        
+        # Aday listeleri: her durak herhangi bir depo kopyasına dönebilmeli
+        if self.candidate_lists is not None and n_vehicles > 1:
+            self.candidate_lists = self._with_depot_copies(self.candidate_lists)
+            if self.pheromone_storage == 'sparse':
+                # Seyrek η^β aday listesine hizalıdır: yeni adaylarla yeniden hesapla
+                self.eta_beta = self._heuristic_matrix()
+                self._refresh_choice_info()
+        
+        self.best_routes = None
+        self.route_lengths = None
+        self.route_loads = None
+        self.feasible = None
+    
+    @staticmethod
+    def _expand(base, depot, n_vehicles):
+        """
+        Depo kopyaları ile genişletilmiş mesafe matrisi.
+        
+        Depo ve kopyaları arasındaki kenarlar sonsuz uzunluktadır (η = 0);
+        karıncalar boş ring oluşturmaya yönlendirilmez.
+        """
+        n = len(base)
+        size = n + n_vehicles - 1
+        expanded = np.empty((size, size))
+        expanded[:n, :n] = base
+        expanded[n:, :n] = base[depot]
+        expanded[:n, n:] = base[:, depot][:, None]
+        
+        depots = np.concatenate(([depot], np.arange(n, size)))
+        expanded[np.ix_(depots, depots)] = np.inf
+        np.fill_diagonal(expanded, 0.0)
+        return expanded
+    
+    def _with_depot_copies(self, candidates):
+        """
+        Aday listelerinin son K-1 elemanını depo kopyalarıyla değiştir.
+        
+        Kopyalar depoya eşit uzaklıkta olduğundan en yakın komşular arasına
+        nadiren girer; eklenmezlerse ringler sadece depo yakınında bölünebilir.
+        """
+        copies = np.flatnonzero(self.is_copy)
+        keep = max(candidates.shape[1] - len(copies), 0)
+        # Kopya olmayanlar öne (sıra korunur)
+        order = np.argsort(self.is_copy[candidates], axis=1, kind='stable')
+        kept = np.take_along_axis(candidates, order, axis=1)[:, :keep]
+        return np.hstack((kept, np.broadcast_to(copies, (len(candidates), len(copies)))))
+    
+    # ----------------------------------------------------------------
+    # Değerlendirme
+    # ----------------------------------------------------------------
+    def _evaluate(self, paths):
+        """
+        Dev turların araç başı uzunluk / yük değerlerini toplu hesapla.
+        
+        Args:
+            paths (np.array): (m, n+K) genişletilmiş düğüm indeksleri
+        
+        Returns:
+            dict: lengths (m, K), loads (m, K), violation (m,), cost (m,)
+        """
+        m, k = len(paths), self.n_vehicles
+        mapped = self.node_map[paths]
+        edges = self.base_matrix[mapped[:, :-1], mapped[:, 1:]]
+        
+        # Kenar j'nin aracı: 0..j konumlarındaki depo kopyası sayısı
+        vehicle = np.cumsum(self.is_copy[paths[:, :-1]], axis=1)
+        flat = (np.arange(m)[:, None] * k + vehicle).ravel()
+        lengths = np.bincount(flat, weights=edges.ravel(), minlength=m * k).reshape(m, k)
+        loads = np.bincount(flat, weights=self.node_demands[paths[:, 1:]].ravel(),
+                            minlength=m * k).reshape(m, k)
+        
+        violation = np.zeros(m)
+        if self.capacity is not None:
+            violation += np.clip(loads - self.capacity, 0, None).sum(axis=1) / self.capacity
+        if self.max_ring_length is not None:
+            violation += (np.clip(lengths - self.max_ring_length, 0, None).sum(axis=1)
+                          / self.max_ring_length)
+        
+        if self.objective == 'total':
+            cost = lengths.sum(axis=1)
+        else:
+            cost = lengths.max(axis=1)
+        cost = cost * (1 + self.penalty * violation)
+        
+        return {'lengths': lengths, 'loads': loads, 'violation': violation, 'cost': cost}
+    
+    def _build_paths_vectorized(self, start_node):
+        """
+        Kapasite farkında vektörel rota oluşturma.
+        
+        Her karıncanın mevcut aracının yükü izlenir; talebi kalan kapasiteyi
+        aşan duraklar maskelenir. Araca sığan durak kalmayınca karınca bir depo
+        kopyasına (yeni araca) geçer. Seçilebilir düğüm kalmazsa (depo
+        kopyaları bitti) maske kaldırılır ve ihlal ceza ile değerlendirilir.
+        Seçim kuralı stratejiye göredir (ACS: q0 kuralı ve yerel güncelleme).
+        """
+        if self.capacity is None:
+            return super()._build_paths_vectorized(start_node)
+        
+        n = self.n_points
+        rows = np.arange(self.n_ants)
+        
+        paths = np.empty((self.n_ants, n + 1), dtype=np.intp)
+        paths[:, 0] = start_node
+        paths[:, -1] = start_node
+        
+        visited = np.zeros((self.n_ants, n), dtype=bool)
+        visited[:, start_node] = True
+        current = paths[:, 0].copy()
+        load = np.zeros(self.n_ants)
+        
+        for step in range(1, n):
+            blocked = visited | (load[:, None] + self.node_demands > self.capacity)
+            # Yeni araca sadece mevcut araca sığan durak kalmayınca geç
+            fits = (~blocked & ~self.is_copy).any(axis=1)
+            blocked |= fits[:, None] & self.is_copy
+            stuck = blocked.all(axis=1)
+            if stuck.any():
+                blocked[stuck] = visited[stuck]
+            
+            draws = self.rng.random(self.n_ants)
+            next_nodes = self._choose_next(current, blocked, draws)
+            
+            paths[:, step] = next_nodes
+            visited[rows, next_nodes] = True
+            load = np.where(self.is_copy[next_nodes], 0.0, load + self.node_demands[next_nodes])
+            current = next_nodes
+        
+        if self.strategy == 'acs':
+            self._local_update(current, paths[:, -1])
+        
+        distances = self.distance_matrix[paths[:, :-1], paths[:, 1:]].sum(axis=1)
+        return paths, distances
+    
+    def _construct_solutions(self, start_node):
+        # Kapasite kısıtı sadece vektörel oluşturmada maskelenir
+        if self.capacity is not None:
+            paths, _ = self._build_paths_vectorized(start_node)
+            all_paths = paths.tolist()
+        else:
+            all_paths, _ = super()._construct_solutions(start_node)
+        costs = self._evaluate(np.asarray(all_paths, dtype=np.intp))['cost']
+        return all_paths, costs.tolist()
+    
+    # ----------------------------------------------------------------
+    # Rota dönüşümleri
+    # ----------------------------------------------------------------
+    def split_routes(self, path):
+        """
+        Dev turu araç ringlerine ayır.
+        
+        Args:
+            path (list): Genişletilmiş düğümlerle dev tur [D, ..., D]
+        
+        Returns:
+            list: K ring, her biri orijinal indekslerle [D, ..., D]
+                (kullanılmayan araç için [D, D])
+        """
+        routes = [[self.depot]]
+        for node in path[1:-1]:
+            if self.is_copy[node]:
+                routes[-1].append(self.depot)
+                routes.append([self.depot])
+            else:
+                routes[-1].append(int(node))
+        routes[-1].append(self.depot)
+        return routes
+    
+    def join_routes(self, routes):
+        """
+        Araç ringlerini dev tura çevir (split_routes'un tersi).
+        
+        Args:
+            routes (list): K ring, her biri [D, ..., D]
+        
+        Returns:
+            list: Genişletilmiş düğümlerle dev tur
+        """
+        path = [self.depot]
+        for vehicle, route in enumerate(routes):
+            if vehicle > 0:
+                path.append(self.n_stops + vehicle - 1)
+            path.extend(int(node) for node in route[1:-1])
+        path.append(self.depot)
+        return path
+    
+    def _improve_route(self, route):
+        """Tek bir ringi kendi alt matrisi üzerinde yerel arama ile iyileştir."""
+        nodes = np.asarray(route[:-1], dtype=np.intp)
+        size = len(nodes)
+        if size < 4:
+            return route
+        
+        sub = self.base_matrix[np.ix_(nodes, nodes)]
+        masked = sub + np.diag(np.full(size, np.inf))
+        neighbours = np.argsort(masked, axis=1)[:, :min(10, size - 1)]
+        
+        local_path, _ = improve_tour(list(range(size)) + [0], sub, neighbours,
+                                     self.local_search)
+        return [int(nodes[i]) for i in local_path]
+    
+    def _apply_local_search(self, all_paths, all_distances):
+        """
+        Her aracın ringini ayrı ayrı iyileştir (depo atamaları ve yükler korunur).
+        
+        Returns:
+            int: İyileştirilen tur sayısı
+        """
+        if self.local_search_scope == 'best':
+            targets = [int(np.argmin(all_distances))]
+        else:
+            targets = range(len(all_paths))
+        
+        improved = 0
+        for k in targets:
+            routes = [self._improve_route(route) for route in self.split_routes(all_paths[k])]
+            path = self.join_routes(routes)
+            cost = float(self._evaluate(np.asarray([path], dtype=np.intp))['cost'][0])
+            if cost < all_distances[k]:
+                all_paths[k] = path
+                all_distances[k] = cost
+                improved += 1
+        return improved
+    
+    # ----------------------------------------------------------------
+    # Çözüm
+    # ----------------------------------------------------------------
+    def solve(self, start_node=None, progress_callback=None, hooks=None,
+              collect_stats=False):
+        """
+        K araç için ring rotalarını bul.
+        
+        Args:
+            start_node (int): Verilirse depo ile aynı olmalıdır
+            progress_callback (func): Progress güncelleme fonksiyonu
+            hooks (list): SolveHook nesneleri
+            collect_stats (bool): Ölçümleri topla
+        
+        Returns:
+            tuple: (best_routes, best_cost, best_distances, avg_distances)
+                Araç başı uzunluk / yük `route_lengths`, `route_loads`;
+                kısıtların sağlanıp sağlanmadığı `feasible` özelliğindedir.
+        """
+        if start_node is not None and start_node != self.depot:
+            raise ValueError("Çok araçlı modda ringler depodan başlar (start_node = depot)")
+        
+        _, best_cost, best_distances, avg_distances = super().solve(
+            start_node=self.depot, progress_callback=progress_callback,
+            hooks=hooks, collect_stats=collect_stats
+        )
+        
+        evaluation = self._evaluate(np.asarray([self.best_path], dtype=np.intp))
+        self.best_routes = self.split_routes(self.best_path)
+        self.route_lengths = evaluation['lengths'][0].tolist()
+        self.route_loads = evaluation['loads'][0].tolist()
+        self.feasible = bool(evaluation['violation'][0] == 0)
+        
+        return self.best_routes, best_cost, best_distances, avg_distances
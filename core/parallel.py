@@ -0,0 +1,353 @@
+# 🏝️ Paralel Koloniler (Ada Modeli)
+
+"""
+Birbirinden bağımsız karınca kolonilerini ayrı süreçlerde (process) çalıştır.
+Adalar belirli aralıklarla en iyi turlarını ve feromonlarını paylaşır (göç).
+
+Mesafe matrisi ve adaların feromon matrisleri paylaşımlı bellekte
+(shared memory) tutulur; süreçlere kopyalanmaz. Mesafe matrisi diskte bir
+.npy dosyasına eşlenmişse (np.memmap) süreçler aynı dosyayı açar.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.matrix_utils import memmap_dtype, open_distance_memmap
+
+
+# Süreç başına açılmış paylaşımlı bellek blokları ve ada optimizer'ları
+_ATTACHED = {}
+_ISLANDS = {}
+
+# Ada modeli seviyesinde (tüm adalar için birlikte) değerlendirilen kriterler
+_TERMINATION_PARAMS = ('stagnation_limit', 'target_distance', 'time_limit',
+                       'branching_threshold')
+
+
+def _attach(name, shape, dtype=np.float64):
+    """
+    Paylaşımlı bellek bloğuna bağlan ve NumPy görünümü döndür.
+    
+    Args:
+        name (str): Paylaşımlı bellek adı
+        shape (tuple): Dizi boyutu
+        dtype (np.dtype): Eleman tipi
+    
+    Returns:
+        np.array: Kopyasız görünüm
+    """
+    if name not in _ATTACHED:
+        _ATTACHED[name] = shared_memory.SharedMemory(name=name)
+    return np.ndarray(shape, dtype=dtype, buffer=_ATTACHED[name].buf)
+
+
+def _run_island_epoch(task):
+    """
+    Tek bir adayı `iterations` iterasyon boyunca çalıştır (alt süreçte).
+    
+    Args:
+        task (dict): Ada, paylaşımlı bellek ve ACO parametreleri
+    
+    Returns:
+        dict: best_path, best_distance, best_distances, avg_distances,
+            branching_factor
+    """
+    n = task['n_points']
+    if task['distance_path'] is not None:
+        # dtype __init__'te dosyanın tipine eşitlendi: optimizer eşlemeyi
+        # kopyalamadan okur
+        distance_matrix = open_distance_memmap(task['distance_path'])
+    else:
+        distance_matrix = _attach(task['distance_name'], (n, n), task['dtype'])
+    pheromones = _attach(task['pheromone_name'], (task['n_islands'], n, n), task['dtype'])
+    
+    key = (task['pheromone_name'], task['island'])
+    optimizer = _ISLANDS.get(key)
+    if optimizer is None:
+        optimizer = AntColonyOptimizer(distance_matrix, **task['params'])
+        _ISLANDS[key] = optimizer
+    
+    # İlk epoch: stratejinin başlangıç feromonu (AS: pheromone_init,
+    # MMAS: τ_max, ACS: τ0) ada optimizer'ının hesapladığı değerden alınır
+    if task['first_epoch']:
+        pheromones[task['island']] = optimizer.tau_init
+    
+    # Ada durumunu yükle: feromon paylaşımlı bellekte yerinde güncellenir
+    optimizer.set_pheromone(pheromones[task['island']])
+    optimizer.n_iterations = task['iterations']
+    optimizer.best_path = task['best_path']
+    optimizer.best_distance = task['best_distance']
+    optimizer.best_distances = []
+    optimizer.avg_distances = []
+    
+    optimizer.rng = np.random.default_rng(task['seed'])
+    best_path, best_distance, best_distances, avg_distances = optimizer.solve(
+        start_node=task['start_node']
+    )
+    
+    return {
+        'best_path': [int(node) for node in best_path],
+        'best_distance': float(best_distance),
+        'best_distances': [float(d) for d in best_distances],
+        'avg_distances': [float(d) for d in avg_distances],
+        'branching_factor': optimizer.branching_factor(),
+    }
+
+
+class IslandColonyOptimizer:
+    """
+    Ada modeli (Island Model) ile paralel Karınca Kolonisi Algoritması.
+    
+    İşleyiş:
+        1. Her ada bağımsız bir AntColonyOptimizer'dır (ayrı süreç)
+        2. Adalar `migration_interval` iterasyon boyunca bağımsız çalışır
+        3. Göç: Her ada, halka topolojisindeki komşusunun en iyi turunu alır
+           ve bu tur boyunca feromon bırakır
+        4. İstenirse feromon matrisleri komşu ile harmanlanır
+        5. Sonuçlar tek bir yakınsama geçmişinde birleştirilir
+    
+    Erken durdurma kriterleri adalara iletilmez; ada modeli seviyesinde her
+    göç sonrasında değerlendirilir ve tüm adalar birlikte durur.
+    """
+    
+    def __init__(self, distance_matrix, n_islands=None, migration_interval=10,
+                 migration_weight=1.0, pheromone_blend=0.0, max_workers=None,
+                 seed=None, **aco_params):
+        """
+        Ada modelini başlat.
+        
+        Args:
+            distance_matrix (np.array): n×n mesafe matrisi; .npy dosyasına
+                eşlenmiş np.memmap ise paylaşımlı belleğe kopyalanmaz ve dtype
+                verilmezse dosyanın tipi kullanılır (farklı bir dtype ValueError)
+            n_islands (int): Ada (koloni) sayısı (varsayılan: CPU sayısı)
+            migration_interval (int): Kaç iterasyonda bir göç yapılacağı
+            migration_weight (float): Göç eden tura bırakılacak feromon çarpanı
+            pheromone_blend (float): Komşu adanın feromonuyla harmanlama oranı (0-1)
+            max_workers (int): Süreç havuzu boyutu (varsayılan: n_islands)
+            seed (int): Tekrarlanabilirlik için tohum
+            **aco_params: AntColonyOptimizer parametreleri (n_ants, n_iterations, ...)
+                Mesafe ve feromon matrisleri `dtype` parametresinin tipinde
+                paylaşılır; seyrek feromon desteklenmez. stagnation_limit,
+                target_distance, time_limit ve branching_threshold tüm adalar
+                için birlikte, göç aralıklarında kontrol edilir (durma en geç
+                epoch sonunda gerçekleşir). Durgunluk birleşik geçmişin
+                iterasyonları üzerinden sayılır; converged için tüm adaların
+                dallanma faktörü eşiğin altında olmalıdır.
+        """
+        if aco_params.get('pheromone_storage', 'dense') != 'dense':
+            raise ValueError("Ada modeli sadece yoğun (dense) feromon ile çalışır")
+        
+        self.dtype = np.dtype(aco_params.get('dtype', 'float64'))
+        filename = getattr(distance_matrix, 'filename', None)
+        if isinstance(distance_matrix, np.memmap) and str(filename).endswith('.npy'):
+            # Süreçler dosyayı farklı tipe çevirirse her biri tam kopya tutar
+            self.dtype = np.dtype(memmap_dtype(distance_matrix.dtype, aco_params.get('dtype')))
+            aco_params['dtype'] = self.dtype.name
+            self.distance_matrix = distance_matrix
+            self.distance_path = str(filename)
+        else:
+            self.distance_matrix = np.ascontiguousarray(distance_matrix, dtype=self.dtype)
+            self.distance_path = None
+        self.n_points = len(self.distance_matrix)
+        self.n_islands = n_islands or os.cpu_count() or 1
+        self.migration_interval = max(1, int(migration_interval))
+        self.migration_weight = migration_weight
+        self.pheromone_blend = pheromone_blend
+        self.max_workers = max_workers or self.n_islands
+        self.seed = seed
+        
+        self.aco_params = dict(aco_params)
+        self.n_iterations = self.aco_params.pop('n_iterations', 100)
+        for name in _TERMINATION_PARAMS:
+            setattr(self, name, self.aco_params.pop(name, None))
+        
+        self.best_path = None
+        self.best_distance = float('inf')
+        self.best_distances = []
+        self.avg_distances = []
+        self.island_histories = []
+        
+        # Son solve() çağrısının özeti
+        self.stop_reason = None
+        self.iterations_run = 0
+    
+    def _migrate(self, pheromones, results):
+        """
+        Halka topolojisinde göç: i. ada, (i-1). adanın en iyi turunu alır.
+        
+        Args:
+            pheromones (np.array): (n_islands, n, n) paylaşımlı feromon görünümü
+            results (list): Adaların epoch sonuçları
+        """
+        if self.n_islands < 2:
+            return
+        
+        # Göç edenlerin kopyası: döngüde güncellenen sonuç bir sonraki adaya
+        # aktarılmasın (her ada sadece komşusunun kendi turunu alır)
+        incoming = [dict(results[i - 1]) for i in range(self.n_islands)]
+        snapshot = pheromones.copy() if self.pheromone_blend > 0 else None
+        
+        for island, migrant in enumerate(incoming):
+            if self.pheromone_blend > 0:
+                pheromones[island] *= (1 - self.pheromone_blend)
+                pheromones[island] += self.pheromone_blend * snapshot[island - 1]
+            
+            path = np.asarray(migrant['best_path'], dtype=np.intp)
+            amount = self.migration_weight / migrant['best_distance']
+            np.add.at(pheromones[island], (path[:-1], path[1:]), amount)
+            
+            if migrant['best_distance'] < results[island]['best_distance']:
+                results[island]['best_path'] = list(migrant['best_path'])
+                results[island]['best_distance'] = migrant['best_distance']
+    
+    def _termination_reason(self, results, since_improvement, started):
+        """
+        Ada modeli seviyesinde erken durdurma kriterlerini kontrol et.
+        
+        Args:
+            results (list): Adaların son epoch sonuçları
+            since_improvement (int): Birleşik en iyinin son iyileşmesinden bu
+                yana geçen iterasyon
+            started (float): solve() başlangıç zamanı (perf_counter)
+        
+        Returns:
+            str: Sonlandırma nedeni veya None (AntColonyOptimizer ile aynı değerler)
+        """
+        if self.target_distance is not None and self.best_distance <= self.target_distance:
+            return 'target'
+        if self.stagnation_limit is not None and since_improvement >= self.stagnation_limit:
+            return 'stagnation'
+        if self.time_limit is not None and time.perf_counter() - started >= self.time_limit:
+            return 'time_limit'
+        if (self.branching_threshold is not None
+                and max(r['branching_factor'] for r in results) <= self.branching_threshold):
+            return 'converged'
+        if self.iterations_run >= self.n_iterations:
+            return 'max_iterations'
+        return None
+    
+    def solve(self, start_node=0, progress_callback=None):
+        """
+        Adaları paralel çalıştır ve sonuçları birleştir.
+        
+        Args:
+            start_node (int): Ring seferinin başlayacağı düğüm
+            progress_callback (func): Progress güncelleme fonksiyonu
+        
+        Returns:
+            tuple: (best_path, best_distance, best_distances, avg_distances)
+                Ada bazlı geçmişler `island_histories`, sonlandırma nedeni
+                `stop_reason`, çalışan iterasyon sayısı `iterations_run`
+                özelliklerinde tutulur.
+        """
+        started = time.perf_counter()
+        since_improvement = 0
+        self.stop_reason = None
+        self.iterations_run = 0
+        n = self.n_points
+        seed_seq = np.random.SeedSequence(self.seed)
+        
+        distance_shm = None
+        if self.distance_path is None:
+            distance_shm = shared_memory.SharedMemory(
+                create=True, size=self.distance_matrix.nbytes
+            )
+        pheromone_shm = shared_memory.SharedMemory(
+            create=True, size=self.n_islands * n * n * self.dtype.itemsize
+        )
+        try:
+            if distance_shm is not None:
+                distances = np.ndarray((n, n), dtype=self.dtype, buffer=distance_shm.buf)
+                distances[:] = self.distance_matrix
+            pheromones = np.ndarray((self.n_islands, n, n), dtype=self.dtype,
+                                    buffer=pheromone_shm.buf)
+            
+            islands = [
+                {'best_path': None, 'best_distance': float('inf'),
+                 'best_distances': [], 'avg_distances': []}
+                for _ in range(self.n_islands)
+            ]
+            
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                done = 0
+                merged_best = float('inf')
+                while done < self.n_iterations and self.stop_reason is None:
+                    iterations = min(self.migration_interval, self.n_iterations - done)
+                    epoch_seeds = seed_seq.spawn(self.n_islands)
+                    
+                    tasks = [{
+                        'distance_name': None if distance_shm is None else distance_shm.name,
+                        'distance_path': self.distance_path,
+                        'pheromone_name': pheromone_shm.name,
+                        'n_points': n,
+                        'n_islands': self.n_islands,
+                        'dtype': self.dtype,
+                        'island': island,
+                        'params': self.aco_params,
+                        'start_node': start_node,
+                        'iterations': iterations,
+                        'first_epoch': done == 0,
+                        'best_path': islands[island]['best_path'],
+                        'best_distance': islands[island]['best_distance'],
+                        'seed': int(epoch_seeds[island].generate_state(1)[0]),
+                    } for island in range(self.n_islands)]
+                    
+                    results = list(executor.map(_run_island_epoch, tasks))
+                    
+                    for history, result in zip(islands, results):
+                        history['best_distances'].extend(result['best_distances'])
+                        history['avg_distances'].extend(result['avg_distances'])
+                    
+                    # Durgunluk: birleşik geçmişin iterasyonları üzerinden say
+                    merged = np.min([r['best_distances'] for r in results], axis=0)
+                    for iteration_best in merged:
+                        if iteration_best < merged_best:
+                            merged_best = iteration_best
+                            since_improvement = 0
+                        else:
+                            since_improvement += 1
+                    
+                    # Göç adalar arasında tur kopyalar; genel en iyiyi değiştirmez
+                    best = min(results, key=lambda r: r['best_distance'])
+                    if best['best_distance'] < self.best_distance:
+                        self.best_distance = best['best_distance']
+                        self.best_path = list(best['best_path'])
+                    
+                    done += iterations
+                    self.iterations_run = done
+                    self.stop_reason = self._termination_reason(results, since_improvement,
+                                                                started)
+                    if self.stop_reason is None:
+                        self._migrate(pheromones, results)
+                    
+                    for history, result in zip(islands, results):
+                        history['best_path'] = result['best_path']
+                        history['best_distance'] = result['best_distance']
+                    
+                    if progress_callback:
+                        progress_callback(done, self.n_iterations, self.best_distance)
+        finally:
+            if distance_shm is not None:
+                distance_shm.close()
+                distance_shm.unlink()
+            pheromone_shm.close()
+            pheromone_shm.unlink()
+        
+        # Birleşik yakınsama: iterasyon başına adaların en iyisi ve ortalaması
+        # (adalar birlikte durur; yine de ortak uzunluğa kırpılır)
+        self.island_histories = islands
+        length = min(len(h['best_distances']) for h in islands)
+        self.best_distances = np.min(
+            [h['best_distances'][:length] for h in islands], axis=0
+        ).tolist()
+        self.avg_distances = np.mean(
+            [h['avg_distances'][:length] for h in islands], axis=0
+        ).tolist()
+        
+        return self.best_path, self.best_distance, self.best_distances, self.avg_distances
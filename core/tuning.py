@@ -0,0 +1,316 @@
+# 🎛️ Otomatik Parametre Ayarı (Successive Halving)
+
+"""
+alpha, beta, evaporation ve n_ants değerlerini config.ACO_RANGES aralıklarında
+otomatik seç.
+
+Successive halving (ardışık yarılama):
+    1. ACO_RANGES adımlarına oturan `n_configs` rastgele yapılandırma üretilir
+    2. Her basamakta (rung) tüm yapılandırmalar sabit tohumlarla paralel
+       çalıştırılır; iterasyon bütçesi her basamakta `eta` katına çıkar
+    3. best_distances gidişatına göre en iyi 1/eta kalır, diğerleri elenir
+    4. Elenmeyenler kaldıkları yerden (export_state / warm_start, rng dahil)
+       devam eder; önceki basamakların işi tekrarlanmaz
+
+Hedef kalite (target_distance) verilirse sıralama, hedefe ulaşmak için
+harcanan CPU süresine göredir; hedefe ulaşan tohum bir daha çalıştırılmaz.
+Hedef yoksa en iyi tur uzunluğu (eşitlikte CPU süresi) esas alınır.
+
+Kullanım:
+    python -m core.tuning duraklar.csv --configs 27 --seeds 0 1 --output ayar.json
+    python -m core.tuning a.json b.csv --target-ratio 0.85 --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import ACO_PARAMS, ACO_RANGES
+from core.ant_algorithm import AntColonyOptimizer, nearest_neighbour_length
+from core.cli import load_stops
+from core.matrix_utils import get_distance_matrix
+
+
+TUNED_PARAMS = ('alpha', 'beta', 'evaporation', 'n_ants')
+
+# Süreç başına mesafe matrisi (havuz başlatıcısı ile bir kez aktarılır)
+_WORKER = {}
+
+
+def _init_worker(distance_matrix):
+    _WORKER['distance_matrix'] = distance_matrix
+
+
+def _run_trial(task):
+    """
+    Bir yapılandırmayı tek tohumla `iterations` iterasyon çalıştır (alt süreçte).
+    
+    Args:
+        task (dict): params, seed, iterations, target_distance, state
+            (state: önceki basamağın export_state() çıktısı veya None)
+    
+    Returns:
+        dict: best_distances, best_distance, cpu, stop_reason, state
+    """
+    optimizer = AntColonyOptimizer(_WORKER['distance_matrix'], seed=task['seed'],
+                                   target_distance=task['target_distance'],
+                                   **task['params'])
+    if task['state'] is not None:
+        optimizer.warm_start(task['state'], restore_rng=True)
+    optimizer.n_iterations = task['iterations']
+    
+    started = time.process_time()
+    optimizer.solve()
+    return {
+        'best_distances': [float(d) for d in optimizer.best_distances],
+        'best_distance': float(optimizer.best_distance),
+        'cpu': time.process_time() - started,
+        'stop_reason': optimizer.stop_reason,
+        'state': optimizer.export_state(),
+    }
+
+
+def sample_configurations(n_configs, ranges=None, keys=TUNED_PARAMS, seed=None):
+    """
+    Aralıkların adım ızgarasından rastgele yapılandırmalar üret.
+    
+    Args:
+        n_configs (int): Yapılandırma sayısı
+        ranges (dict): {parametre: {min, max, step}} (varsayılan: ACO_RANGES)
+        keys (tuple): Ayarlanacak parametreler
+        seed (int): Örnekleme tohumu
+    
+    Returns:
+        list: [{parametre: değer}, ...] (tekrarsız; ızgara küçükse daha az)
+    """
+    ranges = ranges or ACO_RANGES
+    rng = np.random.default_rng(seed)
+    grids = {}
+    for key in keys:
+        r = ranges[key]
+        grids[key] = np.round(np.arange(r['min'], r['max'] + r['step'] / 2, r['step']), 6)
+    
+    configs = []
+    seen = set()
+    for _ in range(n_configs * 20):
+        if len(configs) >= n_configs:
+            break
+        config = {key: float(rng.choice(grid)) for key, grid in grids.items()}
+        if 'n_ants' in config:
+            config['n_ants'] = int(config['n_ants'])
+        signature = tuple(sorted(config.items()))
+        if signature not in seen:
+            seen.add(signature)
+            configs.append(config)
+    return configs
+
+
+def rung_budgets(min_iterations, max_iterations, eta):
+    """
+    Basamakların kümülatif iterasyon bütçeleri: min, min·eta, ..., max.
+    
+    Returns:
+        list: Artan iterasyon sayıları (son eleman max_iterations)
+    """
+    budgets = []
+    budget = max(1, int(min_iterations))
+    while budget < max_iterations:
+        budgets.append(budget)
+        budget *= eta
+    budgets.append(int(max_iterations))
+    return budgets
+
+
+def _score(trials, target_distance):
+    """
+    Yapılandırmanın tohumlar üzerinden sıralama anahtarı (küçük = iyi).
+    
+    Hedef verilmişse: tüm tohumlar hedefe ulaştıysa (0, ortalama CPU),
+    aksi halde (1, ortalama en iyi mesafe). Hedef yoksa (en iyi mesafe, CPU).
+    CPU, hedefe ulaşılan iterasyona kadar iterasyon başı ortalama süreyle
+    orantılanır.
+    """
+    best = float(np.mean([trial['best_distance'] for trial in trials]))
+    cpu = float(np.mean([trial['cpu'] for trial in trials]))
+    if target_distance is None:
+        return (best, cpu)
+    
+    cpu_to_target = []
+    for trial in trials:
+        history = np.minimum.accumulate(trial['best_distances'])
+        reached = np.flatnonzero(history <= target_distance)
+        if len(reached) == 0:
+            return (1, best)
+        cpu_to_target.append(trial['cpu'] * (reached[0] + 1) / len(history))
+    return (0, float(np.mean(cpu_to_target)))
+
+
+def tune(distance_matrix, n_configs=27, eta=3, min_iterations=10, max_iterations=None,
+         seeds=(0, 1), target_distance=None, base_params=None, ranges=None,
+         keys=TUNED_PARAMS, max_workers=None, sample_seed=None, progress_callback=None):
+    """
+    Tek bir örnek için successive halving ile en iyi parametreleri bul.
+    
+    Args:
+        distance_matrix (np.array): n×n mesafe matrisi
+        n_configs (int): Başlangıç yapılandırma sayısı
+        eta (int): Eleme oranı (her basamakta en iyi 1/eta kalır)
+        min_iterations (int): İlk basamağın iterasyon bütçesi
+        max_iterations (int): Son basamağın bütçesi (varsayılan: n_iterations
+            aralığının üst sınırı)
+        seeds (tuple): Her yapılandırmanın çalıştırılacağı sabit tohumlar
+        target_distance (float): Hedef tur uzunluğu (optional)
+        base_params (dict): Ayarlanmayan AntColonyOptimizer parametreleri
+        ranges (dict): Aralıklar (varsayılan: ACO_RANGES)
+        keys (tuple): Ayarlanacak parametreler
+        max_workers (int): Süreç sayısı (varsayılan: CPU sayısı)
+        sample_seed (int): Yapılandırma örnekleme tohumu
+        progress_callback (func): progress_callback(rung, n_rungs, best_score)
+    
+    Returns:
+        dict: best_params (tam parametre seti), config, score, best_distance,
+            cpu_total (tüm denemelerin CPU süresi, saniye), history
+            (basamak başına yapılandırma ve skorlar)
+    """
+    ranges = ranges or ACO_RANGES
+    if eta < 2:
+        raise ValueError(f"Eleme oranı en az 2 olmalı: {eta}")
+    if max_iterations is None:
+        max_iterations = ranges['n_iterations']['max']
+    
+    base = {key: value for key, value in ACO_PARAMS.items()
+            if key not in keys and key != 'n_iterations'}
+    base.update(base_params or {})
+    
+    configs = sample_configurations(n_configs, ranges, keys, sample_seed)
+    # Yapılandırma başına tohum durumları
+    trials = [[{'best_distances': [], 'best_distance': float('inf'), 'cpu': 0.0,
+                'done': False, 'state': None} for _ in seeds] for _ in configs]
+    alive = list(range(len(configs)))
+    budgets = rung_budgets(min_iterations, max_iterations, eta)
+    history = []
+    cpu_total = 0.0
+    
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             initializer=_init_worker,
+                             initargs=(distance_matrix,)) as pool:
+        done_iterations = 0
+        for rung, budget in enumerate(budgets):
+            tasks, owners = [], []
+            for c in alive:
+                for s, seed in enumerate(seeds):
+                    trial = trials[c][s]
+                    if trial['done']:
+                        continue
+                    tasks.append({
+                        'params': dict(base, **configs[c]),
+                        'seed': seed,
+                        'iterations': budget - done_iterations,
+                        'target_distance': target_distance,
+                        'state': trial['state'],
+                    })
+                    owners.append((c, s))
+            
+            for (c, s), result in zip(owners, pool.map(_run_trial, tasks)):
+                trial = trials[c][s]
+                trial['best_distances'].extend(result['best_distances'])
+                trial['best_distance'] = result['best_distance']
+                trial['cpu'] += result['cpu']
+                trial['state'] = result['state']
+                trial['done'] = result['stop_reason'] == 'target'
+                cpu_total += result['cpu']
+            done_iterations = budget
+            
+            scores = {c: _score(trials[c], target_distance) for c in alive}
+            ranked = sorted(alive, key=lambda c: scores[c])
+            history.append({
+                'rung': rung,
+                'iterations': budget,
+                'configs': [{'config': configs[c], 'score': list(scores[c])} for c in ranked],
+            })
+            if progress_callback:
+                progress_callback(rung + 1, len(budgets), scores[ranked[0]])
+            
+            # Eleme: son basamakta hepsi sıralanır, öncekilerde en iyi 1/eta kalır
+            if rung < len(budgets) - 1:
+                alive = ranked[:max(1, len(ranked) // eta)]
+            else:
+                alive = ranked
+            
+            # Hedefe tüm tohumlarla ulaşan tek aday kaldıysa devam etmeye gerek yok
+            if len(alive) == 1 and all(trial['done'] for trial in trials[alive[0]]):
+                break
+    
+    best = alive[0]
+    return {
+        'best_params': dict(base, **configs[best], n_iterations=done_iterations),
+        'config': configs[best],
+        'score': list(_score(trials[best], target_distance)),
+        'best_distance': min(trial['best_distance'] for trial in trials[best]),
+        'cpu_total': cpu_total,
+        'history': history,
+    }
+
+
+def tune_instances(instances, **tune_kwargs):
+    """
+    Birden fazla örneği sırayla ayarla (her örnek kendi havuzunda paralel).
+    
+    Args:
+        instances (dict): {örnek adı: mesafe matrisi}
+        **tune_kwargs: tune() parametreleri
+    
+    Returns:
+        dict: {örnek adı: tune() sonucu}
+    """
+    return {name: tune(matrix, **tune_kwargs) for name, matrix in instances.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m core.tuning',
+                                     description="ACO parametre ayarı (successive halving)")
+    parser.add_argument('inputs', nargs='+', help="CSV / JSON durak dosyaları")
+    parser.add_argument('--configs', type=int, default=27)
+    parser.add_argument('--eta', type=int, default=3)
+    parser.add_argument('--min-iterations', type=int, default=10)
+    parser.add_argument('--max-iterations', type=int, default=None)
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1])
+    parser.add_argument('--target-ratio', type=float, default=None,
+                        help="Hedef = oran × en yakın komşu turu uzunluğu (örn. 0.85)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--n-candidates', type=int, default=None)
+    parser.add_argument('--output', default='tuning_output.json')
+    args = parser.parse_args(argv)
+    
+    base_params = {'construction': 'vectorized', 'n_candidates': args.n_candidates}
+    report = {}
+    for input_path in args.inputs:
+        matrix, _, _ = get_distance_matrix(load_stops(input_path))
+        matrix = np.asarray(matrix)
+        target = None
+        if args.target_ratio is not None:
+            target = args.target_ratio * nearest_neighbour_length(matrix)
+        
+        started = time.perf_counter()
+        result = tune(matrix, n_configs=args.configs, eta=args.eta,
+                      min_iterations=args.min_iterations, max_iterations=args.max_iterations,
+                      seeds=tuple(args.seeds), target_distance=target,
+                      base_params=base_params, max_workers=args.workers)
+        result['target_distance'] = target
+        result['wall_time'] = time.perf_counter() - started
+        report[input_path] = result
+        print(f"{input_path}: {result['config']} L={result['best_distance']:.1f} "
+              f"CPU={result['cpu_total']:.1f}s")
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar yazıldı: {args.output}")
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -9,17 +9,19 @@ Senaryo: 7
 Tarih: Aralık 2025
 """
 
+import time
 import streamlit as st
 import numpy as np
-import pandas as pd
 import warnings
 warnings.filterwarnings('ignore')
 
-# Modülleri import et
-from config import PROJECT_INFO, ACO_RANGES
+# Modülleri import et (pandas, matplotlib ve googlemaps sadece gerektiğinde yüklenir)
+from config import PROJECT_INFO, ACO_RANGES, DISTANCE_CACHE_CONFIG, BACKGROUND_SOLVER_CONFIG
 from data.coordinates import CAMPUS_STOPS
 from core.matrix_utils import get_distance_matrix
-from core.ant_algorithm import AntColonyOptimizer
+from core.matrix_cache import DistanceMatrixCache
+from core.ant_algorithm import AntColonyOptimizer, rotate_tour
+from core.background import BackgroundSolver
 from visual.plotting import plot_convergence, plot_route, generate_kml
 
 # ============================================
@@ -31,6 +33,70 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ============================================
+# ÖNBELLEKLİ YARDIMCILAR
+# ============================================
+# Streamlit her etkileşimde betiği baştan çalıştırır; pahalı adımlar önbellekte tutulur.
+
+@st.cache_resource
+def get_matrix_cache():
+    """Disk önbelleği (tüm oturumlar için tek örnek)."""
+    return DistanceMatrixCache(**DISTANCE_CACHE_CONFIG)
+
+
+@st.cache_data(show_spinner=False)
+def load_stop_frame(stops):
+    """Harita için durak DataFrame'i (pandas ilk çağrıda yüklenir)."""
+    import pandas as pd
+    df = pd.DataFrame.from_dict(stops, orient='index', columns=['lat', 'lon'])
+    df['isim'] = list(stops.keys())
+    return df
+
+
+class _FallbackMatrix(Exception):
+    """API hatası sonrası Haversine yedeği: st.cache_data istisnaları önbelleğe almaz."""
+    
+    def __init__(self, result):
+        super().__init__("Google Maps API kullanılamadı")
+        self.result = result
+
+
+@st.cache_data(show_spinner=False)
+def _cached_distance_matrix(stops, api_key, _progress_callback=None):
+    messages = []
+    matrix, names, coords = get_distance_matrix(
+        stops, api_key, cache=get_matrix_cache(),
+        status_callback=lambda level, message: messages.append((level, message)),
+        progress_callback=_progress_callback
+    )
+    result = (np.array(matrix), names, coords, messages)
+    if api_key and any(level == 'warning' for level, _ in messages):
+        raise _FallbackMatrix(result)
+    return result
+
+
+def load_distance_matrix(stops, api_key, progress_callback=None):
+    """
+    Mesafe matrisi; aynı duraklar ve API key için yeniden hesaplanmaz.
+    
+    API istenip bağlanılamadıysa Haversine yedeği önbelleğe alınmaz; sonraki
+    hesaplamada API yeniden denenir.
+    
+    Returns:
+        tuple: (distance_matrix, stop_names, coordinates_array, status_messages)
+    """
+    try:
+        return _cached_distance_matrix(stops, api_key, progress_callback)
+    except _FallbackMatrix as fallback:
+        return fallback.result
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_figures(best_distances, avg_distances, names, path_indices, coords):
+    """Yakınsama ve rota grafikleri (aynı sonuç için tekrar çizilmez)."""
+    return (plot_convergence(list(best_distances), list(avg_distances)),
+            plot_route(list(names), list(path_indices), coords))
+
 # ============================================
 # SOL PANEL - BİLGİLER
 # ============================================
@@ -77,9 +143,8 @@ st.markdown("---")
 # ============================================
 duraklar = CAMPUS_STOPS
 
-# DataFrame oluştur
-df_duraklar = pd.DataFrame.from_dict(duraklar, orient='index', columns=['lat', 'lon'])
-df_duraklar['isim'] = list(duraklar.keys())
+# DataFrame oluştur (önbellekten)
+df_duraklar = load_stop_frame(duraklar)
 
 st.sidebar.success(f"Toplam Durak Sayısı: {len(duraklar)}")
 
@@ -134,6 +199,14 @@ with col2:
         step=0.05,
         help="Eski feromon ne kadar yok olsun?"
     )
+    stagnation = st.slider(
+        "⏹️ Durgunluk Limiti (0 = kapalı)",
+        min_value=ACO_RANGES['stagnation_limit']['min'],
+        max_value=ACO_RANGES['stagnation_limit']['max'],
+        value=0,
+        step=ACO_RANGES['stagnation_limit']['step'],
+        help="Bu kadar iterasyon boyunca iyileşme olmazsa algoritma erken durur"
+    )
     start_stop = st.selectbox(
         "📍 Başlangıç Durakı (Ring Merkezi)",
         options=list(duraklar.keys()),
@@ -149,7 +222,7 @@ st.markdown("---")
 # ============================================
 # BUTONLAR
 # ============================================
-col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
+col_btn1, col_btn2, col_btn3, col_btn4 = st.columns([1, 1, 1, 1])
 
 with col_btn1:
     calculate_btn = st.button(" Rotayı Hesapla", use_container_width=True)
@@ -160,46 +233,165 @@ with col_btn2:
 with col_btn3:
     download_btn = st.button(" Sonuçları İndir", use_container_width=True)
 
+with col_btn4:
+    cancel_btn = st.button("⏹️ İptal", use_container_width=True)
+
 # Başlangıç düğümünü seç
 start_node = list(duraklar.keys()).index(start_stop)
 
+# Son çözümün hangi ayarlarla hesaplandığını izlemek için. Başlangıç durağı
+# dahil değildir: kapalı ring bir kez çözülür, seçilen durağa döndürülür.
+current_params = {
+    'n_ants': n_ants,
+    'n_iterations': n_iter,
+    'alpha': alpha,
+    'beta': beta,
+    'evaporation': evap,
+    'stagnation_limit': stagnation,
+}
+
 # ============================================
 # HESAPLAMA
 # ============================================
 if calculate_btn:
     # Mesafeleri hesapla
+    matrix_progress = st.empty()
     with st.spinner("📊 Mesafe Matrisi Hesaplanıyor..."):
-        dist_matrix, names, coords = get_distance_matrix(duraklar, api_key)
+        dist_matrix, names, coords, matrix_messages = load_distance_matrix(
+            duraklar, api_key, matrix_progress.progress
+        )
+    for level, message in matrix_messages:
+        getattr(st.sidebar, level)(message)
     
     # Durakları kontrol et
     if len(duraklar) != 10:
         st.warning(f" Uyarı: {len(duraklar)} durak var, 10 olması gerekiyor!")
     
-    # ACO Optimizer'ı oluştur
-    optimizer = AntColonyOptimizer(
-        distance_matrix=dist_matrix,
-        n_ants=n_ants,
-        n_iterations=n_iter,
-        alpha=alpha,
-        beta=beta,
-        evaporation=evap
-    )
+    # Önceki arka plan çözümü hâlâ çalışıyorsa durdur
+    if 'arka_plan' in st.session_state:
+        st.session_state.pop('arka_plan')['solver'].cancel()
+    
+    # Aynı mesafe matrisi ve parametrelerle bulunmuş döngü varsa yeniden çözme
+    dongu_key = (tuple(names), hash(dist_matrix.tobytes()), tuple(current_params.items()))
+    donguler = st.session_state.setdefault('donguler', {})
+    
+    if dongu_key in donguler:
+        st.session_state['sonuc'] = donguler[dongu_key]
+    else:
+        # ACO Optimizer'ı oluştur
+        optimizer = AntColonyOptimizer(
+            distance_matrix=dist_matrix,
+            n_ants=n_ants,
+            n_iterations=n_iter,
+            alpha=alpha,
+            beta=beta,
+            evaporation=evap,
+            stagnation_limit=stagnation or None
+        )
+        
+        # Algoritmayı arka planda başlat; arayüz aşağıda ilerlemeyi yoklar.
+        # start_node=None: karıncalar rastgele duraklardan başlar, döngü
+        # başlangıç durağından bağımsız bulunur.
+        st.session_state['arka_plan'] = {
+            'solver': BackgroundSolver(
+                optimizer, start_node=None,
+                min_interval=BACKGROUND_SOLVER_CONFIG['min_interval']
+            ).start(),
+            'key': dongu_key,
+            'params': current_params,
+            'dist_matrix': dist_matrix,
+            'names': names,
+            'coords': coords,
+        }
+
+elif clear_btn:
+    if 'arka_plan' in st.session_state:
+        st.session_state.pop('arka_plan')['solver'].cancel()
+    st.session_state.pop('sonuc', None)
+    st.session_state.pop('donguler', None)
+    st.info(" Sonuçlar temizlendi. Tekrar hesaplamak için 'Rotayı Hesapla' butonuna basın.")
+
+# ============================================
+# ARKA PLAN ÇÖZÜMÜ - İLERLEME
+# ============================================
+# Buton / slider etkileşimleri betiği yeniden başlatır; çözüm thread'i
+# çalışmaya devam eder ve yeni çalıştırma ilerlemeyi kaldığı yerden yoklar.
+arka_plan = st.session_state.get('arka_plan')
+
+if arka_plan is not None:
+    solver = arka_plan['solver']
+    if cancel_btn:
+        solver.cancel()
     
-    # Progress bar için callback
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    def progress_callback(current, total, best_dist):
-        progress_bar.progress(current / total)
-        status_text.text(f"İterasyon {current}/{total} - En İyi: {best_dist/1000:.2f} km")
+    def show_progress(snapshot):
+        if snapshot is None:
+            return
+        progress_bar.progress(min(snapshot['iteration'] / snapshot['n_iterations'], 1.0))
+        status_text.text(
+            f"İterasyon {snapshot['iteration']}/{snapshot['n_iterations']} - "
+            f"En İyi: {snapshot['best_distance']/1000:.2f} km"
+        )
     
-    # Algoritma çalış
     with st.spinner(" Karınca Kolonisi Algoritması Çalışıyor..."):
-        path_indices, min_dist, best_distances, avg_distances = optimizer.solve(
-            start_node=start_node,
-            progress_callback=progress_callback
+        while solver.running:
+            show_progress(solver.latest())
+            time.sleep(BACKGROUND_SOLVER_CONFIG['poll_interval'])
+    show_progress(solver.latest())
+    
+    path_indices, min_dist, best_distances, avg_distances = solver.result()
+    optimizer = solver.optimizer
+    st.session_state.pop('arka_plan', None)
+    
+    # Erken durdurma / iptal bilgisi
+    if optimizer.stop_reason == 'cancelled':
+        status_text.text(
+            f"İptal edildi - {optimizer.iterations_run}/{optimizer.n_iterations} iterasyon"
+        )
+    elif optimizer.stop_reason != 'max_iterations':
+        progress_bar.progress(1.0)
+        status_text.text(
+            f"Erken durduruldu ({optimizer.stop_reason}) - "
+            f"{optimizer.iterations_run}/{optimizer.n_iterations} iterasyon"
         )
     
+    # Sonucu oturumda sakla: slider değişikliklerinde kaybolmaz. Tamamlanan
+    # (iptal edilmemiş) döngüler matris + parametre anahtarıyla önbelleğe alınır.
+    if path_indices is not None:
+        st.session_state['sonuc'] = {
+            'params': arka_plan['params'],
+            'dist_matrix': arka_plan['dist_matrix'],
+            'names': arka_plan['names'],
+            'coords': arka_plan['coords'],
+            'cycle': [int(node) for node in path_indices],
+            'min_dist': float(min_dist),
+            'best_distances': tuple(best_distances),
+            'avg_distances': tuple(avg_distances),
+        }
+        if optimizer.stop_reason != 'cancelled':
+            st.session_state.setdefault('donguler', {})[arka_plan['key']] = st.session_state['sonuc']
+
+# ============================================
+# SONUÇLAR (oturumdaki son çözüm)
+# ============================================
+sonuc = st.session_state.get('sonuc')
+
+if sonuc is not None:
+    import pandas as pd
+    
+    dist_matrix = sonuc['dist_matrix']
+    names = sonuc['names']
+    coords = sonuc['coords']
+    # Başlangıç durağı değişince yeniden çözmeden döngüyü döndür (O(n))
+    path_indices = rotate_tour(sonuc['cycle'], start_node)
+    min_dist = sonuc['min_dist']
+    
+    if sonuc['params'] != current_params:
+        st.info(" Parametreler değişti; gösterilen sonuç önceki ayarlarla hesaplandı. "
+                "Güncellemek için 'Rotayı Hesapla' butonuna basın.")
+    
     #  BAŞARILI SONUÇ
     st.success(f" Optimum Rota Bulundu!")
     
@@ -218,21 +410,21 @@ if calculate_btn:
         st.metric(" Ort. Durak Arası", f"{avg_stop_dist/1000:.2f} km", f"{avg_stop_dist:.0f} m")
     
     with col_metric4:
-        st.metric(" Çalışan Algoritma", "ACO", f"{n_ants} karınca")
+        st.metric(" Çalışan Algoritma", "ACO", f"{sonuc['params']['n_ants']} karınca")
     
     st.markdown("---")
     
     #  Grafikler
     col_graph1, col_graph2 = st.columns(2)
+    fig1, fig2 = build_figures(sonuc['best_distances'], sonuc['avg_distances'],
+                               tuple(names), tuple(path_indices), coords)
     
     with col_graph1:
         st.write("### Yakınsama Analizi")
-        fig1 = plot_convergence(best_distances, avg_distances)
         st.pyplot(fig1, use_container_width=True)
     
     with col_graph2:
         st.write("###  Optimum Rota Haritası")
-        fig2 = plot_route(names, path_indices, coords)
         st.pyplot(fig2, use_container_width=True)
     
     st.markdown("---")
@@ -295,6 +487,3 @@ if calculate_btn:
             mime="application/vnd.google-earth.kml+xml"
         )
 
-elif clear_btn:
-    st.info(" Sonuçlar temizlendi. Tekrar hesaplamak için 'Rotayı Hesapla' butonuna basın.")
-
@@ -0,0 +1 @@
+# Modül başlatma dosyası
@@ -0,0 +1,32 @@
+# 🧪 Ortak Test Fixture'ları
+
+"""
+Testlerin paylaştığı rastgele (tohumlu) düzlem ve koordinat örnekleri.
+"""
+
+import numpy as np
+import pytest
+
+
+def _euclidean_matrix(n, seed, scale=1000.0):
+    """[0, scale)² içinde n rastgele noktanın n×n Öklid mesafe matrisi."""
+    points = np.random.default_rng(seed).random((n, 2)) * scale
+    return np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+
+
+@pytest.fixture(scope='session')
+def make_distance_matrix():
+    """Fabrika: make_distance_matrix(n, seed, scale=1000.0) -> n×n mesafe matrisi."""
+    return _euclidean_matrix
+
+
+def _campus_coordinates(n, seed=0):
+    """Kampüs çevresinde (~2 km × 2 km) n rastgele [Enlem, Boylam] koordinatı."""
+    rng = np.random.default_rng(seed)
+    return np.column_stack((37.8 + rng.random(n) * 0.02, 30.5 + rng.random(n) * 0.02))
+
+
+@pytest.fixture(scope='session')
+def make_coordinates():
+    """Fabrika: make_coordinates(n, seed=0) -> (n, 2) [Enlem, Boylam] dizisi."""
+    return _campus_coordinates
@@ -0,0 +1,384 @@
+# 🧪 Karınca Kolonisi Algoritması - Testler
+
+"""
+AntColonyOptimizer'ın saf NumPy yollarını doğrular (numba gerektirmez; CI'da
+her zaman çalışır). Küçük, tohumlu örnekler kullanılır.
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer, _power, rotate_tour
+from core.local_search import tour_length, two_opt
+from core.matrix_cache import DistanceMatrixCache
+from core.matrix_utils import get_distance_matrix, open_distance_memmap
+from data.coordinates import CAMPUS_STOPS
+
+
+@pytest.fixture(scope='module')
+def distance_matrix(make_distance_matrix):
+    return make_distance_matrix(40, seed=0)
+
+
+def _is_ring(path, n, start=None):
+    path = [int(node) for node in path]
+    return (len(path) == n + 1 and path[0] == path[-1]
+            and sorted(path[:-1]) == list(range(n))
+            and (start is None or path[0] == start))
+
+
+@pytest.mark.parametrize('strategy', ['as', 'mmas', 'acs'])
+@pytest.mark.parametrize('pheromone_storage', ['dense', 'sparse'])
+def test_float32_with_local_search_terminates(distance_matrix, strategy, pheromone_storage):
+    optimizer = AntColonyOptimizer(distance_matrix, dtype='float32', local_search='2opt+oropt',
+                                   n_iterations=8, n_ants=6, seed=3, strategy=strategy,
+                                   pheromone_storage=pheromone_storage, n_candidates=10)
+    path, distance, _, _ = optimizer.solve(start_node=None)
+    assert _is_ring(path, 40, start=0)
+    assert distance == pytest.approx(tour_length(path[:-1], distance_matrix), rel=1e-6)
+
+
+def test_two_opt_on_float32_reaches_local_optimum(distance_matrix):
+    matrix = distance_matrix.astype(np.float32)
+    neighbours = np.argsort(distance_matrix, axis=1)[:, 1:11]
+    tour = list(np.random.default_rng(1).permutation(40))
+    
+    improved = two_opt(tour, matrix, neighbours)
+    assert two_opt(improved, matrix, neighbours) == improved
+
+
+@pytest.fixture
+def distance_memmap(distance_matrix, tmp_path):
+    path = tmp_path / 'matris.npy'
+    np.save(path, distance_matrix.astype(np.float32))
+    return open_distance_memmap(str(path))
+
+
+def test_memmap_with_dense_storage_is_read_without_copy(distance_memmap):
+    optimizer = AntColonyOptimizer(distance_memmap, dtype='float32',
+                                   n_iterations=3, n_ants=4, seed=1)
+    assert not isinstance(optimizer.distance_matrix, np.memmap)
+    assert np.shares_memory(optimizer.distance_matrix, distance_memmap)
+    
+    path, _, _, _ = optimizer.solve()
+    assert _is_ring(path, 40, start=0)
+
+
+def test_cached_matrix_with_default_optimizer(tmp_path):
+    cache = DistanceMatrixCache(str(tmp_path))
+    for _ in range(2):  # ilk çağrı hesaplayıp yazar, ikincisi önbellekten okur
+        matrix, names, _ = get_distance_matrix(CAMPUS_STOPS, cache=cache)
+        assert isinstance(matrix, np.memmap)
+        
+        optimizer = AntColonyOptimizer(matrix, n_iterations=3, n_ants=4, seed=0)
+        path, distance, _, _ = optimizer.solve()
+        assert _is_ring(path, len(names), start=0)
+        assert distance == pytest.approx(tour_length(path, np.asarray(matrix)))
+
+
+def test_memmap_with_sparse_storage_and_local_search(distance_memmap):
+    optimizer = AntColonyOptimizer(distance_memmap, dtype='float32', n_candidates=10,
+                                   pheromone_storage='sparse', local_search='2opt',
+                                   n_iterations=5, n_ants=6, seed=2)
+    assert optimizer.distance_matrix is distance_memmap
+    assert optimizer.pheromone.shape == optimizer.choice_info.shape == (40, 10)
+    
+    path, _, _, _ = optimizer.solve(start_node=None)
+    assert _is_ring(path, 40, start=0)
+
+
+def test_set_pheromone_shares_buffer_and_refreshes_choice_info(distance_matrix):
+    optimizer = AntColonyOptimizer(distance_matrix, alpha=2.0, n_ants=4, n_iterations=2)
+    buffer = np.full((40, 40), 0.25)
+    optimizer.set_pheromone(buffer)
+    
+    assert optimizer.pheromone is buffer
+    assert np.allclose(optimizer.choice_info, 0.25 ** 2 * optimizer.eta_beta)
+    with pytest.raises(ValueError):
+        optimizer.set_pheromone(buffer.astype(np.float32))
+
+
+@pytest.fixture(scope='module')
+def small_matrix(make_distance_matrix):
+    return make_distance_matrix(10, seed=5)
+
+
+@pytest.mark.parametrize('mmas_update', ['iteration', 'global'])
+@pytest.mark.parametrize('pheromone_storage', ['dense', 'sparse'])
+def test_mmas_pheromone_stays_within_bounds(small_matrix, mmas_update, pheromone_storage):
+    optimizer = AntColonyOptimizer(small_matrix, strategy='mmas', mmas_update=mmas_update,
+                                   pheromone_storage=pheromone_storage, n_candidates=5,
+                                   n_ants=5, n_iterations=30, seed=4)
+    optimizer.solve()
+    
+    assert 0 < optimizer.tau_min < optimizer.tau_max
+    assert optimizer.tau_max == pytest.approx(1 / (optimizer.evaporation
+                                                   * optimizer.best_distance))
+    assert optimizer.pheromone.min() >= optimizer.tau_min * (1 - 1e-12)
+    assert optimizer.pheromone.max() <= optimizer.tau_max * (1 + 1e-12)
+    if pheromone_storage == 'sparse':
+        assert optimizer.tau_min <= optimizer.pheromone_default <= optimizer.tau_max
+
+
+def test_mmas_reinit_resets_branching_factor(small_matrix):
+    def run(reinit_after):
+        optimizer = AntColonyOptimizer(small_matrix, strategy='mmas', reinit_after=reinit_after,
+                                       n_ants=5, n_iterations=30, seed=4)
+        factors = []
+        optimizer.solve(progress_callback=lambda *args: factors.append(
+            (optimizer.branching_factor(), np.all(optimizer.pheromone == optimizer.tau_max))))
+        return factors
+    
+    # Yeniden başlatmadan sonra tüm kenarlar τ_max: dallanma faktörü n olur
+    restarted = [factor for factor, uniform in run(reinit_after=2) if uniform]
+    assert restarted and all(factor == 10 for factor in restarted)
+    assert not any(uniform for _, uniform in run(reinit_after=None))
+
+
+def test_acs_local_update_moves_pheromone_toward_tau0(small_matrix):
+    optimizer = AntColonyOptimizer(small_matrix, strategy='acs', local_evaporation=0.1,
+                                   n_ants=3, seed=1)
+    tau0 = optimizer.tau_init
+    optimizer.set_pheromone(np.full((10, 10), 2 * tau0))
+    
+    optimizer._local_update(np.array([0]), np.array([1]))
+    assert optimizer.pheromone[0, 1] == pytest.approx(0.9 * 2 * tau0 + 0.1 * tau0)
+    assert optimizer.choice_info[0, 1] == pytest.approx(optimizer.pheromone[0, 1]
+                                                        * optimizer.eta_beta[0, 1])
+    
+    optimizer.set_pheromone(np.full((10, 10), 2 * tau0))
+    paths, _ = optimizer._build_paths_vectorized(0)
+    used = np.zeros((10, 10), dtype=bool)
+    used[paths[:, :-1], paths[:, 1:]] = True
+    assert (tau0 < optimizer.pheromone[used]).all()
+    assert (optimizer.pheromone[used] < 2 * tau0).all()
+    assert (optimizer.pheromone[~used] == 2 * tau0).all()
+
+
+def test_acs_q0_one_is_greedy(small_matrix):
+    optimizer = AntColonyOptimizer(small_matrix, strategy='acs', q0=1.0, n_ants=4, seed=1)
+    first_choice = int(np.argmax(np.where(np.arange(10) == 0, -np.inf,
+                                          optimizer.choice_info[0])))
+    
+    paths, _ = optimizer._build_paths_vectorized(0)
+    assert (paths == paths[0]).all()
+    assert paths[0, 1] == first_choice
+    
+    optimizer = AntColonyOptimizer(small_matrix, strategy='acs', q0=0.0, n_ants=8, seed=1)
+    paths, _ = optimizer._build_paths_vectorized(0)
+    assert len({tuple(path) for path in paths.tolist()}) > 1
+
+
+@pytest.mark.parametrize('construction', ['sequential', 'vectorized'])
+@pytest.mark.parametrize('n_candidates', [None, 8])
+@pytest.mark.parametrize('start_node', [0, 7, None])
+def test_constructions_build_valid_rings(distance_matrix, construction, n_candidates,
+                                         start_node):
+    optimizer = AntColonyOptimizer(distance_matrix, construction=construction,
+                                   n_candidates=n_candidates, n_ants=6, seed=1)
+    all_paths, all_distances = optimizer._construct_solutions(start_node)
+    
+    assert len(all_paths) == len(all_distances) == 6
+    for path, distance in zip(all_paths, all_distances):
+        assert _is_ring(path, 40, start=start_node)
+        assert distance == pytest.approx(tour_length(path[:-1], distance_matrix))
+
+
+def test_vectorized_and_sequential_solve_reach_similar_quality(distance_matrix):
+    results = {}
+    for construction in ('sequential', 'vectorized'):
+        optimizer = AntColonyOptimizer(distance_matrix, construction=construction,
+                                       n_ants=10, n_iterations=20, seed=2)
+        path, distance, best_distances, _ = optimizer.solve(start_node=3)
+        assert _is_ring(path, 40, start=3)
+        assert len(best_distances) == 20
+        results[construction] = distance
+    assert results['vectorized'] == pytest.approx(results['sequential'], rel=0.15)
+
+
+@pytest.mark.parametrize('exponent', [1, 2, 3, 5, 8, 0.5, 2.5, 9])
+def test_power_matches_numpy(exponent):
+    matrix = np.random.default_rng(0).random((6, 6)) + 0.1
+    result = _power(matrix, exponent)
+    assert result is not matrix
+    assert np.allclose(result, matrix ** exponent)
+
+
+@pytest.mark.parametrize('alpha', [1.0, 2.0, 1.5])
+@pytest.mark.parametrize('strategy', ['as', 'mmas', 'acs'])
+def test_choice_info_matches_pheromone_after_solve(small_matrix, alpha, strategy):
+    optimizer = AntColonyOptimizer(small_matrix, alpha=alpha, beta=2.0, strategy=strategy,
+                                   n_ants=5, n_iterations=10, seed=1)
+    eta = np.ones_like(small_matrix)
+    np.divide(100.0, small_matrix, out=eta, where=small_matrix > 0)
+    assert np.allclose(optimizer.eta_beta, eta ** 2.0)
+    
+    optimizer.solve()
+    expected = optimizer.pheromone ** alpha * optimizer.eta_beta
+    assert np.allclose(optimizer.choice_info, expected)
+
+
+def test_candidate_lists_are_nearest_neighbours(distance_matrix):
+    optimizer = AntColonyOptimizer(distance_matrix, n_candidates=5)
+    masked = distance_matrix + np.diag(np.full(40, np.inf))
+    assert np.array_equal(optimizer.candidate_lists, np.argsort(masked, axis=1)[:, :5])
+
+
+def test_candidate_fallback_picks_best_unvisited(distance_matrix):
+    optimizer = AntColonyOptimizer(distance_matrix, n_candidates=5, seed=1)
+    current = 0
+    visited = np.zeros(40, dtype=bool)
+    visited[current] = True
+    visited[optimizer.candidate_lists[current]] = True
+    unvisited = np.flatnonzero(~visited)
+    expected = unvisited[np.argmax(optimizer.choice_info[current, unvisited])]
+    
+    assert optimizer._select_from_candidates(current, visited) == expected
+    
+    # Vektörel yol: adayları tükenen karınca aynı düğümü, diğeri bir adayı seçer
+    visited_rows = np.vstack((visited, np.eye(40, dtype=bool)[1]))
+    chosen = optimizer._roulette_candidates(np.array([current, 1]), visited_rows,
+                                            np.array([0.5, 0.5]))
+    assert chosen[0] == expected
+    assert chosen[1] in optimizer.candidate_lists[1]
+
+
+@pytest.mark.parametrize('symmetric_deposit', [False, True])
+def test_vectorized_deposit_matches_loop(small_matrix, symmetric_deposit):
+    optimizer = AntColonyOptimizer(small_matrix, evaporation=0.3,
+                                   symmetric_deposit=symmetric_deposit, n_ants=6, seed=2)
+    all_paths, all_distances = optimizer._construct_solutions(0)
+    # Aynı tur iki kez: tekrarlanan kenarların katkısı toplanmalı
+    all_paths.append(list(all_paths[0]))
+    all_distances.append(all_distances[0])
+    
+    expected = optimizer.pheromone * (1 - 0.3)
+    for path, distance in zip(all_paths, all_distances):
+        for i in range(len(path) - 1):
+            expected[path[i], path[i + 1]] += 1.0 / distance
+            if symmetric_deposit:
+                expected[path[i + 1], path[i]] += 1.0 / distance
+    
+    optimizer._update_pheromone(all_paths, all_distances)
+    assert np.allclose(optimizer.pheromone, expected)
+
+
+@pytest.mark.parametrize('params, reason', [
+    ({'target_distance': 1e12}, 'target'),
+    ({'stagnation_limit': 2}, 'stagnation'),
+    ({'time_limit': 0.0}, 'time_limit'),
+    ({'branching_threshold': 1e9}, 'converged'),
+    ({}, 'max_iterations'),
+])
+def test_termination_reasons(small_matrix, params, reason):
+    optimizer = AntColonyOptimizer(small_matrix, n_ants=5, n_iterations=200, seed=1, **params)
+    _, _, best_distances, _ = optimizer.solve()
+    
+    assert optimizer.stop_reason == reason
+    assert len(best_distances) == optimizer.iterations_run
+    if reason == 'max_iterations':
+        assert optimizer.iterations_run == 200
+    elif reason == 'stagnation':
+        assert min(best_distances[-2:]) >= optimizer.best_distance
+        assert optimizer.iterations_run < 200
+    else:
+        assert optimizer.iterations_run == 1
+
+
+def test_cancel_reason(small_matrix):
+    optimizer = AntColonyOptimizer(small_matrix, n_ants=5, n_iterations=50, seed=1)
+    optimizer.solve(progress_callback=lambda iteration, total, best:
+                    iteration == 3 and optimizer.cancel())
+    assert optimizer.stop_reason == 'cancelled'
+    assert optimizer.iterations_run == 3
+
+
+@pytest.mark.parametrize('pheromone_storage', ['dense', 'sparse'])
+def test_warm_start_round_trip_continues_the_same_run(distance_matrix, pheromone_storage):
+    params = dict(n_ants=6, n_iterations=5, n_candidates=8,
+                  pheromone_storage=pheromone_storage, construction='vectorized')
+    original = AntColonyOptimizer(distance_matrix, seed=9, **params)
+    original.solve()
+    state = original.export_state()
+    
+    resumed = AntColonyOptimizer(distance_matrix, seed=123, **params)
+    resumed.warm_start(state, restore_rng=True)
+    assert np.array_equal(resumed.pheromone, original.pheromone)
+    assert resumed.best_path == state['best_path']
+    assert resumed.best_distance == pytest.approx(state['best_distance'])
+    
+    # Aynı feromon + rng durumuyla devam etmek kesintisiz çalışmayla aynıdır
+    original.solve()
+    resumed.solve()
+    assert np.allclose(resumed.pheromone, original.pheromone)
+    assert resumed.best_distance == pytest.approx(original.best_distance)
+
+
+def test_warm_start_maps_pheromone_to_new_stop_list(small_matrix):
+    names = [f"durak_{i}" for i in range(10)]
+    original = AntColonyOptimizer(small_matrix, n_ants=5, n_iterations=5, seed=1)
+    original.solve()
+    state = original.export_state(names)
+    
+    # durak_3 silinir, sona yeni bir durak eklenir
+    kept = [i for i in range(10) if i != 3]
+    rng = np.random.default_rng(0)
+    matrix = np.empty((10, 10))
+    matrix[:9, :9] = small_matrix[np.ix_(kept, kept)]
+    matrix[9, :9] = matrix[:9, 9] = rng.random(9) * 500 + 100
+    matrix[9, 9] = 0.0
+    new_names = [names[i] for i in kept] + ['yeni']
+    
+    optimizer = AntColonyOptimizer(matrix, n_ants=5, n_iterations=5, seed=1)
+    optimizer.warm_start(state, new_names)
+    assert np.array_equal(optimizer.pheromone[:9, :9],
+                          original.pheromone[np.ix_(kept, kept)])
+    assert np.allclose(optimizer.pheromone[9], original.pheromone.mean())
+    assert _is_ring(optimizer.best_path, 10)
+    assert optimizer.best_distance == pytest.approx(
+        tour_length(optimizer.best_path[:-1], matrix))
+
+
+def test_rotate_tour():
+    assert rotate_tour([0, 2, 1, 3, 0], 1) == [1, 3, 0, 2, 1]
+    assert rotate_tour([0, 2, 1, 3, 0], 0) == [0, 2, 1, 3, 0]
+    with pytest.raises(ValueError):
+        rotate_tour([0, 2, 1, 0], 5)
+
+
+def test_tour_from_rotates_the_start_agnostic_cycle(small_matrix):
+    optimizer = AntColonyOptimizer(small_matrix, n_ants=5, n_iterations=10, seed=1)
+    with pytest.raises(ValueError):
+        optimizer.tour_from(0)
+    
+    path, distance, _, _ = optimizer.solve(start_node=None)
+    assert path[0] == 0
+    for start in range(10):
+        tour = optimizer.tour_from(start)
+        assert _is_ring(tour, 10, start=start)
+        assert rotate_tour(tour, 0) == path
+        assert tour_length(tour[:-1], small_matrix) == pytest.approx(distance)
+
+
+def test_sparse_storage_drops_deposits_outside_candidate_set(small_matrix):
+    params = dict(n_candidates=3, evaporation=0.2, n_ants=2, seed=1)
+    sparse = AntColonyOptimizer(small_matrix, pheromone_storage='sparse', **params)
+    dense = AntColonyOptimizer(small_matrix, **params)
+    candidates = sparse.candidate_lists
+    
+    # Tur, aday olan ve olmayan kenarları birlikte içerir
+    path = list(range(10)) + [0]
+    edges = list(zip(path[:-1], path[1:]))
+    in_candidates = [dst in candidates[src] for src, dst in edges]
+    assert any(in_candidates) and not all(in_candidates)
+    
+    for optimizer in (sparse, dense):
+        optimizer._update_pheromone([path], [100.0])
+    
+    rows = np.arange(10)[:, None]
+    assert np.allclose(sparse.pheromone, dense.pheromone[rows, candidates])
+    # Aday olmayan kenarların ortak değeri sadece buharlaşır
+    assert sparse.pheromone_default == pytest.approx(sparse.tau_init * 0.8)
+    for (src, dst), kept in zip(edges, in_candidates):
+        if not kept:
+            assert dense.pheromone[src, dst] == pytest.approx(sparse.tau_init * 0.8 + 0.01)
@@ -0,0 +1,68 @@
+# 🧪 İptal ve Arka Planda Çözüm - Testler
+
+"""
+cancel() isteğinin sadece çalışan solve() çağrısını durdurduğunu, sonraki
+çağrılara sızmadığını ve solve() hata verse bile temizlendiğini, yoklanmayan
+anlık görüntülerin kuyrukta birikmediğini doğrular.
+"""
+
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.background import BackgroundSolver
+
+
+@pytest.fixture
+def optimizer(make_distance_matrix):
+    distance_matrix = make_distance_matrix(15, seed=3)
+    return AntColonyOptimizer(distance_matrix, n_ants=5, n_iterations=12, seed=1)
+
+
+def test_cancel_between_runs_does_not_leak(optimizer):
+    optimizer.cancel()
+    optimizer.solve()
+    assert optimizer.stop_reason == 'max_iterations'
+    assert optimizer.iterations_run == 12
+
+
+def test_cancel_stops_running_solve_then_next_solve_runs_fully(optimizer):
+    optimizer.solve(progress_callback=lambda iteration, total, best: optimizer.cancel())
+    assert optimizer.stop_reason == 'cancelled'
+    assert optimizer.iterations_run == 1
+    
+    optimizer.solve()
+    assert optimizer.stop_reason == 'max_iterations'
+    assert optimizer.iterations_run == 12
+
+
+def test_cancel_is_cleared_when_solve_raises(optimizer):
+    def failing_callback(iteration, total, best):
+        optimizer.cancel()
+        raise RuntimeError("callback hatası")
+    
+    with pytest.raises(RuntimeError):
+        optimizer.solve(progress_callback=failing_callback)
+    assert not optimizer._cancel_event.is_set()
+    
+    optimizer.solve()
+    assert optimizer.iterations_run == 12
+
+
+def test_background_cancel_before_solve_starts(optimizer):
+    solver = BackgroundSolver(optimizer, min_interval=0.0)
+    solver.cancel()
+    solver.start()
+    solver._thread.join()
+    assert optimizer.stop_reason == 'cancelled'
+    assert optimizer.iterations_run == 1
+
+
+def test_unpolled_snapshots_do_not_pile_up(optimizer):
+    solver = BackgroundSolver(optimizer, min_interval=0.0).start()
+    solver.result(timeout=10)
+    
+    assert solver.snapshots.qsize() == 1
+    snapshots = solver.poll()
+    assert len(snapshots) == 1
+    assert snapshots[0]['done'] and snapshots[0]['iteration'] == 12
+    assert solver.latest() is snapshots[0]
@@ -0,0 +1,91 @@
+# 🧪 Toplu Çözüm - Testler
+
+"""
+Geçersiz problem tanımlarının toplu çalışmayı durdurmadığını, sadece kendi
+hata sonucunu ürettiğini ve paylaşılan matris dosyasının işçilerde tip
+dönüşümü (kopya) olmadan kullanıldığını doğrular.
+"""
+
+import numpy as np
+
+from core import batch
+from core.batch import solve_batch
+from core.matrix_utils import open_distance_memmap
+from data.coordinates import CAMPUS_STOPS
+
+
+class _RecordingOptimizer(batch.AntColonyOptimizer):
+    """İşçide oluşturulan optimizer'ları (ve okudukları matrisi) kaydeder."""
+    
+    created = []
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created.append(self)
+
+
+def test_invalid_specs_yield_errors_and_valid_specs_are_solved():
+    names = list(CAMPUS_STOPS)
+    params = {'n_ants': 5, 'n_iterations': 5}
+    specs = [
+        {'id': 'gecerli', 'locations': CAMPUS_STOPS, 'start_node': names[2],
+         'params': params, 'seed': 1},
+        {'id': 'bozuk_koordinat', 'locations': {'a': [37.8], 'b': [37.81, 30.5]},
+         'params': params},
+        {'id': 'bilinmeyen_durak', 'locations': CAMPUS_STOPS, 'start_node': 'Yok',
+         'params': params},
+        {'id': 'veri_yok', 'params': params},
+        {'id': 'matris', 'distance_matrix': np.ones((4, 4)) - np.eye(4),
+         'start_node': None, 'params': params, 'seed': 2},
+    ]
+    
+    results = {result['id']: result for result in solve_batch(specs, max_workers=1)}
+    assert set(results) == {spec['id'] for spec in specs}
+    
+    for name in ('bozuk_koordinat', 'bilinmeyen_durak', 'veri_yok'):
+        assert results[name]['path'] is None
+        assert results[name]['error']
+    
+    assert not results['gecerli'].get('error')
+    assert results['gecerli']['route'][0] == names[2]
+    assert sorted(results['matris']['path'][:-1]) == [0, 1, 2, 3]
+
+
+def test_float32_memmap_spec_uses_file_dtype(make_distance_matrix, tmp_path):
+    path = tmp_path / 'matris.npy'
+    np.save(path, make_distance_matrix(12, seed=3).astype(np.float32))
+    memmap = open_distance_memmap(str(path))
+    params = {'n_ants': 4, 'n_iterations': 3}
+    specs = [
+        {'id': 'varsayilan', 'distance_matrix': memmap, 'params': params, 'seed': 1},
+        {'id': 'float32', 'distance_matrix': memmap,
+         'params': dict(params, dtype='float32'), 'seed': 1},
+        {'id': 'uyusmaz', 'distance_matrix': memmap,
+         'params': dict(params, dtype='float64')},
+    ]
+    
+    results = {result['id']: result for result in solve_batch(specs, max_workers=1)}
+    assert results['varsayilan']['distance'] == results['float32']['distance']
+    assert sorted(results['varsayilan']['path'][:-1]) == list(range(12))
+    assert results['uyusmaz']['path'] is None
+    assert 'float32' in results['uyusmaz']['error']
+
+
+def test_worker_reads_shared_file_without_conversion(make_distance_matrix, tmp_path,
+                                                     monkeypatch):
+    path = str(tmp_path / 'matris.npy')
+    np.save(path, make_distance_matrix(10, seed=4).astype(np.float32))
+    monkeypatch.setattr(batch, 'AntColonyOptimizer', _RecordingOptimizer)
+    monkeypatch.setattr(batch, '_MATRICES', {})
+    monkeypatch.setattr(_RecordingOptimizer, 'created', [])
+    
+    task = {'distance_path': path, 'start_node': 0, 'seed': 1,
+            'params': {'n_ants': 4, 'n_iterations': 2, 'dtype': 'float32'}}
+    for _ in range(2):
+        batch._solve_task(task)
+    
+    shared = batch._MATRICES[path]
+    assert isinstance(shared, np.memmap)
+    for optimizer in _RecordingOptimizer.created:
+        assert optimizer.distance_matrix.dtype == np.float32
+        assert np.shares_memory(optimizer.distance_matrix, shared)
@@ -0,0 +1,61 @@
+# 🧪 Komut Satırı Çalıştırıcı - Testler
+
+"""
+Aynı adlı farklı biçimdeki girdilerin (d.csv, d.json) ayrı çıktı dosyalarına
+yazıldığını, aynı çıktıya yazacak girdilerin ve bilinmeyen başlangıç
+durağının argüman hatası olarak reddedildiğini doğrular.
+"""
+
+import json
+
+import pytest
+
+from core.cli import main
+from data.coordinates import CAMPUS_STOPS
+
+
+ARGS = ['--no-cache', '--n-ants', '4', '--n-iterations', '3', '--workers', '1',
+        '--seed', '1']
+
+
+def _write_inputs(directory):
+    stops = dict(list(CAMPUS_STOPS.items())[:6])
+    csv_path = directory / 'd.csv'
+    csv_path.write_text('name,lat,lon\n' + ''.join(
+        f"{name},{lat},{lon}\n" for name, (lat, lon) in stops.items()), encoding='utf-8')
+    json_path = directory / 'd.json'
+    json_path.write_text(json.dumps(dict(list(stops.items())[:4])), encoding='utf-8')
+    return str(csv_path), str(json_path)
+
+
+def test_same_stem_inputs_get_separate_outputs(tmp_path):
+    csv_path, json_path = _write_inputs(tmp_path)
+    output_dir = tmp_path / 'cikti'
+    
+    summary = main([csv_path, json_path, '--output-dir', str(output_dir)] + ARGS)
+    assert [entry['n_stops'] for entry in summary] == [6, 4]
+    assert len({entry['csv'] for entry in summary}) == 2
+    assert (output_dir / 'd_csv_rota.csv').exists()
+    assert (output_dir / 'd_json_rota.kml').exists()
+
+
+def test_colliding_inputs_are_rejected(tmp_path):
+    csv_path, _ = _write_inputs(tmp_path)
+    other = tmp_path / 'diger'
+    other.mkdir()
+    (other / 'd.csv').write_text((tmp_path / 'd.csv').read_text(encoding='utf-8'),
+                                 encoding='utf-8')
+    
+    with pytest.raises(SystemExit):
+        main([csv_path, str(other / 'd.csv'), '--output-dir', str(tmp_path / 'cikti')] + ARGS)
+
+
+def test_unknown_start_stop_is_an_argument_error(tmp_path, capsys):
+    csv_path, _ = _write_inputs(tmp_path)
+    
+    with pytest.raises(SystemExit) as excinfo:
+        main([csv_path, '--start', 'Olmayan Durak', '--output-dir',
+              str(tmp_path / 'cikti')] + ARGS)
+    assert excinfo.value.code == 2
+    assert 'Başlangıç durağı bulunamadı: Olmayan Durak' in capsys.readouterr().err
+    assert not list((tmp_path / 'cikti').glob('*_rota.*'))
@@ -0,0 +1,149 @@
+# 🧪 Toplu Distance Matrix İstekleri - Çevrimdışı Testler
+
+"""
+BatchedDistanceMatrix'i sahte (fake) bir istemci ile ağ bağlantısı olmadan
+sınar: blok sınırları, backoff ile tekrar deneme, QPS sınırı ve alınamayan
+blokların NaN → Haversine yedeğine düşmesi. Haversine ile doldurulmuş
+matrisler 'google_maps' kaynağıyla önbelleğe yazılmaz.
+"""
+
+import numpy as np
+import pytest
+
+from config import GOOGLE_MAPS_CONFIG
+from core.distance_api import BatchedDistanceMatrix
+from core.haversine import haversine_matrix
+from core.matrix_cache import DistanceMatrixCache
+from core.matrix_utils import distance_block_fn, get_distance_matrix
+
+
+def _distance(origin, destination):
+    return int(1e5 * (abs(origin[0] - destination[0]) + abs(origin[1] - destination[1])))
+
+
+class FakeClient:
+    """İstekleri kaydeden, istenirse hata döndüren sahte Distance Matrix istemcisi."""
+    
+    def __init__(self, failures=0, failing_origin=None):
+        self.calls = []
+        self.failures = failures
+        self.failing_origin = failing_origin
+    
+    def distance_matrix(self, origins, destinations, mode, units):
+        self.calls.append((len(origins), len(destinations)))
+        if self.failures > 0:
+            self.failures -= 1
+            raise TimeoutError("geçici hata")
+        if self.failing_origin is not None and self.failing_origin in origins:
+            return {'status': 'OVER_QUERY_LIMIT', 'rows': []}
+        return {
+            'status': 'OK',
+            'rows': [{'elements': [{'status': 'OK', 'distance': {'value': _distance(o, d)}}
+                                   for d in destinations]} for o in origins],
+        }
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (10, 10), (25, 25), (30, 30), (7, 60), (60, 3)])
+def test_tiles_respect_limits_and_cover_matrix(shape):
+    batcher = BatchedDistanceMatrix(None)
+    covered = np.zeros(shape, dtype=int)
+    for rows, cols in batcher.tiles(*shape):
+        n_rows, n_cols = rows.stop - rows.start, cols.stop - cols.start
+        assert n_rows <= 25 and n_cols <= 25 and n_rows * n_cols <= 100
+        covered[rows, cols] += 1
+    assert (covered == 1).all()
+
+
+def test_short_last_row_block_uses_wider_tiles():
+    # 25×4 → 8 istek, kalan 5 satır 5×20 → 2 istek
+    assert len(BatchedDistanceMatrix(None).tiles(30, 30)) == 10
+
+
+def test_fetch_matches_client_distances(make_coordinates):
+    coords = make_coordinates(30)
+    client = FakeClient()
+    batcher = BatchedDistanceMatrix(client, qps=None, sleep=lambda seconds: None)
+    matrix = batcher.fetch(coords, coords)
+    
+    expected = [[_distance(o, d) for d in coords] for o in coords]
+    assert np.array_equal(matrix, expected)
+    assert batcher.n_requests == len(client.calls) == 10
+    assert all(o <= 25 and d <= 25 and o * d <= 100 for o, d in client.calls)
+
+
+def test_retry_uses_exponential_backoff(make_coordinates):
+    sleeps = []
+    client = FakeClient(failures=2)
+    batcher = BatchedDistanceMatrix(client, qps=None, backoff=0.5, sleep=sleeps.append)
+    block = batcher.request(make_coordinates(2), make_coordinates(3, seed=1))
+    
+    assert block.shape == (2, 3) and not np.isnan(block).any()
+    assert sleeps == [0.5, 1.0]
+    assert batcher.n_requests == 3
+
+
+def test_qps_throttle_waits_between_requests(make_coordinates):
+    sleeps = []
+    batcher = BatchedDistanceMatrix(FakeClient(), qps=2, sleep=sleeps.append)
+    coords = make_coordinates(20)
+    batcher.fetch(coords, coords)
+    
+    # 4 istek: ilki beklemez, sonrakiler 1/qps aralığını doldurur
+    assert batcher.n_requests == 4
+    assert len(sleeps) == 3
+    assert all(0 < wait <= 0.5 for wait in sleeps)
+
+
+def test_failed_tiles_become_nan_then_fall_back_to_haversine(make_coordinates):
+    coords = make_coordinates(30)
+    client = FakeClient(failing_origin=tuple(coords[27]))
+    batcher = BatchedDistanceMatrix(client, qps=None, max_retries=1,
+                                    sleep=lambda seconds: None)
+    
+    matrix = batcher.fetch(coords, coords)
+    assert batcher.n_failed_tiles == 2
+    assert np.isnan(matrix[25:]).all() and not np.isnan(matrix[:25]).any()
+    
+    block = distance_block_fn(BatchedDistanceMatrix(client, qps=None, max_retries=1,
+                                                    sleep=lambda seconds: None))(coords, coords)
+    assert not np.isnan(block).any()
+    assert np.allclose(block[25:], haversine_matrix(coords[25:], coords))
+    assert np.array_equal(block[:25], matrix[:25])
+
+
+class PartialClient(FakeClient):
+    """Belirli bir başlangıç için eleman bazında sonuç döndürmeyen sahte istemci."""
+    
+    def __init__(self, missing_origin=None):
+        super().__init__()
+        self.missing_origin = missing_origin
+    
+    def distance_matrix(self, origins, destinations, mode, units):
+        result = super().distance_matrix(origins, destinations, mode, units)
+        for origin, row in zip(origins, result['rows']):
+            if origin == self.missing_origin:
+                for element in row['elements']:
+                    element['status'] = 'ZERO_RESULTS'
+        return result
+
+
+@pytest.mark.parametrize('missing', [False, True])
+def test_partial_google_matrix_is_not_cached(tmp_path, missing, make_coordinates):
+    coords = make_coordinates(8)
+    locations = {f"durak_{i}": list(c) for i, c in enumerate(coords)}
+    client = PartialClient(missing_origin=tuple(coords[5]) if missing else None)
+    cache = DistanceMatrixCache(str(tmp_path))
+    messages = []
+    
+    matrix, _, _ = get_distance_matrix(locations, client=client, cache=cache,
+                                       status_callback=lambda level, message:
+                                       messages.append(level))
+    assert not np.isnan(np.asarray(matrix)).any()
+    cached = cache.get(coords, GOOGLE_MAPS_CONFIG['mode'], GOOGLE_MAPS_CONFIG['units'],
+                       'google_maps')
+    if missing:
+        assert cached is None
+        assert 'warning' in messages
+    else:
+        assert np.array_equal(cached, matrix)
+        assert 'warning' not in messages
@@ -0,0 +1,108 @@
+# 🧪 Artımlı Mesafe Matrisi - Testler
+
+"""
+DistanceMatrix'in durak ekleme / çıkarma / taşıma sonrasında baştan
+hesaplanmış matrisle aynı kaldığını, indekslerin yeniden eşlendiğini ve
+kapasitenin aşılınca büyüdüğünü doğrular.
+"""
+
+import numpy as np
+import pytest
+
+from core.distance_matrix import DistanceMatrix
+from core.haversine import haversine_matrix
+from data.coordinates import CAMPUS_STOPS
+
+
+def _fresh(locations):
+    coords = np.asarray(list(locations.values()), dtype=float)
+    matrix = haversine_matrix(coords, coords)
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+class CountingBlockFn:
+    """Haversine'i çağıran ve istenen blok boyutlarını kaydeden mesafe fonksiyonu."""
+    
+    def __init__(self):
+        self.shapes = []
+    
+    def __call__(self, origins, destinations):
+        self.shapes.append((len(origins), len(destinations)))
+        return haversine_matrix(origins, destinations)
+
+
+def test_remove_stop_remaps_indices():
+    dm = DistanceMatrix(CAMPUS_STOPS)
+    names = list(CAMPUS_STOPS)
+    removed = names[3]
+    
+    assert dm.remove_stop(removed) == 3
+    remaining = {name: CAMPUS_STOPS[name] for name in names if name != removed}
+    assert removed not in dm
+    assert dm.names == list(remaining)
+    assert [dm.index_of(name) for name in remaining] == list(range(len(remaining)))
+    assert np.allclose(dm.matrix, _fresh(remaining))
+    assert np.allclose(dm.coords, list(remaining.values()))
+    with pytest.raises(KeyError):
+        dm.index_of(removed)
+
+
+def test_growth_past_capacity_keeps_existing_distances():
+    block_fn = CountingBlockFn()
+    names = list(CAMPUS_STOPS)
+    dm = DistanceMatrix({names[0]: CAMPUS_STOPS[names[0]]}, block_fn=block_fn, capacity=2)
+    
+    for name in names[1:]:
+        dm.add_stop(name, CAMPUS_STOPS[name])
+    
+    assert len(dm) == len(names)
+    assert dm._matrix.shape[0] >= len(names)
+    assert np.allclose(dm.matrix, _fresh(CAMPUS_STOPS))
+    # Her ekleme sadece yeni satır (1 × n) ve sütunu (n-1 × 1) ister
+    for k, (row, column) in enumerate(zip(block_fn.shapes[1::2], block_fn.shapes[2::2]),
+                                      start=2):
+        assert row == (1, k) and column == (k - 1, 1)
+
+
+def test_remove_then_add_and_move():
+    names = list(CAMPUS_STOPS)
+    dm = DistanceMatrix(CAMPUS_STOPS, capacity=len(names))
+    dm.remove_stop(names[0])
+    dm.add_stop('Geçici Durak', [37.8305, 30.5250])
+    dm.move_stop(names[5], [37.8290, 30.5300])
+    
+    expected = {name: CAMPUS_STOPS[name] for name in names[1:]}
+    expected['Geçici Durak'] = [37.8305, 30.5250]
+    expected[names[5]] = [37.8290, 30.5300]
+    assert dm.locations == expected
+    assert np.allclose(dm.matrix, _fresh(expected))
+    
+    with pytest.raises(ValueError):
+        dm.add_stop('Geçici Durak', [37.0, 30.0])
+
+
+def test_from_matrix_and_to_tuple_round_trip():
+    matrix = _fresh(CAMPUS_STOPS)
+    names = list(CAMPUS_STOPS)
+    coords = np.asarray(list(CAMPUS_STOPS.values()))
+    
+    dm = DistanceMatrix.from_matrix(matrix, names, coords)
+    out_matrix, out_names, out_coords = dm.to_tuple()
+    assert np.array_equal(out_matrix, matrix)
+    assert out_names == names
+    assert np.array_equal(out_coords, coords)
+    
+    out_matrix[0, 1] = -1.0
+    assert dm.matrix[0, 1] == matrix[0, 1]
+
+
+def test_from_matrix_zeroes_diagonal():
+    names = list(CAMPUS_STOPS)
+    coords = np.asarray(list(CAMPUS_STOPS.values()))
+    matrix = _fresh(CAMPUS_STOPS) + 5.0
+    
+    dm = DistanceMatrix.from_matrix(matrix, names, coords)
+    assert np.all(np.diag(dm.matrix) == 0.0)
+    assert dm.matrix[0, 1] == matrix[0, 1]
+    assert matrix[0, 0] == 5.0  # girdi değiştirilmez
@@ -0,0 +1,43 @@
+# 🧪 Haversine Formülü - Testler
+
+"""
+Vektörleştirilmiş ve blok blok hesaplanan mesafe matrisinin skaler
+haversine_distance ile aynı sonucu verdiğini doğrular.
+"""
+
+import numpy as np
+import pytest
+
+from core.haversine import calculate_distance_matrix, haversine_distance, haversine_matrix
+
+
+@pytest.fixture(scope='module')
+def coords(make_coordinates):
+    return make_coordinates(23, seed=8)
+
+
+@pytest.fixture(scope='module')
+def expected(coords):
+    n = len(coords)
+    matrix = np.array([[haversine_distance(coords[i], coords[j]) for j in range(n)]
+                       for i in range(n)])
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+def test_haversine_matrix_matches_scalar(coords, expected):
+    matrix = haversine_matrix(coords[:7], coords)
+    assert matrix.shape == (7, len(coords))
+    np.testing.assert_allclose(matrix, expected[:7], rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize('chunk_size', [None, 5, 23, 100])
+def test_distance_matrix_matches_scalar(coords, expected, chunk_size):
+    locations = {f"durak_{i}": list(c) for i, c in enumerate(coords)}
+    matrix, names, matrix_coords = calculate_distance_matrix(locations, chunk_size=chunk_size)
+    
+    assert names == list(locations)
+    assert np.array_equal(matrix_coords, coords)
+    np.testing.assert_allclose(matrix, expected, rtol=1e-9, atol=1e-6)
+    assert np.all(np.diag(matrix) == 0.0)
+    np.testing.assert_allclose(matrix, matrix.T, rtol=1e-12)
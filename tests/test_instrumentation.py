@@ -0,0 +1,68 @@
+# 🧪 ACO Ölçüm (Instrumentation) - Testler
+
+"""
+SolveStats sayaçlarının ve hook çağrılarının solve() ile tutarlı olduğunu,
+ölçüm kapalıyken hiçbir şey kaydedilmediğini doğrular.
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.instrumentation import PHASES, SolveHook, pheromone_summary
+
+
+@pytest.fixture
+def optimizer(make_distance_matrix):
+    distance_matrix = make_distance_matrix(12, seed=3)
+    return AntColonyOptimizer(distance_matrix, n_ants=4, n_iterations=15, seed=1,
+                              local_search='2opt')
+
+
+class RecordingHook(SolveHook):
+    def __init__(self):
+        self.events = []
+    
+    def on_solve_start(self, optimizer):
+        self.events.append('start')
+    
+    def on_iteration(self, optimizer, record):
+        self.events.append(record['iteration'])
+    
+    def on_solve_end(self, optimizer, stats):
+        self.events.append('end')
+
+
+def test_stats_counters_match_solve(optimizer):
+    _, _, best_distances, _ = optimizer.solve(collect_stats=True)
+    stats = optimizer.stats
+    
+    assert len(stats.iterations) == optimizer.iterations_run == 15
+    assert stats.tours_built == 4 * 15
+    assert stats.improvements == sum(record['improved'] for record in stats.iterations)
+    assert 1 <= stats.improvements <= 15
+    assert [record['iteration_best'] for record in stats.iterations] == best_distances
+    assert stats.iterations[-1]['best_distance'] == optimizer.best_distance
+    
+    summary = stats.summary()
+    assert set(summary['phase_times']) == set(PHASES)
+    assert summary['phase_times']['local_search'] > 0
+    assert sum(summary['phase_share'].values()) <= 1 + 1e-9
+
+
+def test_hooks_are_called_in_order(optimizer):
+    hook = RecordingHook()
+    optimizer.solve(hooks=[hook])
+    assert hook.events == ['start'] + list(range(1, 16)) + ['end']
+    assert optimizer.stats is not None
+
+
+def test_stats_are_off_by_default(optimizer):
+    optimizer.solve()
+    assert optimizer.stats is None
+
+
+def test_pheromone_summary_of_uniform_matrix():
+    summary = pheromone_summary(np.full((5, 5), 0.2))
+    assert summary['pheromone_min'] == summary['pheromone_max'] == 0.2
+    assert summary['pheromone_entropy'] == pytest.approx(1.0)
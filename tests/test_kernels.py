@@ -0,0 +1,81 @@
+# 🧪 Numba Çekirdekleri - Eşdeğerlik Testleri
+
+"""
+backend='numba' ile NumPy vektörel yolunun aynı tohumla aynı sonucu verdiğini
+doğrular. Rastgele sayılar iki yolda aynı sırada çekildiği için turlar birebir,
+uzunluklar ve feromon yuvarlama farkı içinde aynı olmalıdır. Numba kurulu
+ama içe aktarılamıyorsa NumPy yoluna sessizce dönüldüğü de sınanır.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from core import kernels
+from core.ant_algorithm import AntColonyOptimizer
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFIGS = {
+    'duz': {},
+    'aday_listesi': {'n_candidates': 8},
+    'simetrik_birakma': {'symmetric_deposit': True},
+    'aday_simetrik': {'n_candidates': 8, 'symmetric_deposit': True},
+}
+
+
+@pytest.fixture(scope='module')
+def distance_matrix(make_distance_matrix):
+    return make_distance_matrix(40, seed=7)
+
+
+def _solve(distance_matrix, backend, start_node, **params):
+    optimizer = AntColonyOptimizer(distance_matrix, n_ants=12, n_iterations=15, seed=11,
+                                   construction='vectorized', backend=backend, **params)
+    path, distance, best_distances, avg_distances = optimizer.solve(start_node=start_node)
+    return optimizer, path, distance, best_distances, avg_distances
+
+
+requires_numba = pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba kurulu değil")
+
+
+@requires_numba
+@pytest.mark.parametrize('start_node', [0, 5, None])
+@pytest.mark.parametrize('name', list(CONFIGS))
+def test_numba_matches_vectorized(distance_matrix, name, start_node):
+    params = CONFIGS[name]
+    numpy_run = _solve(distance_matrix, 'numpy', start_node, **params)
+    numba_run = _solve(distance_matrix, 'numba', start_node, **params)
+    assert numba_run[0].use_kernels
+    
+    assert list(numba_run[1]) == list(numpy_run[1])
+    assert np.allclose(numba_run[2], numpy_run[2])
+    assert np.allclose(numba_run[3], numpy_run[3])
+    assert np.allclose(numba_run[4], numpy_run[4])
+    assert np.allclose(numba_run[0].pheromone, numpy_run[0].pheromone)
+
+
+def test_numba_is_imported_lazily():
+    # backend='numpy' kullanan içe aktarma numba yüklememeli (başlangıç süresi)
+    code = "import sys, core.ant_algorithm; print('numba' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True, cwd=REPO_ROOT).stdout
+    assert output.strip() == 'False'
+
+
+def test_broken_numba_falls_back_to_numpy(distance_matrix, monkeypatch):
+    # Kurulu görünen ama içe aktarılamayan numba (sys.modules'ta None → ImportError)
+    monkeypatch.setattr(kernels, 'NUMBA_AVAILABLE', True)
+    monkeypatch.setattr(kernels, '_COMPILED', None)
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    
+    numba_run = _solve(distance_matrix, 'numba', 0)
+    numpy_run = _solve(distance_matrix, 'numpy', 0)
+    assert not numba_run[0].use_kernels
+    assert kernels.load() is None
+    assert list(numba_run[1]) == list(numpy_run[1])
+    assert numba_run[2] == numpy_run[2]
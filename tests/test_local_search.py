@@ -0,0 +1,51 @@
+# 🧪 Yerel Arama (2-opt / Or-opt) - Testler
+
+"""
+Minimum iyileşmenin tur uzunluğuna göre ölçeklendiğini ve hamle sayısının
+sınırlı olduğunu doğrular: metre ölçekli mesafelerde ve yüzlerce durakta
+yuvarlama hataları aramayı sonsuz döngüye sokmamalıdır.
+"""
+
+import numpy as np
+import pytest
+
+from core.local_search import improve_tour, or_opt, tour_length, two_opt
+
+
+def _neighbours(distance_matrix):
+    return np.argsort(distance_matrix, axis=1)[:, 1:11]
+
+
+@pytest.mark.parametrize('search', [two_opt, or_opt])
+def test_search_improves_and_keeps_permutation(search, make_distance_matrix):
+    distance_matrix = make_distance_matrix(300, seed=4, scale=50_000.0)
+    neighbours = _neighbours(distance_matrix)
+    tour = list(np.random.default_rng(1).permutation(300))
+    
+    improved = search(tour, distance_matrix, neighbours)
+    assert sorted(improved) == list(range(300))
+    assert improved[0] == tour[0]
+    assert tour_length(improved, distance_matrix) < tour_length(tour, distance_matrix)
+
+
+@pytest.mark.parametrize('search', [two_opt, or_opt])
+def test_move_limit_is_respected(search, make_distance_matrix):
+    distance_matrix = make_distance_matrix(60, seed=2, scale=50_000.0)
+    neighbours = _neighbours(distance_matrix)
+    tour = list(np.random.default_rng(3).permutation(60))
+    
+    one_move = search(tour, distance_matrix, neighbours, max_moves=1)
+    changed = sum(a != b for a, b in zip(one_move, tour))
+    assert 0 < changed < 60
+    assert tour_length(one_move, distance_matrix) < tour_length(tour, distance_matrix)
+
+
+def test_improve_tour_returns_closed_ring(make_distance_matrix):
+    distance_matrix = make_distance_matrix(50, seed=5, scale=50_000.0)
+    neighbours = _neighbours(distance_matrix)
+    path = list(range(50)) + [0]
+    
+    improved, distance = improve_tour(path, distance_matrix, neighbours)
+    assert improved[0] == improved[-1] == 0
+    assert sorted(improved[:-1]) == list(range(50))
+    assert distance == pytest.approx(tour_length(improved[:-1], distance_matrix))
@@ -0,0 +1,110 @@
+# 🧪 Kalıcı Mesafe Matrisi Önbelleği - Testler
+
+"""
+DistanceMatrixCache'in TTL, LRU eviction ve ortak durakların yeniden
+kullanımını (sadece eksik hücrelerin hesaplanmasını) doğrular.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core import matrix_cache
+from core.haversine import haversine_matrix
+from core.matrix_cache import DistanceMatrixCache
+
+
+SETTINGS = ('driving', 'metric', 'haversine')
+
+
+class FakeClock:
+    """Elle ilerletilen saat (time.time yerine)."""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def time(self):
+        return self.now
+    
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class CountingBlock:
+    """haversine_matrix'i sarar ve istenen (başlangıç, varış) çiftlerini sayar."""
+    
+    def __init__(self):
+        self.pairs = []
+    
+    def __call__(self, origins, destinations):
+        self.pairs.extend((tuple(o), tuple(d)) for o in origins for d in destinations)
+        return haversine_matrix(origins, destinations)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(matrix_cache, 'time', SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def coords(make_coordinates):
+    return make_coordinates(10, seed=9)
+
+
+def test_entries_expire_after_ttl(tmp_path, clock, coords):
+    cache = DistanceMatrixCache(str(tmp_path), ttl=60)
+    cache.put(coords, haversine_matrix(coords, coords), *SETTINGS)
+    
+    clock.advance(60)
+    assert cache.get(coords, *SETTINGS) is not None
+    
+    clock.advance(1)
+    assert cache.get(coords, *SETTINGS) is None
+    assert not list(tmp_path.glob('*.npy'))
+    
+    # Süresi dolan kayıt kısmi eşleşme için de kullanılmaz
+    block = CountingBlock()
+    cache.put(coords, haversine_matrix(coords, coords), *SETTINGS)
+    clock.advance(61)
+    cache.compute(coords, block, *SETTINGS)
+    assert len(block.pairs) == len(coords) ** 2
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock, make_coordinates):
+    cache = DistanceMatrixCache(str(tmp_path), ttl=None, max_entries=2)
+    sets = [make_coordinates(4, seed=seed) for seed in range(3)]
+    
+    for points in sets[:2]:
+        cache.put(points, haversine_matrix(points, points), *SETTINGS)
+        clock.advance(1)
+    assert cache.get(sets[0], *SETTINGS) is not None  # ilk kayıt yeniden kullanıldı
+    clock.advance(1)
+    
+    cache.put(sets[2], haversine_matrix(sets[2], sets[2]), *SETTINGS)
+    assert cache.get(sets[0], *SETTINGS) is not None
+    assert cache.get(sets[1], *SETTINGS) is None
+    assert cache.get(sets[2], *SETTINGS) is not None
+    assert len(list(tmp_path.glob('*.coords.npy'))) == 2
+
+
+def test_overlapping_stops_fetch_only_missing_pairs(tmp_path, clock, coords,
+                                                    make_coordinates):
+    cache = DistanceMatrixCache(str(tmp_path))
+    cache.put(coords[:8], haversine_matrix(coords[:8], coords[:8]), *SETTINGS)
+    
+    # Farklı sıra + iki yeni durak
+    new = make_coordinates(2, seed=10)
+    wanted = np.vstack((coords[5:8], new[:1], coords[:5], new[1:]))
+    block = CountingBlock()
+    matrix = cache.compute(wanted, block, *SETTINGS)
+    
+    expected = haversine_matrix(wanted, wanted)
+    np.testing.assert_allclose(matrix, expected, rtol=1e-12)
+    
+    # Sadece yeni duraklara ait satır ve sütunlar istenir: 2×10 + 8×2
+    cached = {tuple(point) for point in coords[:8]}
+    assert len(block.pairs) == len(set(block.pairs)) == 2 * 10 + 8 * 2
+    assert not [pair for pair in block.pairs if pair[0] in cached and pair[1] in cached]
@@ -0,0 +1,119 @@
+# 🧪 Çok Araçlı Ring Seferi - Testler
+
+"""
+MultiVehicleOptimizer'ın genişletilmiş matrisinde (depo ↔ kopya kenarları
+sonsuz) MMAS / ACS başlangıç feromonunun sonlu ve pozitif kaldığını, ringlerin
+kapasite ve uzunluk sınırlarına uyduğunu, her durağın bir kez ziyaret
+edildiğini ve kapasite farkında oluşturmanın ACS kurallarını uyguladığını
+doğrular.
+"""
+
+import numpy as np
+import pytest
+
+from core.matrix_utils import get_distance_matrix
+from core.multi_vehicle import MultiVehicleOptimizer
+from data.coordinates import CAMPUS_STOPS
+
+
+@pytest.fixture(scope='module')
+def distance_matrix():
+    matrix, _, _ = get_distance_matrix(CAMPUS_STOPS)
+    return np.asarray(matrix)
+
+
+@pytest.mark.parametrize('strategy', ['mmas', 'acs'])
+@pytest.mark.parametrize('n_vehicles', [2, 3, 4])
+@pytest.mark.parametrize('depot', [0, 4, 9])
+def test_initial_pheromone_is_finite(distance_matrix, strategy, n_vehicles, depot):
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=n_vehicles, depot=depot,
+                                      strategy=strategy, n_iterations=1)
+    assert np.isfinite(optimizer.tau_init) and optimizer.tau_init > 0
+    if strategy == 'mmas':
+        assert 0 < optimizer.tau_min <= optimizer.tau_max < np.inf
+
+
+@pytest.mark.parametrize('strategy', ['mmas', 'acs'])
+def test_pheromone_stays_positive_after_solve(distance_matrix, strategy):
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=3, objective='longest',
+                                      strategy=strategy, n_iterations=20, seed=1)
+    _, cost, _, _ = optimizer.solve()
+    assert np.isfinite(cost)
+    assert (optimizer.pheromone > 0).all()
+
+
+def _assert_routes_cover_stops(routes, n_stops, depot):
+    assert all(route[0] == route[-1] == depot for route in routes)
+    visited = [node for route in routes for node in route[1:-1]]
+    assert sorted(visited) == sorted(set(range(n_stops)) - {depot})
+
+
+@pytest.mark.parametrize('strategy', ['as', 'mmas', 'acs'])
+@pytest.mark.parametrize('n_candidates', [None, 5])
+def test_routes_respect_capacity(distance_matrix, strategy, n_candidates):
+    n = len(distance_matrix)
+    demands = np.random.default_rng(0).integers(1, 5, n)
+    capacity = demands.sum() / 2.5
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=3, depot=2,
+                                      demands=demands, capacity=capacity,
+                                      strategy=strategy, n_candidates=n_candidates,
+                                      n_ants=10, n_iterations=30, seed=1)
+    routes, _, _, _ = optimizer.solve()
+    
+    _assert_routes_cover_stops(routes, n, depot=2)
+    assert optimizer.feasible
+    for route, load in zip(routes, optimizer.route_loads):
+        assert load == sum(demands[node] for node in route[1:-1] if node != 2)
+        assert load <= capacity
+
+
+@pytest.mark.parametrize('strategy', ['as', 'mmas', 'acs'])
+def test_routes_respect_max_ring_length(distance_matrix, strategy):
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=3, depot=2,
+                                      max_ring_length=6000, strategy=strategy,
+                                      local_search='2opt', n_ants=10, n_iterations=40,
+                                      seed=1)
+    routes, _, _, _ = optimizer.solve()
+    
+    _assert_routes_cover_stops(routes, len(distance_matrix), depot=2)
+    assert optimizer.feasible
+    for route, length in zip(routes, optimizer.route_lengths):
+        assert length == pytest.approx(sum(distance_matrix[a, b]
+                                           for a, b in zip(route[:-1], route[1:])))
+        assert length <= 6000
+
+
+def test_split_and_join_routes_round_trip(distance_matrix):
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=3, depot=4,
+                                      n_ants=5, n_iterations=5, seed=3)
+    optimizer.solve()
+    path = [int(node) for node in optimizer.best_path]
+    
+    # Depo kopyaları birbirinin yerine geçer: birleştirilen tur aynı duraklardan
+    # aynı sırayla geçer, kopyalar sırayla numaralanır
+    routes = optimizer.split_routes(path)
+    joined = optimizer.join_routes(routes)
+    assert len(routes) == 3
+    assert optimizer.node_map[joined].tolist() == optimizer.node_map[path].tolist()
+    assert optimizer.split_routes(joined) == routes
+    _assert_routes_cover_stops(routes, len(distance_matrix), depot=4)
+    
+    # Kullanılmayan araç [D, D] olarak korunur
+    routes = [[4, 0, 1, 4], [4, 4], [4] + [i for i in range(10) if i not in (0, 1, 4)] + [4]]
+    assert optimizer.split_routes(optimizer.join_routes(routes)) == routes
+
+
+def test_capacity_construction_applies_acs_local_update(distance_matrix):
+    optimizer = MultiVehicleOptimizer(distance_matrix, n_vehicles=3, depot=0, capacity=4,
+                                      strategy='acs', q0=0.5, n_ants=4, seed=2)
+    tau0 = optimizer.tau_init
+    optimizer.pheromone.fill(2 * tau0)
+    optimizer._refresh_choice_info()
+    
+    paths, _ = optimizer._build_paths_vectorized(0)
+    used = np.zeros(optimizer.pheromone.shape, dtype=bool)
+    used[paths[:, :-1], paths[:, 1:]] = True
+    
+    assert (optimizer.pheromone[used] < 2 * tau0).all()
+    assert (optimizer.pheromone[used] > tau0).all()
+    assert (optimizer.pheromone[~used] == 2 * tau0).all()
@@ -0,0 +1,102 @@
+# 🧪 Paralel Koloniler (Ada Modeli) - Testler
+
+"""
+IslandColonyOptimizer'ı küçük, tohumlu bir örnekte uçtan uca çalıştırır (göç
+ve birleşik geçmiş) ve bellek eşlemeli matrisin tipinin adalara aynen
+aktarıldığını (süreç başına dönüşüm / kopya olmadığını) doğrular.
+"""
+
+import numpy as np
+import pytest
+
+from core import parallel
+from core.parallel import IslandColonyOptimizer
+from core.matrix_utils import open_distance_memmap
+
+
+def test_islands_migrate_and_merge_histories(make_distance_matrix, monkeypatch):
+    migrations = []
+    migrate = IslandColonyOptimizer._migrate
+    
+    def spy(self, pheromones, results):
+        before = pheromones.copy()
+        incoming = [dict(results[i - 1]) for i in range(self.n_islands)]
+        migrate(self, pheromones, results)
+        migrations.append((before, pheromones.copy(), incoming, results))
+    
+    monkeypatch.setattr(IslandColonyOptimizer, '_migrate', spy)
+    islands = IslandColonyOptimizer(make_distance_matrix(12, seed=6), n_islands=3,
+                                    migration_interval=2, max_workers=2, seed=0,
+                                    n_ants=4, n_iterations=6)
+    path, distance, best_distances, avg_distances = islands.solve(start_node=2)
+    
+    assert path[0] == path[-1] == 2 and sorted(path[:-1]) == list(range(12))
+    assert distance == islands.best_distance == min(
+        h['best_distance'] for h in islands.island_histories
+    )
+    assert islands.stop_reason == 'max_iterations' and islands.iterations_run == 6
+    
+    # Son epoch'tan sonra göç yok; her göçte ada komşusunun turunu alır ve
+    # o tur boyunca feromon bırakır
+    assert len(migrations) == 2
+    for before, after, incoming, results in migrations:
+        for island, migrant in enumerate(incoming):
+            edges = np.asarray(migrant['best_path'])
+            gained = after[island][edges[:-1], edges[1:]] - before[island][edges[:-1], edges[1:]]
+            assert np.all(gained > 0)
+            assert results[island]['best_distance'] <= migrant['best_distance']
+    
+    assert len(islands.island_histories) == 3
+    for history in islands.island_histories:
+        assert set(history) == {'best_path', 'best_distance', 'best_distances',
+                                'avg_distances'}
+        assert len(history['best_distances']) == len(history['avg_distances']) == 6
+    assert len(best_distances) == len(avg_distances) == 6
+    assert best_distances == np.min(
+        [h['best_distances'] for h in islands.island_histories], axis=0
+    ).tolist()
+
+
+@pytest.fixture
+def distance_memmap(make_distance_matrix, tmp_path):
+    path = tmp_path / 'matris.npy'
+    np.save(path, make_distance_matrix(12, seed=5).astype(np.float32))
+    return open_distance_memmap(str(path))
+
+
+def test_memmap_dtype_is_taken_from_file(distance_memmap):
+    islands = IslandColonyOptimizer(distance_memmap, n_islands=2, n_ants=4)
+    assert islands.dtype == np.float32
+    assert islands.aco_params['dtype'] == 'float32'
+    assert islands.distance_path == distance_memmap.filename
+    
+    with pytest.raises(ValueError, match='float32'):
+        IslandColonyOptimizer(distance_memmap, n_islands=2, dtype='float64')
+
+
+def test_island_epoch_reads_memmap_without_conversion(distance_memmap, monkeypatch):
+    islands = IslandColonyOptimizer(distance_memmap, n_islands=1, n_ants=4)
+    monkeypatch.setattr(parallel, '_ISLANDS', {})
+    monkeypatch.setattr(parallel, '_ATTACHED', {})
+    opened = []
+    monkeypatch.setattr(parallel, 'open_distance_memmap',
+                        lambda path: opened.append(open_distance_memmap(path)) or opened[-1])
+    
+    n = islands.n_points
+    shm = parallel.shared_memory.SharedMemory(create=True, size=n * n * 4)
+    try:
+        parallel._run_island_epoch({
+            'distance_name': None, 'distance_path': islands.distance_path,
+            'pheromone_name': shm.name, 'n_points': n, 'n_islands': 1,
+            'dtype': islands.dtype, 'island': 0, 'params': islands.aco_params,
+            'start_node': 0, 'iterations': 2, 'first_epoch': True,
+            'best_path': None, 'best_distance': float('inf'), 'seed': 1,
+        })
+        (optimizer,) = parallel._ISLANDS.values()
+        assert optimizer.distance_matrix.dtype == np.float32
+        assert np.shares_memory(optimizer.distance_matrix, opened[0])
+    finally:
+        for block in parallel._ATTACHED.values():
+            block.close()
+        shm.close()
+        shm.unlink()
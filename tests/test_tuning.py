@@ -0,0 +1,101 @@
+# 🧪 Otomatik Parametre Ayarı - Testler
+
+"""
+Successive halving bileşenlerini doğrular: basamak bütçeleri ve eleme,
+tohumlu örnekleme, warm start ile devam ve en iyi yapılandırmanın seçimi.
+"""
+
+import pytest
+
+from config import ACO_RANGES
+from core import tuning
+from core.tuning import rung_budgets, sample_configurations, tune
+
+
+BASE_PARAMS = {'n_ants': 4, 'construction': 'vectorized'}
+KEYS = ('alpha', 'beta', 'evaporation')
+
+
+@pytest.fixture(scope='module')
+def distance_matrix(make_distance_matrix):
+    return make_distance_matrix(12, seed=7)
+
+
+def test_rung_budgets_grow_by_eta_and_end_at_max():
+    assert rung_budgets(10, 300, 3) == [10, 30, 90, 270, 300]
+    assert rung_budgets(5, 45, 3) == [5, 15, 45]
+    assert rung_budgets(0, 4, 2) == [1, 2, 4]
+    assert rung_budgets(50, 20, 3) == [20]
+
+
+def test_sampling_is_seeded_unique_and_on_the_range_grid():
+    configs = sample_configurations(20, seed=4)
+    assert configs == sample_configurations(20, seed=4)
+    assert configs != sample_configurations(20, seed=5)
+    assert len({tuple(sorted(config.items())) for config in configs}) == 20
+    
+    for config in configs:
+        assert isinstance(config['n_ants'], int)
+        for key, value in config.items():
+            r = ACO_RANGES[key]
+            assert r['min'] <= value <= r['max']
+            steps = (value - r['min']) / r['step']
+            assert steps == pytest.approx(round(steps), abs=1e-6)
+
+
+def test_sampling_stops_at_grid_size():
+    ranges = {'alpha': {'min': 1.0, 'max': 2.0, 'step': 0.5}}
+    configs = sample_configurations(10, ranges, keys=('alpha',), seed=0)
+    assert sorted(config['alpha'] for config in configs) == [1.0, 1.5, 2.0]
+
+
+def test_warm_started_trial_continues_instead_of_restarting(distance_matrix, monkeypatch):
+    monkeypatch.setitem(tuning._WORKER, 'distance_matrix', distance_matrix)
+    
+    def trial(iterations, state):
+        return tuning._run_trial({
+            'params': dict(BASE_PARAMS, alpha=1.0, beta=2.0, evaporation=0.5),
+            'seed': 3, 'iterations': iterations, 'target_distance': None, 'state': state,
+        })
+    
+    first = trial(3, None)
+    second = trial(2, first['state'])
+    full = trial(5, None)
+    assert len(second['best_distances']) == 2
+    assert first['best_distances'] + second['best_distances'] == full['best_distances']
+    assert second['best_distance'] == full['best_distance']
+
+
+def test_tune_halves_rungs_and_returns_lowest_scoring_survivor(distance_matrix):
+    result = tune(distance_matrix, n_configs=9, eta=3, min_iterations=2, max_iterations=6,
+                  seeds=(0, 1), base_params=BASE_PARAMS, keys=KEYS, max_workers=1,
+                  sample_seed=0)
+    
+    history = result['history']
+    assert [rung['iterations'] for rung in history] == [2, 6]
+    assert [len(rung['configs']) for rung in history] == [9, 3]
+    
+    # Hayatta kalanlar ilk basamağın en iyi 1/eta'sıdır
+    first_rung = [entry['config'] for entry in history[0]['configs']]
+    survivors = [entry['config'] for entry in history[1]['configs']]
+    assert sorted(map(str, survivors)) == sorted(map(str, first_rung[:3]))
+    
+    scores = [entry['score'] for entry in history[1]['configs']]
+    assert result['score'] == min(scores) == scores[0]
+    assert result['config'] == survivors[0]
+    assert result['best_params'] == dict(tuning.ACO_PARAMS, **BASE_PARAMS,
+                                         **result['config'], n_iterations=6)
+
+
+def test_tune_survivor_matches_uninterrupted_run(distance_matrix, monkeypatch):
+    result = tune(distance_matrix, n_configs=1, eta=2, min_iterations=2, max_iterations=8,
+                  seeds=(0,), base_params=BASE_PARAMS, keys=KEYS, max_workers=1,
+                  sample_seed=1)
+    assert [rung['iterations'] for rung in result['history']] == [2, 4, 8]
+    
+    monkeypatch.setitem(tuning._WORKER, 'distance_matrix', distance_matrix)
+    full = tuning._run_trial({
+        'params': dict(BASE_PARAMS, **result['config']), 'seed': 0, 'iterations': 8,
+        'target_distance': None, 'state': None,
+    })
+    assert result['best_distance'] == full['best_distance']
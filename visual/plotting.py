@@ -5,9 +5,11 @@ ACO Algoritması sonuçlarının görselleştirilmesi.
 - Yakınsama grafiği (Convergence plot)
 - Rota haritası (Route map)
 - KML dosyası oluşturma
+
+matplotlib sadece grafik fonksiyonları çağrılınca yüklenir; generate_kml
+(örn. core.cli) matplotlib olmadan çalışır.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 
@@ -27,6 +29,8 @@ def plot_convergence(best_distances, avg_distances):
         - Ortalama Mesafe: Tüm karıncaların ortalama mesafesi
         - Aralarındaki alan: Algoritmanın iyileşme potansiyeli
     """
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(figsize=(10, 5))
     
     iterations = range(len(best_distances))
@@ -69,6 +73,8 @@ def plot_route(names, path_indices, coords):
         - Sarı etiketler: Durak isimleri
         - Numaralar: Ziyaret sırası
     """
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Durakları çiz